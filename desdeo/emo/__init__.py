@@ -5,6 +5,7 @@ __all__ = [
     "nsga3",
     "ibea",
     "template1",
+    "template_steady_state",
     "NSGAIII_select",
     "RVEASelector",
     "SimulatedBinaryCrossover",
@@ -12,19 +13,24 @@ __all__ = [
     "LHSGenerator",
     "RandomGenerator",
     "EMOEvaluator",
+    "ParallelEvaluationEnum",
+    "Population",
     "MaxEvaluationsTerminator",
     "MaxGenerationsTerminator",
     "Archive",
+    "ArchiveEvictionEnum",
     "FeasibleArchive",
     "NonDominatedArchive",
+    "StreamingArchive",
 ]
 
-from .hooks.archivers import Archive, FeasibleArchive, NonDominatedArchive
+from .hooks.archivers import Archive, ArchiveEvictionEnum, FeasibleArchive, NonDominatedArchive, StreamingArchive
 from .methods.EAs import nsga3, rvea, ibea
-from .methods.templates import template1
+from .methods.templates import template1, template_steady_state
 from .operators.crossover import SimulatedBinaryCrossover
-from .operators.evaluator import EMOEvaluator
+from .operators.evaluator import EMOEvaluator, ParallelEvaluationEnum
 from .operators.generator import LHSGenerator, RandomGenerator
 from .operators.mutation import BoundedPolynomialMutation
+from .operators.population import Population
 from .operators.selection import NSGAIII_select, RVEASelector
 from .operators.termination import MaxEvaluationsTerminator, MaxGenerationsTerminator
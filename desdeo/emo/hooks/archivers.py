@@ -1,7 +1,10 @@
 """A collection of archivers for storing solutions evaluated during evolution."""
 
 from collections.abc import Sequence
+from enum import Enum
+from pathlib import Path
 
+import numpy as np
 import polars as pl
 
 from desdeo.problem import Problem
@@ -13,10 +16,111 @@ from desdeo.tools.message import (
     SelectorMessageTopics,
     TerminatorMessageTopics,
 )
-from desdeo.tools.non_dominated_sorting import non_dominated, non_dominated_merge
+from desdeo.tools.non_dominated_sorting import NonDominatedIndex, non_dominated_ranks
 from desdeo.tools.patterns import Publisher, Subscriber
 
 
+class ArchiveEvictionEnum(str, Enum):
+    """Defines the ways of evicting solutions from an archive that has reached its maximum size."""
+
+    fifo = "fifo"
+    """Evict the oldest solutions first."""
+    non_dominated = "non_dominated"
+    """Evict the solutions in the worst non-dominated fronts first, and the oldest solutions within a front."""
+
+
+class ArchiveStore:
+    """Growable storage for the rows of an archive.
+
+    The rows are stored as a list of polars dataframes, each holding contiguous Arrow buffers. A new chunk is merged
+    with the previous one when it has grown at least as large, so the chunk sizes double and each row is copied
+    O(log n) times in total, instead of copying the whole history on every append. The chunks are exported to polars
+    without copying them. The store can optionally be capped to a maximum number of rows.
+    """
+
+    non_dominated_low_water = 0.9
+    """The fraction of `max_size` the non-dominated eviction evicts down to, so that the rows are sorted rarely."""
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        eviction: ArchiveEvictionEnum = ArchiveEvictionEnum.fifo,
+        targets: list[str] | None = None,
+    ):
+        """Initialize an empty store.
+
+        Args:
+            max_size (int | None, optional): The maximum number of rows kept in the store. If None, the store is not
+                capped. Defaults to None.
+            eviction (ArchiveEvictionEnum, optional): How rows are evicted once there are more than `max_size` of
+                them. The fifo eviction keeps exactly `max_size` rows, while the non-dominated eviction evicts down to
+                `non_dominated_low_water` times `max_size` rows. Defaults to `ArchiveEvictionEnum.fifo`.
+            targets (list[str] | None, optional): The columns the non-dominated eviction compares. Required when
+                `eviction` is `ArchiveEvictionEnum.non_dominated`. Defaults to None.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be a positive integer or None.")
+        if eviction == ArchiveEvictionEnum.non_dominated and targets is None:
+            raise ValueError("The targets must be given for non-dominated eviction.")
+        self.max_size = max_size
+        self.eviction = ArchiveEvictionEnum(eviction)
+        self.targets = targets
+        self._chunks: list[pl.DataFrame] = []
+        self._height = 0
+        self._frame: pl.DataFrame | None = None
+
+    def __len__(self) -> int:
+        """Return the number of rows in the store."""
+        return self._height
+
+    def append(self, data: pl.DataFrame) -> None:
+        """Append rows to the store, evicting rows if the store grows over its maximum size.
+
+        Args:
+            data (pl.DataFrame): The rows to append.
+        """
+        self._chunks.append(data)
+        self._height += len(data)
+        while len(self._chunks) > 1 and len(self._chunks[-1]) >= len(self._chunks[-2]):
+            last = self._chunks.pop()
+            self._chunks[-1] = pl.concat([self._chunks[-1], last], how="vertical", rechunk=True)
+        self._frame = None
+        if self.max_size is not None and self._height > self.max_size:
+            if self.eviction == ArchiveEvictionEnum.non_dominated:
+                # Sorting the rows into fronts is costly, so room is made for several appends at once
+                self._evict(self._height - max(1, int(self.max_size * self.non_dominated_low_water)))
+            else:
+                self._evict(self._height - self.max_size)
+
+    def _evict(self, n_rows: int) -> None:
+        """Evict rows from the store according to the eviction strategy."""
+        if self.eviction == ArchiveEvictionEnum.fifo:
+            while n_rows >= len(self._chunks[0]):
+                n_rows -= len(self._chunks[0])
+                self._height -= len(self._chunks.pop(0))
+            self._chunks[0] = self._chunks[0].slice(n_rows)
+            self._height -= n_rows
+            return
+
+        frame = self.to_polars()
+        ranks = non_dominated_ranks(frame[self.targets].to_numpy())
+        # The rows sorted from the worst front to the best, and from the oldest to the newest within a front
+        order = np.lexsort((np.arange(len(ranks)), -ranks))
+        keep = np.ones(len(ranks), dtype=np.bool_)
+        keep[order[:n_rows]] = False
+        self._chunks = [frame.filter(keep)]
+        self._height = len(self._chunks[0])
+        self._frame = None
+
+    def to_polars(self) -> pl.DataFrame | None:
+        """Return the rows of the store as a polars dataframe, or None if the store is empty."""
+        if not self._chunks:
+            return None
+        if self._frame is None:
+            self._frame = pl.concat(self._chunks, how="vertical", rechunk=False)
+        return self._frame
+
+
 class BaseArchive(Subscriber):
     """Base class for archivers."""
 
@@ -35,19 +139,62 @@ class BaseArchive(Subscriber):
         """Return the topics provided by the archiver."""
         return {0: []}
 
-    def __init__(self, *, problem: Problem, publisher: Publisher):
+    def __init__(
+        self,
+        *,
+        problem: Problem,
+        publisher: Publisher,
+        max_size: int | None = None,
+        eviction: ArchiveEvictionEnum = ArchiveEvictionEnum.fifo,
+    ):
         """Initialize the base archiver.
 
         Args:
             problem (Problem): The problem being solved.
             publisher (Publisher): The publisher object.
+            max_size (int | None, optional): The maximum number of rows kept of both the solutions and the
+                selections. If None, the archive grows without a limit. Defaults to None.
+            eviction (ArchiveEvictionEnum, optional): How rows are evicted once there are more than `max_size`.
+                Defaults to `ArchiveEvictionEnum.fifo`.
         """
         super().__init__(publisher, verbosity=0)
+        self.problem = problem
+        self.max_size = max_size
+        self.eviction = ArchiveEvictionEnum(eviction)
         self.solutions: pl.DataFrame = None
         self.selections: pl.DataFrame = None
-        self.problem = problem
         self.generation_number = 1
 
+    def _new_store(self) -> ArchiveStore:
+        """Return an empty store with the size limit of the archive."""
+        return ArchiveStore(
+            max_size=self.max_size,
+            eviction=self.eviction,
+            targets=[f"{x.symbol}_min" for x in self.problem.objectives],
+        )
+
+    @property
+    def solutions(self) -> pl.DataFrame | None:
+        """The archived solutions, or None if nothing has been archived."""
+        return self._solutions_store.to_polars()
+
+    @solutions.setter
+    def solutions(self, value: pl.DataFrame | None) -> None:
+        self._solutions_store = self._new_store()
+        if value is not None:
+            self._solutions_store.append(value)
+
+    @property
+    def selections(self) -> pl.DataFrame | None:
+        """The archived outputs of the selections, or None if nothing has been archived."""
+        return self._selections_store.to_polars()
+
+    @selections.setter
+    def selections(self, value: pl.DataFrame | None) -> None:
+        self._selections_store = self._new_store()
+        if value is not None:
+            self._selections_store.append(value)
+
     def state(self) -> Sequence[Message]:
         """Return the state of the archiver."""
         return []
@@ -66,24 +213,32 @@ class BaseArchive(Subscriber):
         if message.topic == SelectorMessageTopics.SELECTED_VERBOSE_OUTPUTS:
             data: pl.DataFrame = message.value
             data = data.with_columns(generation=self.generation_number)
-            if self.selections is None:
-                self.selections = data
-            else:
-                self.selections = pl.concat([self.selections, data], how="vertical")
+            self._selections_store.append(data)
             return
 
 
 class FeasibleArchive(BaseArchive):
     """An archiver that stores all feasible solutions evaluated during evolution."""
 
-    def __init__(self, *, problem: Problem, publisher: Publisher):
+    def __init__(
+        self,
+        *,
+        problem: Problem,
+        publisher: Publisher,
+        max_size: int | None = None,
+        eviction: ArchiveEvictionEnum = ArchiveEvictionEnum.fifo,
+    ):
         """Initialize the archiver.
 
         Args:
             problem (Problem): The problem being solved.
             publisher (Publisher): The publisher object.
+            max_size (int | None, optional): The maximum number of rows kept of both the solutions and the
+                selections. If None, the archive grows without a limit. Defaults to None.
+            eviction (ArchiveEvictionEnum, optional): How rows are evicted once there are more than `max_size`.
+                Defaults to `ArchiveEvictionEnum.fifo`.
         """
-        super().__init__(problem=problem, publisher=publisher)
+        super().__init__(problem=problem, publisher=publisher, max_size=max_size, eviction=eviction)
 
         if problem.constraints is None:
             raise ValueError("The problem has no constraints.")
@@ -104,11 +259,8 @@ class FeasibleArchive(BaseArchive):
         data = message.value
         feasible_mask = (data[self.cons_symb] <= 0).to_numpy().all(axis=1)
         feasible_data = data.filter(feasible_mask)
-        feasible_data = data.with_columns(generation=self.generation_number)
-        if self.solutions is None:
-            self.solutions = feasible_data
-        else:
-            self.solutions = pl.concat([self.solutions, feasible_data])
+        feasible_data = feasible_data.with_columns(generation=self.generation_number)
+        self._solutions_store.append(feasible_data)
 
 
 class Archive(BaseArchive):
@@ -128,14 +280,19 @@ class Archive(BaseArchive):
             return
         data = message.value
         data = data.with_columns(generation=self.generation_number)
-        if self.solutions is None:
-            self.solutions = data
-        else:
-            self.solutions = pl.concat([self.solutions, data])
+        self._solutions_store.append(data)
 
 
 class NonDominatedArchive(Archive):
-    """An archiver that stores only the non-dominated solutions evaluated during evolution."""
+    """An archiver that stores only the non-dominated solutions evaluated during evolution.
+
+    The targets of the archived solutions are kept in a
+    :py:class:`desdeo.tools.non_dominated_sorting.NonDominatedIndex`, which answers the dominance checks of the new
+    solutions without comparing them to the whole archive. The rows of the archived solutions are stored as they
+    arrive, and the `solutions` dataframe is only built when it is read. The rows of the removed solutions are
+    dropped once there are more of them than archived solutions, so the memory used by the archive stays
+    proportional to the size of the non-dominated front.
+    """
 
     def __init__(self, *, problem: Problem, publisher: Publisher):
         """Initialize the archiver.
@@ -144,8 +301,43 @@ class NonDominatedArchive(Archive):
             problem (Problem): The problem being solved.
             publisher (Publisher): The publisher object.
         """
-        super().__init__(problem=problem, publisher=publisher)
         self.targets = [f"{x.symbol}_min" for x in problem.objectives]
+        super().__init__(problem=problem, publisher=publisher)
+
+    @property
+    def solutions(self) -> pl.DataFrame | None:
+        """The non-dominated solutions in the order they were archived, or None if nothing has been archived."""
+        if len(self._index) == 0:
+            return None
+        if self._solutions is None:
+            self._compact()
+        return self._solutions
+
+    @solutions.setter
+    def solutions(self, value: pl.DataFrame | None) -> None:
+        self._index = NonDominatedIndex(len(self.targets))
+        # The rows of the solutions inserted to the index, in the order of their slots
+        self._frames: list[pl.DataFrame] = []
+        self._solutions: pl.DataFrame | None = None
+        if value is not None:
+            self._insert(value)
+
+    def _compact(self) -> None:
+        """Drop the rows of the removed solutions, and build the `solutions` dataframe."""
+        rows = self._frames[0] if len(self._frames) == 1 else pl.concat(self._frames)
+        # The slots of the index match the rows, until the removed solutions are dropped from both
+        self._solutions = rows[self._index.compact()]
+        self._frames = [self._solutions]
+
+    def _insert(self, data: pl.DataFrame) -> None:
+        """Add the solutions that are not dominated by the archive, and remove the solutions they dominate."""
+        slots = self._index.insert(data[self.targets].to_numpy())
+        inserted = slots != -1
+        if inserted.any():
+            self._frames.append(data.filter(inserted))
+            self._solutions = None
+            if self._index.n_removed > len(self._index):
+                self._compact()
 
     def update(self, message: Message) -> None:
         """Update the archiver with the new data.
@@ -163,10 +355,190 @@ class NonDominatedArchive(Archive):
         data = data.with_columns(generation=self.generation_number)
         if type(data) is not pl.DataFrame:
             raise ValueError("Data should be a polars DataFrame")
-        if self.solutions is None:
-            non_dom_mask = non_dominated(data[self.targets].to_numpy())
-            self.solutions = data.filter(non_dom_mask)
-        else:
-            to_add = data.filter(non_dominated(data[self.targets].to_numpy()))
-            mask1, mask2 = non_dominated_merge(self.solutions[self.targets].to_numpy(), to_add[self.targets].to_numpy())
-            self.solutions = pl.concat([self.solutions.filter(mask1), to_add.filter(mask2)])
+        self._insert(data)
+
+
+class StreamingFormatEnum(str, Enum):
+    """Defines the file formats supported by the streaming archive."""
+
+    parquet = "parquet"
+    """Apache Parquet files, compressed and best suited for analysis."""
+    ipc = "ipc"
+    """Arrow IPC (Feather v2) files, fastest to write and read."""
+
+
+def scan_archive(
+    path: str | Path, file_format: StreamingFormatEnum = StreamingFormatEnum.parquet, dataset: str = "solutions"
+) -> pl.LazyFrame:
+    """Lazily scan a dataset written by a `StreamingArchive`.
+
+    The rows are not loaded into memory until the returned lazy frame is collected, so filters and projections, e.g.,
+    selecting the targets of some generations for computing indicators, are pushed down to the files.
+
+    Args:
+        path (str | Path): The directory of the streaming archive.
+        file_format (StreamingFormatEnum, optional): The format of the files. Defaults to
+            `StreamingFormatEnum.parquet`.
+        dataset (str, optional): Either "solutions" or "selections". Defaults to "solutions".
+
+    Returns:
+        pl.LazyFrame: The rows of the dataset, with the generation read from the partitions as the `generation` column.
+    """
+    source = Path(path) / dataset / "**" / f"*.{file_format.value}"
+    if file_format == StreamingFormatEnum.parquet:
+        return pl.scan_parquet(source, hive_partitioning=True)
+    return pl.scan_ipc(source, hive_partitioning=True)
+
+
+class StreamingArchive(BaseArchive):
+    """An archiver that streams the solutions and selections evaluated during evolution to files on disk.
+
+    The rows are buffered in memory, and written to a dataset partitioned by generation
+    (`<path>/solutions/generation=<n>/part-<k>.<format>`, and likewise for the selections) whenever the generation
+    changes or more than `buffer_size` rows have been buffered. The memory used by the archive is therefore bounded
+    regardless of the length of the run. Use `scan` to query the archive lazily.
+
+    The rows still buffered are written when the terminator reports that the run has ended, when `close` is called,
+    e.g., by using the archive as a context manager, or when the archive is garbage collected. Only then is the whole
+    run visible to `scan_archive`.
+    """
+
+    def __init__(
+        self,
+        *,
+        problem: Problem,
+        publisher: Publisher,
+        path: str | Path,
+        file_format: StreamingFormatEnum = StreamingFormatEnum.parquet,
+        buffer_size: int = 100_000,
+    ):
+        """Initialize the archiver.
+
+        Args:
+            problem (Problem): The problem being solved.
+            publisher (Publisher): The publisher object.
+            path (str | Path): The directory to write the archive to. It must be empty or not exist.
+            file_format (StreamingFormatEnum, optional): The format of the files. Defaults to
+                `StreamingFormatEnum.parquet`.
+            buffer_size (int, optional): The maximum number of rows buffered in memory before they are written.
+                Defaults to 100 000.
+        """
+        self.path = Path(path)
+        if self.path.exists() and any(self.path.iterdir()):
+            raise ValueError(f"The archive directory {self.path} is not empty.")
+        self.file_format = StreamingFormatEnum(file_format)
+        self.buffer_size = buffer_size
+        self._buffers: dict[str, list[tuple[int, pl.DataFrame]]] = {"solutions": [], "selections": []}
+        self._buffered_rows = 0
+        self._n_parts = 0
+        super().__init__(problem=problem, publisher=publisher)
+
+    @property
+    def interested_topics(self) -> Sequence[MessageTopics]:
+        """Return the message topics that the archiver is interested in."""
+        return [*super().interested_topics, TerminatorMessageTopics.TERMINATION]
+
+    def update(self, message: Message) -> None:
+        """Update the archiver with the new data.
+
+        Args:
+            message (Message): Message from the publisher.
+        """
+        if message.topic == TerminatorMessageTopics.TERMINATION:
+            if message.value:
+                self.close()
+            return
+        if message.topic == TerminatorMessageTopics.GENERATION:
+            if message.value != self.generation_number:
+                self.flush()
+            super().update(message)
+            return
+        dataset = "selections" if message.topic == SelectorMessageTopics.SELECTED_VERBOSE_OUTPUTS else "solutions"
+        data: pl.DataFrame = message.value
+        self._buffers[dataset].append((self.generation_number, data))
+        self._buffered_rows += len(data)
+        if self._buffered_rows >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows to disk."""
+        for dataset, buffer in self._buffers.items():
+            generations: dict[int, list[pl.DataFrame]] = {}
+            for generation, data in buffer:
+                generations.setdefault(generation, []).append(data)
+            for generation, frames in generations.items():
+                partition = self.path / dataset / f"generation={generation}"
+                partition.mkdir(parents=True, exist_ok=True)
+                data = pl.concat(frames, how="vertical")
+                file = partition / f"part-{self._n_parts:06d}.{self.file_format.value}"
+                if self.file_format == StreamingFormatEnum.parquet:
+                    data.write_parquet(file)
+                else:
+                    data.write_ipc(file)
+                self._n_parts += 1
+            buffer.clear()
+        self._buffered_rows = 0
+
+    def close(self) -> None:
+        """Write the buffered rows to disk, e.g., at the end of the run.
+
+        The archive can still be updated after it is closed.
+        """
+        self.flush()
+
+    def __enter__(self) -> "StreamingArchive":
+        """Use the archive as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the archive."""
+        self.close()
+
+    def __del__(self):
+        """Write the buffered rows to disk when the archive is garbage collected."""
+        if getattr(self, "_buffered_rows", 0) > 0:
+            self.flush()
+
+    def scan(self, dataset: str = "solutions") -> pl.LazyFrame:
+        """Flush the buffered rows and lazily scan the archive.
+
+        Args:
+            dataset (str, optional): Either "solutions" or "selections". Defaults to "solutions".
+
+        Returns:
+            pl.LazyFrame: The rows of the dataset, with the generation as the `generation` column.
+        """
+        self.flush()
+        if not (self.path / dataset).exists():
+            return pl.LazyFrame()
+        return scan_archive(self.path, self.file_format, dataset)
+
+    @property
+    def solutions(self) -> pl.DataFrame | None:
+        """All the archived solutions loaded into memory, or None if nothing has been archived.
+
+        Prefer `scan` for archives that do not fit in memory.
+        """
+        if not self._buffers["solutions"] and not (self.path / "solutions").exists():
+            return None
+        return self.scan("solutions").collect()
+
+    @solutions.setter
+    def solutions(self, value: pl.DataFrame | None) -> None:
+        if value is not None:
+            raise ValueError("The solutions of a streaming archive cannot be replaced.")
+
+    @property
+    def selections(self) -> pl.DataFrame | None:
+        """All the archived selections loaded into memory, or None if nothing has been archived.
+
+        Prefer `scan` for archives that do not fit in memory.
+        """
+        if not self._buffers["selections"] and not (self.path / "selections").exists():
+            return None
+        return self.scan("selections").collect()
+
+    @selections.setter
+    def selections(self, value: pl.DataFrame | None) -> None:
+        if value is not None:
+            raise ValueError("The selections of a streaming archive cannot be replaced.")
@@ -3,8 +3,11 @@
 This can be used as a template for the implementation of the EMO methods.
 """
 
+import asyncio
 from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 
+import numpy as np
 import polars as pl
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -12,6 +15,7 @@ from desdeo.emo.operators.crossover import BaseCrossover
 from desdeo.emo.operators.evaluator import EMOEvaluator
 from desdeo.emo.operators.generator import BaseGenerator
 from desdeo.emo.operators.mutation import BaseMutation
+from desdeo.emo.operators.population import Population
 from desdeo.emo.operators.scalar_selection import BaseScalarSelector
 from desdeo.emo.operators.selection import BaseSelector
 from desdeo.emo.operators.termination import BaseTerminator
@@ -54,17 +58,18 @@ def template1(
     Returns:
         EMOResult: The final population and their objective vectors, constraint vectors, and targets
     """
-    solutions, outputs = generator.do()
+    # The population is kept as contiguous arrays between the operators, polars views are only created when needed
+    population = Population.from_polars(*generator.do())
 
     while not terminator.check():
-        offspring = crossover.do(population=solutions)
-        offspring = mutation.do(offspring, solutions)
+        offspring = crossover.do_population(population)
+        offspring = mutation.do_population(offspring, population)
         # Repair offspring if they go out of bounds
-        offspring = repair(offspring)
-        offspring_outputs = evaluator.evaluate(offspring)
-        solutions, outputs = selection.do(parents=(solutions, outputs), offsprings=(offspring, offspring_outputs))
+        offspring = Population.from_polars(repair(offspring.solutions_view()))
+        offspring = evaluator.evaluate_population(offspring)
+        population = selection.do_population(parents=population, offsprings=offspring)
 
-    return EMOResult(solutions=solutions, outputs=outputs)
+    return EMOResult(solutions=population.solutions_view(), outputs=population.outputs_view())
 
 
 def template2(
@@ -119,3 +124,139 @@ def template2(
         offspring_outputs = evaluator.evaluate(offspring)
 
     return EMOResult(solutions=solutions, outputs=outputs)
+
+
+async def template_steady_state_async(
+    evaluator: EMOEvaluator,
+    crossover: BaseCrossover,
+    mutation: BaseMutation,
+    generator: BaseGenerator,
+    selection: BaseSelector,
+    terminator: BaseTerminator,
+    repair: Callable[[pl.DataFrame], pl.DataFrame] = lambda x: x,  # Default to identity function if no repair is needed
+    max_in_flight: int = 4,
+    batch_size: int = 1,
+    executor: Executor | None = None,
+    seed: int = 0,
+) -> EMOResult:
+    """Implements an asynchronous steady-state template, which overlaps the evaluations of the offspring.
+
+    Unlike in `template1`, the loop does not wait for a whole generation of offspring to be evaluated before selection.
+    Instead, `max_in_flight` evaluations of `batch_size` offspring are kept running at all times. As soon as an
+    evaluation finishes, the evaluated offspring are inserted into the population with the selection operator, and a
+    new evaluation is started with offspring created from the updated population. Only the `batch_size` offspring of
+    the new evaluation are created, from parents drawn at random from the population, so every evaluation sees all the
+    insertions before it. This keeps the workers busy when the time taken by the evaluations varies a lot, e.g., when
+    the problem is evaluated with simulators.
+
+    Each insertion counts as one generation for the terminator. When the terminator is triggered, the evaluations still
+    in flight are discarded. Because the offspring are inserted in the order their evaluations finish, the results are
+    not reproducible between runs, even with seeded operators, unless `max_in_flight` is 1.
+
+    Args:
+        evaluator (EMOEvaluator): A class that evaluates the solutions and provides the objective vectors, constraint
+            vectors, and targets.
+        crossover (BaseCrossover): The crossover operator.
+        mutation (BaseMutation): The mutation operator.
+        generator (BaseGenerator): A class that generates the initial population.
+        selection (BaseSelector): The selection operator.
+        terminator (BaseTerminator): The termination operator.
+        repair (Callable, optional): A function that repairs the offspring if they go out of bounds. Defaults to an
+            identity function, meaning no repair is done. See :py:func:`desdeo.tools.utils.repair` as an example of a
+            repair function.
+        max_in_flight (int, optional): The number of evaluations kept running at the same time. Defaults to 4.
+        batch_size (int, optional): The number of offspring evaluated in each evaluation. Defaults to 1.
+        executor (Executor | None, optional): The executor the evaluations are run in. If None, a thread pool with
+            `max_in_flight` workers is created for the duration of the run. Defaults to None.
+        seed (int, optional): The seed of the random choice of the parents of each batch. Defaults to 0.
+
+    Returns:
+        EMOResult: The final population and their objective vectors, constraint vectors, and targets
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be a positive integer.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+
+    solutions, outputs = generator.do()
+    rng = np.random.default_rng(seed)
+    # The crossover operators mate the parents in pairs
+    n_parents = batch_size + batch_size % 2
+
+    def next_batch() -> pl.DataFrame:
+        # The parents are drawn from the current population, including the offspring inserted so far
+        to_mate = rng.choice(len(solutions), size=n_parents, replace=len(solutions) < n_parents).tolist()
+        offspring = crossover.do(population=solutions, to_mate=to_mate)
+        offspring = mutation.do(offspring, solutions)
+        # Repair offspring if they go out of bounds
+        return repair(offspring).head(batch_size)
+
+    async def evaluate(batch: pl.DataFrame) -> tuple[pl.DataFrame, pl.DataFrame]:
+        return batch, await evaluator.evaluate_async(batch, executor=executor)
+
+    in_flight: set[asyncio.Task] = set()
+    try:
+        # As in template1, the terminator is checked once before any offspring are created
+        terminated = terminator.check()
+        while not terminated:
+            while len(in_flight) < max_in_flight:
+                in_flight.add(asyncio.create_task(evaluate(next_batch())))
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                offspring, offspring_outputs = task.result()
+                solutions, outputs = selection.do(
+                    parents=(solutions, outputs), offsprings=(offspring, offspring_outputs)
+                )
+                if terminator.check():
+                    terminated = True
+                    break
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return EMOResult(solutions=solutions, outputs=outputs)
+
+
+def template_steady_state(
+    evaluator: EMOEvaluator,
+    crossover: BaseCrossover,
+    mutation: BaseMutation,
+    generator: BaseGenerator,
+    selection: BaseSelector,
+    terminator: BaseTerminator,
+    repair: Callable[[pl.DataFrame], pl.DataFrame] = lambda x: x,  # Default to identity function if no repair is needed
+    max_in_flight: int = 4,
+    batch_size: int = 1,
+    executor: Executor | None = None,
+    seed: int = 0,
+) -> EMOResult:
+    """Runs `template_steady_state_async` in a new event loop and returns its result.
+
+    Use `template_steady_state_async` directly if an event loop is already running. See its documentation for
+    the details and the arguments.
+
+    Returns:
+        EMOResult: The final population and their objective vectors, constraint vectors, and targets
+    """
+    return asyncio.run(
+        template_steady_state_async(
+            evaluator=evaluator,
+            crossover=crossover,
+            mutation=mutation,
+            generator=generator,
+            selection=selection,
+            terminator=terminator,
+            repair=repair,
+            max_in_flight=max_in_flight,
+            batch_size=batch_size,
+            executor=executor,
+            seed=seed,
+        )
+    )
@@ -11,6 +11,7 @@ from collections.abc import Sequence
 import numpy as np
 import polars as pl
 
+from desdeo.emo.operators.population import Population
 from desdeo.problem import Problem, VariableDomainTypeEnum
 from desdeo.tools.message import (
     CrossoverMessageTopics,
@@ -50,6 +51,23 @@ class BaseCrossover(Subscriber):
             pl.DataFrame: the offspring resulting from the crossover.
         """
 
+    def do_population(self, population: Population, to_mate: list[int] | None = None) -> Population:
+        """Perform the crossover operation on a population.
+
+        By default, the crossover is done with `do` on a polars view of the population. Subclasses may override
+        this to operate on the arrays of the population directly.
+
+        Args:
+            population (Population): the population to perform the crossover with.
+            to_mate (list[int] | None): the indices of the population members that should
+                participate in the crossover. If `None`, the whole population is subject
+                to the crossover.
+
+        Returns:
+            Population: the offspring resulting from the crossover, without outputs.
+        """
+        return Population.from_polars(self.do(population=population.solutions_view(), to_mate=to_mate))
+
 
 class SimulatedBinaryCrossover(BaseCrossover):
     """A class for creating a simulated binary crossover operator.
@@ -152,21 +170,21 @@ class SimulatedBinaryCrossover(BaseCrossover):
             mating_pop = np.vstack((mating_pop, mating_pop[0]))
             mate_size += 1
 
-        offspring = np.zeros_like(mating_pop)
+        # The random numbers of all the mating pairs are drawn at once
+        miu = self.rng.random((mate_size // 2, num_var))
+        signs = (-1) ** self.rng.integers(low=0, high=2, size=(mate_size // 2, num_var))
+        no_xover = self.rng.random((mate_size // 2, num_var)) > self.xover_probability
 
         HALF = 0.5  # NOQA: N806
-        # TODO(@light-weaver): Extract into a numba jitted function.
-        for i in range(0, mate_size, 2):
-            beta = np.zeros(num_var)
-            miu = self.rng.random(num_var)
-            beta[miu <= HALF] = (2 * miu[miu <= HALF]) ** (1 / (self.xover_distribution + 1))
-            beta[miu > HALF] = (2 - 2 * miu[miu > HALF]) ** (-1 / (self.xover_distribution + 1))
-            beta = beta * ((-1) ** self.rng.integers(low=0, high=2, size=num_var))
-            beta[self.rng.random(num_var) > self.xover_probability] = 1
-            avg = (mating_pop[i] + mating_pop[i + 1]) / 2
-            diff = (mating_pop[i] - mating_pop[i + 1]) / 2
-            offspring[i] = avg + beta * diff
-            offspring[i + 1] = avg - beta * diff
+        exponent = 1 / (self.xover_distribution + 1)
+        beta = np.where(miu <= HALF, 2 * miu, 1 / (2 - 2 * miu)) ** exponent
+        beta = np.where(no_xover, 1.0, beta * signs)
+
+        avg = (mating_pop[0::2] + mating_pop[1::2]) / 2
+        diff = (mating_pop[0::2] - mating_pop[1::2]) / 2
+        offspring = np.empty_like(mating_pop, dtype=float, order="F")
+        offspring[0::2] = avg + beta * diff
+        offspring[1::2] = avg - beta * diff
 
         self.offspring_population = pl.from_numpy(offspring, schema=self.variable_symbols)
         self.notify()
@@ -1041,15 +1059,12 @@ class LocalCrossover(BaseCrossover):
 
         offspring = np.empty((mating_pop_size, num_var))
 
-        for i in range(mating_pop_size // 2):
-            if self.rng.random() < self.xover_probability:
-                alpha = self.rng.random(num_var)
+        xover = self.rng.random((mating_pop_size // 2, 1)) < self.xover_probability
+        # Pairs that are not crossed over keep their parents, i.e., alpha is 1 for them
+        alpha = np.where(xover, self.rng.random((mating_pop_size // 2, num_var)), 1.0)
 
-                offspring[2 * i] = alpha * parents1[i] + (1 - alpha) * parents2[i]
-                offspring[2 * i + 1] = (1 - alpha) * parents1[i] + alpha * parents2[i]
-            else:
-                offspring[2 * i] = parents1[i]
-                offspring[2 * i + 1] = parents2[i]
+        offspring[0::2] = alpha * parents1 + (1 - alpha) * parents2
+        offspring[1::2] = (1 - alpha) * parents1 + alpha * parents2
 
         self.offspring_population = pl.from_numpy(offspring, schema=self.variable_symbols).select(
             pl.all().cast(pl.Float64)
@@ -1,11 +1,18 @@
 """Classes for evaluating the objectives and constraints of the individuals in the population."""
 
+import asyncio
+import multiprocessing
+import os
 import warnings
+from collections import OrderedDict
 from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
 
 import polars as pl
 
-from desdeo.problem import Evaluator, Problem
+from desdeo.emo.operators.population import Population
+from desdeo.problem import Evaluator, Problem, problem_fingerprint
 from desdeo.tools.message import (
     EvaluatorMessageTopics,
     GenericMessage,
@@ -16,6 +23,68 @@ from desdeo.tools.message import (
 from desdeo.tools.patterns import Subscriber, Publisher
 
 
+_compiled_evaluators: OrderedDict[str, Evaluator] = OrderedDict()
+"""Evaluators with already parsed problems, keyed on the fingerprint of the problem."""
+
+COMPILED_EVALUATOR_CACHE_SIZE = 16
+"""The maximum number of compiled evaluators kept in the cache."""
+
+
+def get_compiled_evaluator(problem: Problem) -> Evaluator:
+    """Return an evaluator for the problem, reusing an already compiled evaluator if one exists.
+
+    Compiling (parsing) the functions of a problem is expensive compared to evaluating them.
+    The compiled evaluators are therefore cached, keyed on the structural fingerprint of the problem,
+    and shared by all the EMOEvaluators of structurally identical problems. The least recently used
+    evaluators are dropped once more than `COMPILED_EVALUATOR_CACHE_SIZE` are cached.
+
+    Args:
+        problem (Problem): the problem to be evaluated.
+
+    Returns:
+        Evaluator: an evaluator of the problem.
+    """
+    fingerprint = problem_fingerprint(problem)
+
+    if fingerprint in _compiled_evaluators:
+        _compiled_evaluators.move_to_end(fingerprint)
+        return _compiled_evaluators[fingerprint]
+
+    evaluator = Evaluator(problem)
+    _compiled_evaluators[fingerprint] = evaluator
+
+    if len(_compiled_evaluators) > COMPILED_EVALUATOR_CACHE_SIZE:
+        _compiled_evaluators.popitem(last=False)
+
+    return evaluator
+
+
+class ParallelEvaluationEnum(str, Enum):
+    """Defines the supported ways of evaluating a population in parallel."""
+
+    serial = "serial"
+    """Evaluate the whole population at once in the calling thread."""
+    thread = "thread"
+    """Evaluate chunks of the population in a pool of threads sharing one compiled evaluator."""
+    process = "process"
+    """Evaluate chunks of the population in a pool of processes, each keeping its own compiled evaluator."""
+
+
+_worker_evaluator: Evaluator | None = None
+"""The compiled evaluator resident in a worker process of a process pool."""
+
+
+def _init_worker(problem: Problem) -> None:
+    """Compile the problem once when a worker process of the pool starts."""
+    global _worker_evaluator  # noqa: PLW0603
+    _worker_evaluator = get_compiled_evaluator(problem)
+
+
+def _evaluate_chunk_in_worker(chunk: pl.DataFrame) -> pl.DataFrame:
+    """Evaluate a chunk of a population with the evaluator resident in the worker process."""
+    return _worker_evaluator.evaluate(chunk, flat=True)
+
+
 class EMOEvaluator(Subscriber):
     """Base class for evaluating the objectives and constraints of the individuals in the population.
 
@@ -41,21 +110,88 @@ class EMOEvaluator(Subscriber):
         """The topics that the Evaluator is interested in."""
         return []
 
-    def __init__(self, problem: Problem, verbosity: int, publisher: Publisher):
-        """Initialize the EMOEvaluator class."""
+    def __init__(
+        self,
+        problem: Problem,
+        verbosity: int,
+        publisher: Publisher,
+        parallel: ParallelEvaluationEnum = ParallelEvaluationEnum.serial,
+        n_workers: int | None = None,
+    ):
+        """Initialize the EMOEvaluator class.
+
+        Args:
+            problem (Problem): the problem to be evaluated.
+            verbosity (int): the verbosity level of the messages.
+            publisher (Publisher): the publisher to send messages to.
+            parallel (ParallelEvaluationEnum, optional): how the population is evaluated. When not serial, the
+                population is split into `n_workers` chunks, which are evaluated concurrently in a pool of threads or
+                processes and reassembled in their original order. The pool is created on first use and kept alive
+                between generations, so the workers only compile the problem once. Defaults to
+                `ParallelEvaluationEnum.serial`.
+            n_workers (int | None, optional): the number of workers in the pool. If None, the number of CPUs is used.
+                Ignored when `parallel` is serial. Defaults to None.
+        """
         super().__init__(
             verbosity=verbosity,
             publisher=publisher,
         )
         self.problem = problem
-        # TODO(@light-weaver, @gialmisi): This can be so much more efficient.
-        self.evaluator = lambda x: Evaluator(problem).evaluate(
-            {name.symbol: x[name.symbol].to_list() for name in problem.get_flattened_variables()}, flat=True
-        )
+        # The problem is parsed only once, and evaluated with the flattened variables as is
+        self.evaluator = get_compiled_evaluator(problem)
+        self.flattened_variable_symbols = [var.symbol for var in problem.get_flattened_variables()]
         self.variable_symbols = [name.symbol for name in problem.variables]
         self.population: pl.DataFrame
         self.out: pl.DataFrame
         self.new_evals: int = 0
+        self.parallel = ParallelEvaluationEnum(parallel)
+        self.n_workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+        if self.n_workers < 1:
+            raise ValueError("The number of workers must be a positive integer.")
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        """Return the pool of workers, creating it on first use."""
+        if self._executor is None:
+            if self.parallel == ParallelEvaluationEnum.thread:
+                self._executor = ThreadPoolExecutor(max_workers=self.n_workers)
+            else:
+                # Forking a process that already runs the polars thread pool may deadlock, hence spawn.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.n_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.problem,),
+                )
+        return self._executor
+
+    def _evaluate_population(self, population: pl.DataFrame) -> pl.DataFrame:
+        """Evaluate the flattened variables of a population, in chunks if parallel evaluation is enabled."""
+        n_chunks = min(self.n_workers, len(population))
+        if self.parallel == ParallelEvaluationEnum.serial or n_chunks <= 1:
+            return self.evaluator.evaluate(population, flat=True)
+
+        chunk_size = -(-len(population) // n_chunks)
+        chunks = [population.slice(offset, chunk_size) for offset in range(0, len(population), chunk_size)]
+        evaluate_chunk = (
+            (lambda chunk: self.evaluator.evaluate(chunk, flat=True))
+            if self.parallel == ParallelEvaluationEnum.thread
+            else _evaluate_chunk_in_worker
+        )
+        # map returns the results in the order of the chunks
+        return pl.concat(list(self._get_executor().map(evaluate_chunk, chunks)), how="vertical")
+
+    def close(self) -> None:
+        """Shut down the pool of workers, if one has been created."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __del__(self):
+        """Shut down the pool of workers when the evaluator is garbage collected."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def evaluate(self, population: pl.DataFrame) -> pl.DataFrame:
         """Evaluate and return the objectives.
@@ -66,8 +202,45 @@ class EMOEvaluator(Subscriber):
         Returns:
             pl.Dataframe: A dataframe of objective vectors, target vectors, and constraint vectors.
         """
+        out = self._evaluate_population(population.select(self.flattened_variable_symbols))
+        return self._record_evaluations(population, out)
+
+    def evaluate_population(self, population: Population) -> Population:
+        """Evaluate a population and return it with its outputs.
+
+        Args:
+            population (Population): The population to evaluate.
+
+        Returns:
+            Population: The population with the objective vectors, target vectors, and constraint vectors as outputs.
+        """
+        out = self.evaluate(population.solutions_view())
+        return population.with_outputs(out.to_numpy(order="fortran"), out.columns)
+
+    async def evaluate_async(self, population: pl.DataFrame, executor: Executor | None = None) -> pl.DataFrame:
+        """Evaluate and return the objectives without blocking the running event loop.
+
+        The evaluation itself is run in `executor`, while the evaluations are recorded and published
+        in the thread running the event loop once they are done. This keeps the messages sent to the
+        Publisher identical to the ones sent by `evaluate`, even when several evaluations are in flight.
+
+        Args:
+            population (pl.Dataframe): The set of decision variables to evaluate.
+            executor (Executor | None, optional): The executor the evaluation is run in. If None, the default
+                executor of the event loop is used. Defaults to None.
+
+        Returns:
+            pl.Dataframe: A dataframe of objective vectors, target vectors, and constraint vectors.
+        """
+        loop = asyncio.get_running_loop()
+        out = await loop.run_in_executor(
+            executor, self._evaluate_population, population.select(self.flattened_variable_symbols)
+        )
+        return self._record_evaluations(population, out)
+
+    def _record_evaluations(self, population: pl.DataFrame, out: pl.DataFrame) -> pl.DataFrame:
+        """Store the evaluated population, notify the publisher, and return the outputs."""
         self.population = population
-        out = self.evaluator(population)
         # remove variable_symbols from the output
         self.out = out.drop(self.variable_symbols)
         self.new_evals = len(population)
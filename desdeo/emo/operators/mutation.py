@@ -5,11 +5,12 @@ Various evolutionary operators for mutation in multiobjective optimization are d
 
 import copy
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 
 import numpy as np
 import polars as pl
 
+from desdeo.emo.operators.population import Population
 from desdeo.problem import Problem, VariableDomainTypeEnum, VariableTypeEnum
 from desdeo.tools.message import (
     FloatMessage,
@@ -21,6 +22,40 @@ from desdeo.tools.message import (
 from desdeo.tools.patterns import Publisher, Subscriber
 
 
+def _mutate_masked(
+    population: np.ndarray,
+    mask: np.ndarray,
+    mutate: Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray],
+    lower_bounds: list[float],
+    upper_bounds: list[float],
+    variable_types: list[VariableTypeEnum],
+) -> np.ndarray:
+    """Mutate the masked elements of a population at once, rounding the integer and binary variables.
+
+    Args:
+        population (np.ndarray): the population to mutate, with each row being a single solution.
+        mask (np.ndarray): boolean array of the same shape, True for the elements to mutate.
+        mutate (Callable): mutates a 1-D array of values, given the lower and upper bounds of each value.
+        lower_bounds (list[float]): the lower bounds of the variables.
+        upper_bounds (list[float]): the upper bounds of the variables.
+        variable_types (list[VariableTypeEnum]): the types of the variables.
+
+    Returns:
+        np.ndarray: the mutated population.
+    """
+    rows, cols = np.nonzero(mask)
+    if len(rows) == 0:
+        return population
+    lower_bounds = np.asarray(lower_bounds, dtype=float)
+    upper_bounds = np.asarray(upper_bounds, dtype=float)
+    integer = np.array([t in (VariableTypeEnum.binary, VariableTypeEnum.integer) for t in variable_types])
+
+    mutated = mutate(population[rows, cols], lower_bounds[cols], upper_bounds[cols])
+    # Round after float mutation to keep integer domain
+    population[rows, cols] = np.where(integer[cols], np.round(mutated), mutated)
+    return population
+
+
 class BaseMutation(Subscriber):
     """A base class for mutation operators."""
 
@@ -48,6 +83,22 @@ class BaseMutation(Subscriber):
             pl.DataFrame: the offspring resulting from the mutation.
         """
 
+    def do_population(self, offsprings: Population, parents: Population) -> Population:
+        """Perform the mutation operation on a population.
+
+        By default, the mutation is done with `do` on polars views of the populations. Subclasses may override this
+        to operate on the arrays of the populations directly.
+
+        Args:
+            offsprings (Population): the offspring population to mutate.
+            parents (Population): the parent population from which the offspring
+                was generated (via crossover).
+
+        Returns:
+            Population: the offspring resulting from the mutation, without outputs.
+        """
+        return Population.from_polars(self.do(offsprings.solutions_view(), parents.solutions_view()))
+
 
 class BoundedPolynomialMutation(BaseMutation):
     """Implements the bounded polynomial mutation operator.
@@ -125,7 +176,6 @@ class BoundedPolynomialMutation(BaseMutation):
         Returns:
             pl.DataFrame: the offspring resulting from the mutation.
         """
-        # TODO(@light-weaver): Extract to a numba jitted function
         self.offspring_original = offsprings
         self.parents = parents  # Not used, but kept for consistency
         offspring = offsprings.to_numpy(writable=True)
@@ -157,7 +207,7 @@ class BoundedPolynomialMutation(BaseMutation):
         )
         offspring[offspring > max_val] = max_val[offspring > max_val]
         offspring[offspring < min_val] = min_val[offspring < min_val]
-        self.offspring = pl.from_numpy(offspring, schema=self.variable_symbols)
+        self.offspring = pl.from_numpy(np.asfortranarray(offspring), schema=self.variable_symbols)
         self.notify()
         return self.offspring
 
@@ -683,19 +733,19 @@ class MPTMutation(BaseMutation):
             1 / len(self.variable_symbols) if mutation_probability is None else mutation_probability
         )
 
-    def _mutate_value(self, x, lower_bound, upper_bound):
-        """Apply small mutation to a single float value using mutation exponent."""
-        t = (x - lower_bound) / (upper_bound - lower_bound)
-        rnd = self.rng.uniform(0, 1)
+    def _mutate_values(self, x: np.ndarray, lower_bounds: np.ndarray, upper_bounds: np.ndarray) -> np.ndarray:
+        """Apply small mutation to an array of float values using mutation exponent."""
+        t = (x - lower_bounds) / (upper_bounds - lower_bounds)
+        rnd = self.rng.uniform(0, 1, size=x.shape)
 
-        if rnd < t:
-            tm = t - t * ((t - rnd) / t) ** self.mutation_exponent
-        elif rnd > t:
-            tm = t + (1 - t) * ((rnd - t) / (1 - t)) ** self.mutation_exponent
-        else:
-            tm = t
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tm = np.where(
+                rnd < t,
+                t - t * ((t - rnd) / t) ** self.mutation_exponent,
+                np.where(rnd > t, t + (1 - t) * ((rnd - t) / (1 - t)) ** self.mutation_exponent, t),
+            )
 
-        return (1 - tm) * lower_bound + tm * upper_bound
+        return (1 - tm) * lower_bounds + tm * upper_bounds
 
     def do(self, offsprings: pl.DataFrame, parents: pl.DataFrame) -> pl.DataFrame:
         """Perform the MPT mutation operation.
@@ -712,17 +762,14 @@ class MPTMutation(BaseMutation):
         self.parents = parents
 
         population = offsprings.to_numpy(writable=True).astype(float)
-
-        for i in range(population.shape[0]):
-            for j, var in enumerate(self.problem.variables):
-                if self.rng.random() < self.mutation_probability:
-                    x = population[i, j]
-                    lower_bound, upper_bound = var.lowerbound, var.upperbound
-                    if var.variable_type in [VariableTypeEnum.binary, VariableTypeEnum.integer]:
-                        # Round after float mutation to keep integer domain
-                        population[i, j] = round(self._mutate_value(x, lower_bound, upper_bound))
-                    else:
-                        population[i, j] = self._mutate_value(x, lower_bound, upper_bound)
+        population = _mutate_masked(
+            population,
+            self.rng.random(population.shape) < self.mutation_probability,
+            self._mutate_values,
+            self.lower_bounds,
+            self.upper_bounds,
+            self.variable_types,
+        )
 
         self.offspring = pl.from_numpy(population, schema=self.variable_symbols).select(pl.all()).cast(pl.Float64)
         self.notify()
@@ -828,36 +875,32 @@ class NonUniformMutation(BaseMutation):
             1 / len(self.variable_symbols) if mutation_probability is None else mutation_probability
         )
 
-    def _mutate_value(self, x, lower_bound, upper_bound, mutation_threshold=0.5):
-        """Apply non-uniform mutation to a single float value.
+    def _mutate_values(
+        self, x: np.ndarray, lower_bounds: np.ndarray, upper_bounds: np.ndarray, mutation_threshold: float = 0.5
+    ) -> np.ndarray:
+        """Apply non-uniform mutation to an array of float values.
 
         Args:
-            x (float): The current value of the gene to be mutated.
-            lower_bound (float): The lower bound of the gene.
-            upper_bound (float): The upper bound of the gene.
+            x (np.ndarray): The current values of the genes to be mutated.
+            lower_bounds (np.ndarray): The lower bounds of the genes.
+            upper_bounds (np.ndarray): The upper bounds of the genes.
             mutation_threshold (float): The mutation threshold. Defaults to 0.5.
 
         Returns:
-            float: The mutated gene value, clipped within the bounds [l, u].
+            np.ndarray: The mutated gene values, clipped within the bounds [l, u].
         """
-        r = self.rng.uniform(0, 1)  # Random number to choose direction
+        r = self.rng.uniform(0, 1, size=x.shape)  # Random numbers to choose direction
         t = self.current_generation
         max_generations = self.max_generations
         b = self.b
 
-        u_rand = self.rng.uniform(0, 1)  # Random number for mutation strength
+        u_rand = self.rng.uniform(0, 1, size=x.shape)  # Random numbers for mutation strength
         tau = (1 - t / max_generations) ** b
 
-        if r <= mutation_threshold:
-            y = upper_bound - x
-            delta = y * (1 - u_rand**tau)
-            xm = x + delta
-        else:
-            y = x - lower_bound
-            delta = y * (1 - u_rand**tau)
-            xm = x - delta
+        strength = 1 - u_rand**tau
+        xm = np.where(r <= mutation_threshold, x + (upper_bounds - x) * strength, x - (x - lower_bounds) * strength)
 
-        return np.clip(xm, lower_bound, upper_bound)
+        return np.clip(xm, lower_bounds, upper_bounds)
 
     def do(self, offsprings: pl.DataFrame, parents: pl.DataFrame) -> pl.DataFrame:
         """Perform non-uniform mutation.
@@ -874,16 +917,14 @@ class NonUniformMutation(BaseMutation):
         self.parents = parents
 
         population = offsprings.to_numpy(writable=True).astype(float)
-
-        for i in range(population.shape[0]):
-            for j, var in enumerate(self.problem.variables):
-                if self.rng.random() < self.mutation_probability:
-                    x = population[i, j]
-                    lower_bound, upper_bound = var.lowerbound, var.upperbound
-                    if var.variable_type in [VariableTypeEnum.binary, VariableTypeEnum.integer]:
-                        population[i, j] = round(self._mutate_value(x, lower_bound, upper_bound))
-                    else:
-                        population[i, j] = self._mutate_value(x, lower_bound, upper_bound)
+        population = _mutate_masked(
+            population,
+            self.rng.random(population.shape) < self.mutation_probability,
+            self._mutate_values,
+            self.lower_bounds,
+            self.upper_bounds,
+            self.variable_types,
+        )
 
         self.offspring = pl.from_numpy(population, schema=self.variable_symbols).cast(pl.Float64)
         self.notify()
@@ -1024,16 +1065,12 @@ class SelfAdaptiveGaussianMutation(BaseMutation):
         Returns:
             tuple[np.ndarray, np.ndarray]: Mutated population and updated step sizes.
         """
-        new_variables = variables.copy()
-        new_eta = eta.copy()
+        common_noise = self.rng.normal(size=(variables.shape[0], 1))
+        mask = self.rng.random(variables.shape) < self.mutation_probability
+        rnd_numbers = self.rng.normal(size=variables.shape)
 
-        for i in range(variables.shape[0]):
-            common_noise = self.rng.normal()
-            for j in range(variables.shape[1]):
-                if self.rng.random() < self.mutation_probability:
-                    rnd_number = self.rng.normal()  # random number in the interval [0, 1]
-                    new_eta[i, j] *= np.exp(self.tau_prime * common_noise + self.tau * rnd_number)
-                    new_variables[i, j] += new_eta[i, j] * rnd_number
+        new_eta = np.where(mask, eta * np.exp(self.tau_prime * common_noise + self.tau * rnd_numbers), eta)
+        new_variables = np.where(mask, variables + new_eta * rnd_numbers, variables)
 
         return new_variables, new_eta
 
@@ -1152,22 +1189,22 @@ class PowerMutation(BaseMutation):
 
         population = offsprings.to_numpy(writable=True).astype(float)
         mutation_mask = self.rng.random(population.shape) < self.mutation_probability
-        mutated = population.copy()
 
-        for i, var in enumerate(self.problem.variables):
-            lower_bound, upper_bound = var.lowerbound, var.upperbound
-            x_i = population[:, i]
+        lower_bounds = np.asarray(self.lower_bounds, dtype=float)
+        upper_bounds = np.asarray(self.upper_bounds, dtype=float)
 
-            u_i = self.rng.random(len(x_i))  # uniform random number
-            s_i = u_i ** (1 / self.p)  # random number that follows the power distribution
+        u = self.rng.random(population.shape)  # uniform random numbers
+        s = u ** (1 / self.p)  # random numbers that follow the power distribution
 
-            r_i = self.rng.random(len(x_i))  # another uniform random number
-            direction = ((x_i - lower_bound) / (upper_bound - lower_bound)) < r_i  # used as condition
+        r = self.rng.random(population.shape)  # other uniform random numbers
+        direction = ((population - lower_bounds) / (upper_bounds - lower_bounds)) < r  # used as condition
 
-            xi_mutated = np.where(direction, x_i - s_i * (x_i - lower_bound), x_i + s_i * (upper_bound - x_i))
+        mutated_values = np.where(
+            direction, population - s * (population - lower_bounds), population + s * (upper_bounds - population)
+        )
 
-            # Apply mutation based on mask
-            mutated[:, i] = np.where(mutation_mask[:, i], xi_mutated, x_i)
+        # Apply mutation based on mask
+        mutated = np.where(mutation_mask, mutated_values, population)
 
         # Convert back to DataFrame
         self.offspring = pl.from_numpy(mutated, schema=self.variable_symbols).select(pl.all()).cast(pl.Float64)
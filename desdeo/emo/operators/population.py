@@ -0,0 +1,187 @@
+"""A compact, columnar container for the populations of the evolutionary algorithms.
+
+The operators of the evolutionary algorithms exchange populations as polars dataframes, which leads to many conversions
+between polars and NumPy each generation. The `Population` class instead stores the decision variables and the outputs
+(objectives, targets, constraints, etc.) of the individuals as contiguous float64 blocks. The blocks are stored in
+column-major (Fortran) order, so that each column is contiguous in memory. This allows converting the blocks to polars
+dataframes and back without copying the data, so polars views of the population are only produced when needed, e.g.,
+when the operators send messages to the Publisher.
+
+Note:
+    The views share memory with the population. The blocks of a population must therefore never be modified in place.
+    All the methods of `Population` return new populations instead.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+import polars as pl
+
+
+def _fortran_take(block: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Take rows of a block into a new column-major block."""
+    out = np.empty((len(indices), block.shape[1]), dtype=np.float64, order="F")
+    return np.take(block, indices, axis=0, out=out)
+
+
+def _fortran_concat(blocks: Sequence[np.ndarray]) -> np.ndarray:
+    """Concatenate blocks row-wise into a new column-major block."""
+    out = np.empty((sum(len(block) for block in blocks), blocks[0].shape[1]), dtype=np.float64, order="F")
+    return np.concatenate(blocks, axis=0, out=out)
+
+
+class Population:
+    """A population of individuals, stored as contiguous column-major float64 blocks.
+
+    Attributes:
+        variables (np.ndarray): The decision variables, with each row being a single individual.
+        variable_symbols (list[str]): The symbols of the columns of `variables`.
+        outputs (np.ndarray | None): The outputs of the individuals, or None if they have not been evaluated.
+        output_symbols (list[str] | None): The symbols of the columns of `outputs`.
+        index (np.ndarray): Integer identifiers of the individuals, carried along when the population is
+            subset or combined.
+    """
+
+    def __init__(
+        self,
+        variables: np.ndarray,
+        variable_symbols: list[str],
+        outputs: np.ndarray | None = None,
+        output_symbols: list[str] | None = None,
+        index: np.ndarray | None = None,
+    ):
+        """Initialize a population.
+
+        The blocks are converted to column-major float64 arrays, which copies them only if they are not already.
+
+        Args:
+            variables (np.ndarray): The decision variables, with each row being a single individual.
+            variable_symbols (list[str]): The symbols of the columns of `variables`.
+            outputs (np.ndarray | None, optional): The outputs of the individuals. Defaults to None.
+            output_symbols (list[str] | None, optional): The symbols of the columns of `outputs`. Required if
+                `outputs` is given. Defaults to None.
+            index (np.ndarray | None, optional): Integer identifiers of the individuals. Defaults to None, in which
+                case the individuals are numbered from 0.
+        """
+        self.variables = np.asfortranarray(variables, dtype=np.float64)
+        self.variable_symbols = list(variable_symbols)
+        if self.variables.ndim != 2 or self.variables.shape[1] != len(self.variable_symbols):  # noqa: PLR2004
+            raise ValueError("The variables must be a 2-D array with a column for each variable symbol.")
+
+        if outputs is not None:
+            if output_symbols is None:
+                raise ValueError("The output symbols must be given with the outputs.")
+            outputs = np.asfortranarray(outputs, dtype=np.float64)
+            if outputs.shape != (len(self.variables), len(output_symbols)):
+                raise ValueError("The outputs must be a 2-D array with a row for each individual.")
+        self.outputs = outputs
+        self.output_symbols = list(output_symbols) if output_symbols is not None else None
+        self._output_positions = (
+            {symbol: i for i, symbol in enumerate(self.output_symbols)} if self.output_symbols is not None else {}
+        )
+
+        self.index = np.arange(len(self.variables)) if index is None else np.asarray(index, dtype=np.int64)
+
+    @classmethod
+    def from_polars(cls, solutions: pl.DataFrame, outputs: pl.DataFrame | None = None) -> "Population":
+        """Create a population from polars dataframes.
+
+        The dataframes are not copied if their columns are contiguous float64 arrays, e.g., if they are views of
+        another population.
+
+        Args:
+            solutions (pl.DataFrame): The decision variables.
+            outputs (pl.DataFrame | None, optional): The outputs of the individuals. Defaults to None.
+
+        Returns:
+            Population: The population.
+        """
+        return cls(
+            variables=solutions.to_numpy(order="fortran"),
+            variable_symbols=solutions.columns,
+            outputs=outputs.to_numpy(order="fortran") if outputs is not None else None,
+            output_symbols=outputs.columns if outputs is not None else None,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of individuals."""
+        return len(self.variables)
+
+    def solutions_view(self) -> pl.DataFrame:
+        """Return the decision variables as a polars dataframe sharing memory with the population."""
+        return pl.from_numpy(self.variables, schema=self.variable_symbols, orient="row")
+
+    def outputs_view(self) -> pl.DataFrame | None:
+        """Return the outputs as a polars dataframe sharing memory with the population, or None if not evaluated."""
+        if self.outputs is None:
+            return None
+        return pl.from_numpy(self.outputs, schema=self.output_symbols, orient="row")
+
+    def output_columns(self, symbols: Sequence[str]) -> np.ndarray:
+        """Return the given columns of the outputs, e.g., the targets or the constraints.
+
+        Args:
+            symbols (Sequence[str]): The symbols of the columns.
+
+        Returns:
+            np.ndarray: The columns. This is a view of the outputs if the columns are consecutive.
+        """
+        if self.outputs is None:
+            raise ValueError("The population has not been evaluated.")
+        positions = [self._output_positions[symbol] for symbol in symbols]
+        if positions and positions == list(range(positions[0], positions[0] + len(positions))):
+            return self.outputs[:, positions[0] : positions[0] + len(positions)]
+        return self.outputs[:, positions]
+
+    def with_outputs(self, outputs: np.ndarray, output_symbols: list[str]) -> "Population":
+        """Return the population with the given outputs.
+
+        Args:
+            outputs (np.ndarray): The outputs of the individuals.
+            output_symbols (list[str]): The symbols of the columns of `outputs`.
+
+        Returns:
+            Population: A population sharing the decision variables with this one.
+        """
+        return Population(self.variables, self.variable_symbols, outputs, output_symbols, self.index)
+
+    def take(self, indices: np.ndarray | Sequence[int]) -> "Population":
+        """Return the individuals at the given positions.
+
+        Args:
+            indices (np.ndarray | Sequence[int]): The positions of the individuals.
+
+        Returns:
+            Population: A new population of the individuals.
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        return Population(
+            _fortran_take(self.variables, indices),
+            self.variable_symbols,
+            _fortran_take(self.outputs, indices) if self.outputs is not None else None,
+            self.output_symbols,
+            self.index[indices],
+        )
+
+    def concat(self, other: "Population") -> "Population":
+        """Return the individuals of this population followed by the individuals of another population.
+
+        Args:
+            other (Population): The other population. Must have the same symbols.
+
+        Returns:
+            Population: A new population of the individuals.
+        """
+        if self.variable_symbols != other.variable_symbols or self.output_symbols != other.output_symbols:
+            raise ValueError("The populations must have the same variables and outputs.")
+        if len(self) == 0:
+            return other
+        if len(other) == 0:
+            return self
+        return Population(
+            _fortran_concat([self.variables, other.variables]),
+            self.variable_symbols,
+            _fortran_concat([self.outputs, other.outputs]) if self.outputs is not None else None,
+            self.output_symbols,
+            np.concatenate((self.index, other.index)),
+        )
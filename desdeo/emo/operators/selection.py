@@ -4,22 +4,28 @@ This whole file should be rewritten. Everything is a mess. Moreover, the selecto
 TODO:@light-weaver
 """
 
+import os
 import warnings
 from abc import abstractmethod
 from collections.abc import Sequence
+from contextlib import suppress
 from enum import Enum
 from itertools import combinations
+from pathlib import Path
 from typing import Callable, Literal, TypedDict, TypeVar
 
 import numpy as np
 import polars as pl
 from numba import njit
+from scipy.spatial import cKDTree
 from scipy.special import comb
 from scipy.stats.qmc import LatinHypercube
 
+from desdeo.emo.operators.population import Population
 from desdeo.problem import Problem
 from desdeo.tools import get_corrected_ideal_and_nadir
 from desdeo.tools.indicators_binary import self_epsilon
+from desdeo.tools.indicators_unary import HypervolumeContributions
 from desdeo.tools.message import (
     Array2DMessage,
     DictMessage,
@@ -29,7 +35,7 @@ from desdeo.tools.message import (
     SelectorMessageTopics,
     TerminatorMessageTopics,
 )
-from desdeo.tools.non_dominated_sorting import fast_non_dominated_sort
+from desdeo.tools.non_dominated_sorting import fast_non_dominated_sort_indices
 from desdeo.tools.patterns import Publisher, Subscriber
 
 SolutionType = TypeVar("SolutionType", list, pl.DataFrame)
@@ -83,6 +89,209 @@ class BaseSelector(Subscriber):
                 targets, and constraint violations.
         """
 
+    def do_population(self, parents: Population, offsprings: Population) -> Population:
+        """Perform the selection operation on populations.
+
+        By default, the selection is done with `do` on polars views of the populations. Subclasses may override this
+        to select on the arrays of the populations directly.
+
+        Args:
+            parents (Population): the parent population, with outputs.
+            offsprings (Population): the offspring population, with outputs.
+
+        Returns:
+            Population: The selected individuals.
+        """
+        solutions, outputs = self.do(
+            parents=(parents.solutions_view(), parents.outputs_view()),
+            offsprings=(offsprings.solutions_view(), offsprings.outputs_view()),
+        )
+        return Population.from_polars(solutions, outputs)
+
+
+def s_energy_cache_dir() -> Path | None:
+    """Return the default directory where the reference vectors created with the Riesz s-energy criterion are cached.
+
+    The directory is `reference_vectors` in the directory given by the environment variable `DESDEO_CACHE_DIR`, or in
+    `~/.cache/desdeo` if the variable is not set. It is resolved each time, so that the variable can be set at runtime.
+
+    Returns:
+        Path | None: The directory, or None if `DESDEO_CACHE_DIR` is not set and the home directory cannot be
+            determined, e.g., in a container without a home directory.
+    """
+    if "DESDEO_CACHE_DIR" in os.environ:
+        return Path(os.environ["DESDEO_CACHE_DIR"]) / "reference_vectors"
+    try:
+        return Path.home() / ".cache" / "desdeo" / "reference_vectors"
+    except (RuntimeError, KeyError):
+        return None
+
+
+_s_energy_cache: dict[tuple, np.ndarray] = {}
+"""Reference vectors already created with the Riesz s-energy criterion in this process."""
+
+
+def _s_energy_gradient(
+    points: np.ndarray, s: float, distance_scale: float, chunk_size: int
+) -> tuple[np.ndarray, float, float]:
+    """Calculate the gradient of the Riesz s-energy of a set of points, in chunks of rows.
+
+    The pairwise distances are divided by `distance_scale` to keep the terms representable. This only scales the
+    energy and its gradient by a constant.
+
+    Args:
+        points (np.ndarray): The points, with each row being a single point.
+        s (float): The exponent of the Riesz s-energy.
+        distance_scale (float): The distance the pairwise distances are scaled with.
+        chunk_size (int): The number of rows handled at a time. Memory use is proportional to chunk_size * len(points).
+
+    Returns:
+        tuple[np.ndarray, float, float]: The gradient of the logarithm of the scaled energy, the logarithm of the
+            scaled energy, and the smallest pairwise distance.
+    """
+    squared_norms = np.sum(points**2, axis=1)
+    gradient = np.empty_like(points)
+    energy = 0.0
+    min_distance = np.inf
+    for start in range(0, len(points), chunk_size):
+        stop = min(start + chunk_size, len(points))
+        squared = squared_norms[start:stop, None] + squared_norms[None, :] - 2 * points[start:stop] @ points.T
+        distances = np.sqrt(np.maximum(squared, 0)) / distance_scale
+        # A point does not interact with itself
+        distances[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        min_distance = min(min_distance, distances.min() * distance_scale)
+        distances = np.maximum(distances, np.finfo(float).tiny ** (1 / (s + 2)))
+        energy += np.sum(distances**-s)
+        weights = distances ** -(s + 2)
+        # d/dx_i of sum_j |x_i - x_j|^-s is -s * sum_j (x_i - x_j) |x_i - x_j|^-(s + 2)
+        gradient[start:stop] = -s * (points[start:stop] * weights.sum(axis=1)[:, None] - weights @ points)
+    return gradient / energy / distance_scale, np.log(energy), min_distance
+
+
+def _load_cached_vectors(cache_file: Path) -> np.ndarray | None:
+    """Load vectors cached on disk, or return None if they are not cached or cannot be read."""
+    try:
+        return np.load(cache_file)
+    except (OSError, ValueError, EOFError):
+        return None
+
+
+def _save_cached_vectors(cache_file: Path, points: np.ndarray) -> None:
+    """Cache vectors on disk, if the directory can be written to."""
+    # Write to a temporary file first, so that concurrent runs never read a partially written file
+    temporary_file = cache_file.with_suffix(f".{os.getpid()}.tmp.npy")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        np.save(temporary_file, points)
+        temporary_file.replace(cache_file)
+    except OSError:
+        # E.g., the directory is read-only, the vectors are then only cached in memory
+        with suppress(OSError):
+            temporary_file.unlink(missing_ok=True)
+
+
+def riesz_s_energy_vectors(
+    num_dims: int,
+    num_vectors: int,
+    seed: int = 0,
+    s: float | None = None,
+    max_iterations: int = 1000,
+    learning_rate: float = 0.005,
+    tolerance: float = 1e-6,
+    cache_dir: Path | str | Literal["default"] | None = "default",
+    chunk_size: int = 1024,
+) -> np.ndarray:
+    """Create an arbitrary number of well spread points on the unit simplex by minimizing their Riesz s-energy.
+
+    The energy sum_{i != j} |x_i - x_j|^-s of the points is minimized with the Adam optimizer, projecting the points
+    back onto the unit simplex after each step. The corners of the simplex are kept fixed. The pairwise terms are
+    computed in chunks of rows, so the memory needed is linear in the number of points.
+
+    As creating the points is expensive, the results are cached both in memory and on disk in `cache_dir`, keyed on the
+    arguments. The cached points are reused by all the selectors and runs asking for the same points. Caching on disk
+    is best-effort: if the directory cannot be read or written, e.g., it is read-only, only the cache in memory is
+    used.
+
+    The method is described in: Blank, J., Deb, K., Dhebar, Y., Bandaru, S., & Seada, H. (2021). Generating
+    well-spaced points on a unit simplex for evolutionary many-objective optimization. IEEE Transactions on
+    Evolutionary Computation, 25(1), 48-60.
+
+    Args:
+        num_dims (int): The number of dimensions, e.g., the number of objectives.
+        num_vectors (int): The number of points to create.
+        seed (int, optional): The seed for the random initial points. Defaults to 0.
+        s (float | None, optional): The exponent of the Riesz s-energy. If None, `2 * num_dims` is used.
+            Defaults to None.
+        max_iterations (int, optional): The maximum number of optimization steps. Defaults to 1000.
+        learning_rate (float, optional): The learning rate of the Adam optimizer. Defaults to 0.005.
+        tolerance (float, optional): The optimization is stopped once no point moves more than this in a step.
+            Defaults to 1e-6.
+        cache_dir (Path | str | Literal["default"] | None, optional): The directory where the points are cached. If
+            "default", the directory returned by `s_energy_cache_dir` is used. If None, the points are not cached on
+            disk. Defaults to "default".
+        chunk_size (int, optional): The number of rows of the pairwise terms computed at a time. Defaults to 1024.
+
+    Returns:
+        np.ndarray: The points, with each row being a single point. The elements of each point sum to one.
+    """
+    if num_dims < 1 or num_vectors < 1:
+        raise ValueError("The number of dimensions and the number of vectors must be positive.")
+    if s is None:
+        s = 2.0 * num_dims
+
+    key = (num_dims, num_vectors, seed, s, max_iterations, learning_rate, tolerance)
+    if key in _s_energy_cache:
+        return _s_energy_cache[key].copy()
+
+    if cache_dir == "default":
+        cache_dir = s_energy_cache_dir()
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = Path(cache_dir) / (
+            f"s_energy_{num_dims}_{num_vectors}_{seed}_{s:g}_{max_iterations}_{learning_rate:g}_{tolerance:g}.npy"
+        )
+        points = _load_cached_vectors(cache_file)
+        if points is not None:
+            _s_energy_cache[key] = points
+            return points.copy()
+
+    rng = np.random.default_rng(seed)
+    if num_vectors <= num_dims:
+        points = np.eye(num_dims)[rng.permutation(num_dims)[:num_vectors]]
+    else:
+        points = np.vstack((np.eye(num_dims), rng.dirichlet(np.ones(num_dims), size=num_vectors - num_dims)))
+        free = slice(num_dims, None)
+
+        first_moment = np.zeros_like(points[free])
+        second_moment = np.zeros_like(points[free])
+        beta_1, beta_2, epsilon = 0.9, 0.999, 1e-8
+        _, _, distance_scale = _s_energy_gradient(points, s, 1.0, chunk_size)
+        for iteration in range(1, max_iterations + 1):
+            gradient, _, min_distance = _s_energy_gradient(points, s, distance_scale, chunk_size)
+            distance_scale = max(min_distance, np.finfo(float).eps)
+            # Only move along the simplex
+            gradient = gradient[free] - gradient[free].mean(axis=1, keepdims=True)
+
+            first_moment = beta_1 * first_moment + (1 - beta_1) * gradient
+            second_moment = beta_2 * second_moment + (1 - beta_2) * gradient**2
+            step = (
+                learning_rate
+                * (first_moment / (1 - beta_1**iteration))
+                / (np.sqrt(second_moment / (1 - beta_2**iteration)) + epsilon)
+            )
+
+            moved = np.clip(points[free] - step, 0, None)
+            moved /= moved.sum(axis=1, keepdims=True)
+            displacement = np.abs(moved - points[free]).max()
+            points[free] = moved
+            if displacement < tolerance:
+                break
+
+    _s_energy_cache[key] = points
+    if cache_file is not None:
+        _save_cached_vectors(cache_file, points)
+    return points.copy()
+
 
 class ReferenceVectorOptions(TypedDict, total=False):
     """The options for the reference vector based selection operators."""
@@ -92,15 +301,14 @@ class ReferenceVectorOptions(TypedDict, total=False):
     Only used if `interactive_adaptation` is set to "none"."""
     creation_type: Literal["simplex", "s_energy"]
     """The method for creating reference vectors. Defaults to "simplex".
-    Currently only "simplex" is implemented. Future versions will include "s_energy".
 
     If set to "simplex", the reference vectors are created using the simplex lattice design method.
     This method is generates distributions with specific numbers of reference vectors.
     Check: https://www.itl.nist.gov/div898/handbook/pri/section5/pri542.htm for more information.
 
     If set to "s_energy", the reference vectors are created using the Riesz s-energy criterion. This method is used to
-    distribute an arbitrary number of reference vectors in the objective space while minimizing the s-energy.
-    Currently not implemented.
+    distribute an arbitrary number of reference vectors in the objective space while minimizing the s-energy. The
+    vectors are cached on disk, see :py:func:`riesz_s_energy_vectors`.
     """
     vector_type: Literal["spherical", "planar"]
     """The method for normalizing the reference vectors. Defaults to "spherical"."""
@@ -114,6 +322,8 @@ class ReferenceVectorOptions(TypedDict, total=False):
     Note that if neither `lattice_resolution` nor `number_of_vectors` is specified, the number of vectors defaults to
     500.
     """
+    seed: int
+    """The seed for the initial points of the "s_energy" method. Not used by the "simplex" method. Defaults to 0."""
     interactive_adaptation: Literal[
         "preferred_solutions", "non_preferred_solutions", "preferred_ranges", "reference_point", "none"
     ]
@@ -132,6 +342,69 @@ class ReferenceVectorOptions(TypedDict, total=False):
     """The preferred ranges for interactive adaptation."""
 
 
+class ReferenceVectorGeometry:
+    """The adapted reference vectors and the angles between them, cached on the scaling of the objectives.
+
+    The reference vectors are adapted by scaling them with the range of the objectives and normalizing them to unit
+    length. For each adapted vector, the angle to its nearest neighbour (gamma) is found with a k-d tree, so the memory
+    needed is linear in the number of vectors. The adapted vectors and the angles are only recomputed when the scaling
+    changes, and each recomputation increments `version`.
+
+    Note:
+        The cached arrays are read-only, as they are shared with the selectors using them.
+    """
+
+    def __init__(self, reference_vectors: np.ndarray):
+        """Initialize the geometry of the reference vectors without any scaling.
+
+        Args:
+            reference_vectors (np.ndarray): The reference vectors, with each row being a single vector.
+        """
+        self.reference_vectors = reference_vectors
+        self.scale: np.ndarray | None = None
+        self.version = 0
+        self.adapted_vectors: np.ndarray
+        self.gamma: np.ndarray
+        self._compute()
+
+    def adapt(self, scale: np.ndarray | None) -> bool:
+        """Adapt the reference vectors to the given scaling, unless they already are.
+
+        Args:
+            scale (np.ndarray | None): The range of each objective, e.g., the nadir point minus the ideal point. If
+                None, the reference vectors are not scaled.
+
+        Returns:
+            bool: Whether the adapted vectors and the angles were recomputed.
+        """
+        if (scale is None and self.scale is None) or (
+            scale is not None and self.scale is not None and np.array_equal(scale, self.scale)
+        ):
+            return False
+        self.scale = None if scale is None else np.array(scale, dtype=float)
+        self._compute()
+        self.version += 1
+        return True
+
+    def _compute(self) -> None:
+        """Compute the adapted vectors and the angles to their nearest neighbours."""
+        adapted = self.reference_vectors if self.scale is None else self.reference_vectors * self.scale
+        adapted = adapted / np.linalg.norm(adapted, axis=1)[:, None]
+        adapted.setflags(write=False)
+        self.adapted_vectors = adapted
+
+        # Identical vectors are not each other's neighbours, so the tree is built on the distinct vectors only
+        distinct, inverse = np.unique(adapted, axis=0, return_inverse=True)
+        if len(distinct) < 2:  # noqa: PLR2004
+            gamma = np.full(len(adapted), np.inf)
+        else:
+            distances, _ = cKDTree(distinct).query(distinct, k=2)
+            # The chord between two unit vectors gives the angle between them
+            gamma = (2 * np.arcsin(np.clip(distances[:, 1] / 2, 0, 1)))[inverse.reshape(-1)]
+        gamma.setflags(write=False)
+        self.gamma = gamma
+
+
 class BaseDecompositionSelector(BaseSelector):
     """Base class for decomposition based selection operators."""
 
@@ -140,6 +413,7 @@ class BaseDecompositionSelector(BaseSelector):
     ):
         super().__init__(problem, verbosity=verbosity, publisher=publisher)
         self.reference_vector_options = reference_vector_options
+        self._geometry: ReferenceVectorGeometry | None = None
         self.reference_vectors: np.ndarray
         self.reference_vectors_initial: np.ndarray
 
@@ -153,7 +427,9 @@ class BaseDecompositionSelector(BaseSelector):
         if self.reference_vector_options["creation_type"] == "simplex":
             self._create_simplex()
         elif self.reference_vector_options["creation_type"] == "s_energy":
-            raise NotImplementedError("Riesz s-energy criterion is not yet implemented.")
+            self._create_s_energy()
+        else:
+            raise ValueError("Invalid creation type. Must be either 'simplex' or 's_energy'.")
 
         if "interactive_adaptation" not in self.reference_vector_options:
             self.reference_vector_options["interactive_adaptation"] = "none"
@@ -161,7 +437,6 @@ class BaseDecompositionSelector(BaseSelector):
             self.reference_vector_options["adaptation_frequency"] = 0
         if "adaptation_distance" not in self.reference_vector_options:
             self.reference_vector_options["adaptation_distance"] = 0.2
-        self._create_simplex()
 
         if self.reference_vector_options["interactive_adaptation"] == "reference_point":
             if "reference_point" not in self.reference_vector_options:
@@ -191,6 +466,24 @@ class BaseDecompositionSelector(BaseSelector):
                 np.array([self.reference_vector_options["preferred_ranges"][x] for x in self.target_symbols]).T,
             )
 
+    @property
+    def reference_vectors(self) -> np.ndarray:
+        """The reference vectors, with each row being a single vector."""
+        return self._reference_vectors
+
+    @reference_vectors.setter
+    def reference_vectors(self, value: np.ndarray) -> None:
+        self._reference_vectors = value
+        # The geometry of the previous vectors is no longer valid
+        self._geometry = None
+
+    @property
+    def reference_vector_geometry(self) -> ReferenceVectorGeometry:
+        """The cached geometry of the current reference vectors."""
+        if self._geometry is None:
+            self._geometry = ReferenceVectorGeometry(self.reference_vectors)
+        return self._geometry
+
     def _create_simplex(self):
         """Create the reference vectors using simplex lattice design."""
 
@@ -239,6 +532,18 @@ class BaseDecompositionSelector(BaseSelector):
         self.reference_vectors_initial = np.copy(self.reference_vectors)
         self._normalize_rvs()
 
+    def _create_s_energy(self):
+        """Create the reference vectors by minimizing their Riesz s-energy."""
+        if "number_of_vectors" not in self.reference_vector_options:
+            self.reference_vector_options["number_of_vectors"] = 500
+        self.reference_vectors = riesz_s_energy_vectors(
+            num_dims=self.num_dims,
+            num_vectors=self.reference_vector_options["number_of_vectors"],
+            seed=self.reference_vector_options.get("seed", 0),
+        )
+        self.reference_vectors_initial = np.copy(self.reference_vectors)
+        self._normalize_rvs()
+
     def _normalize_rvs(self):
         """Normalize the reference vectors to a unit hypersphere."""
         if self.reference_vector_options["vector_type"] == "spherical":
@@ -397,6 +702,69 @@ class ParameterAdaptationStrategy(Enum):
     OTHER = 3  # As of yet undefined strategies.
 
 
+def _apd_select(
+    translated_targets: np.ndarray,
+    angles: np.ndarray,
+    assigned_vectors: np.ndarray,
+    reference_vectors_gamma: np.ndarray,
+    partial_penalty_factor: float,
+    constraints: np.ndarray | None,
+) -> np.ndarray:
+    """Select the individual with the smallest angle penalized distance (APD) for each reference vector.
+
+    The individuals are grouped by their assigned reference vectors by sorting, so that the selection is done for all
+    the reference vectors at once. If a reference vector has more than one individual assigned to it, the infeasible
+    ones are dropped first. If all of them are infeasible, the ones with the least total constraint violation are kept.
+    Reference vectors left with a single individual select it directly, others select the first individual with the
+    smallest APD. Reference vectors whose APDs are all NaN select no one.
+
+    Args:
+        translated_targets (np.ndarray): The targets of the individuals, translated by the ideal point.
+        angles (np.ndarray): The angle between each individual and its assigned reference vector.
+        assigned_vectors (np.ndarray): The index of the reference vector assigned to each individual.
+        reference_vectors_gamma (np.ndarray): The smallest angle between each reference vector and the others.
+        partial_penalty_factor (float): The partial penalty factor of the APD.
+        constraints (np.ndarray | None): The constraint values of the individuals, or None if there are none.
+
+    Returns:
+        np.ndarray: The indices of the selected individuals, ordered by their reference vectors.
+    """
+    num_vectors = len(reference_vectors_gamma)
+    group_sizes = np.bincount(assigned_vectors, minlength=num_vectors)
+    candidates = np.ones(len(assigned_vectors), dtype=bool)
+
+    if constraints is not None:
+        violation_values = np.maximum(0, constraints)
+        # True if feasible
+        feasible_bool = (violation_values == 0).all(axis=1)
+        total_violation = violation_values.sum(axis=1)
+        any_feasible = np.bincount(assigned_vectors, weights=feasible_bool, minlength=num_vectors) > 0
+        least_violation = np.full(num_vectors, np.inf)
+        np.minimum.at(least_violation, assigned_vectors, total_violation)
+        candidates = np.where(
+            any_feasible[assigned_vectors], feasible_bool, total_violation == least_violation[assigned_vectors]
+        )
+        # Lone individuals are selected regardless of their feasibility
+        candidates[group_sizes[assigned_vectors] == 1] = True
+
+    candidate_index = np.flatnonzero(candidates)
+    groups = assigned_vectors[candidate_index]
+    fitness_magnitude = np.sqrt(np.sum(np.power(translated_targets[candidate_index], 2), axis=1))
+    apd = fitness_magnitude * (
+        1 + partial_penalty_factor * (angles[candidate_index] / reference_vectors_gamma[groups])
+    )
+    apd_is_nan = np.isnan(apd)
+
+    # Sort by reference vector, then NaNs last, then APD, then index, and take the first of each group
+    order = np.lexsort((candidate_index, np.where(apd_is_nan, 0, apd), apd_is_nan, groups))
+    groups = groups[order]
+    first = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(groups) > 0 else np.array([], dtype=int)
+    winners = order[first]
+    # A group of several candidates with only NaN APDs selects no one
+    keep = ~apd_is_nan[winners] | (np.bincount(groups, minlength=num_vectors)[groups[first]] == 1)
+    return candidate_index[winners[keep]]
+
+
 class RVEASelector(BaseDecompositionSelector):
     @property
     def provided_topics(self):
@@ -493,6 +861,53 @@ class RVEASelector(BaseDecompositionSelector):
                 parents[1][self.constraints_symbols].vstack(offsprings[1][self.constraints_symbols]).to_numpy()
             )
 
+        selection = self._select(targets, constraints)
+
+        self.selection = selection.tolist()
+        self.selected_individuals = solutions[selection]
+        self.selected_targets = alltargets[selection]
+        self.notify()
+        return self.selected_individuals, self.selected_targets
+
+    def do_population(self, parents: Population, offsprings: Population) -> Population:
+        """Perform the selection operation on the arrays of the populations.
+
+        Args:
+            parents (Population): the parent population, with outputs.
+            offsprings (Population): the offspring population, with outputs.
+
+        Returns:
+            Population: The selected individuals.
+        """
+        if len(parents) == 0:
+            raise RuntimeError(
+                "The parents population is empty. Cannot perform selection. This is a known unresolved issue."
+            )
+        combined = parents.concat(offsprings)
+        constraints = (
+            None
+            if self.constraints_symbols is None or len(self.constraints_symbols) == 0
+            else combined.output_columns(self.constraints_symbols)
+        )
+        selection = self._select(combined.output_columns(self.target_symbols), constraints)
+
+        self.selection = selection.tolist()
+        selected = combined.take(selection)
+        self.selected_individuals = selected.solutions_view()
+        self.selected_targets = selected.outputs_view()
+        self.notify()
+        return selected
+
+    def _select(self, targets: np.ndarray, constraints: np.ndarray | None) -> np.ndarray:
+        """Select the individuals based on the angle penalized distances.
+
+        Args:
+            targets (np.ndarray): the targets of the individuals to select from.
+            constraints (np.ndarray | None): the constraint values of the individuals, or None if there are none.
+
+        Returns:
+            np.ndarray: the indices of the selected individuals.
+        """
         if self.ideal is None:
             self.ideal = np.min(targets, axis=0)
         else:
@@ -511,72 +926,19 @@ class RVEASelector(BaseDecompositionSelector):
         # Has to be checked!
         targets_norm[targets_norm == 0] = np.finfo(float).eps
         normalized_targets = np.divide(translated_targets, targets_norm)  # Checked, works.
-        cosine = np.dot(normalized_targets, np.transpose(ref_vectors))
-        if cosine[np.where(cosine > 1)].size:
-            cosine[np.where(cosine > 1)] = 1
-        if cosine[np.where(cosine < 0)].size:
-            cosine[np.where(cosine < 0)] = 0
-        # Calculation of angles between reference vectors and solutions
-        theta = np.arccos(cosine)
+        cosine = np.clip(np.dot(normalized_targets, np.transpose(ref_vectors)), 0, 1)
         # Reference vector assignment
         assigned_vectors = np.argmax(cosine, axis=1)
-        selection = np.array([], dtype=int)
-        # Selection
-        # Convert zeros to eps to avoid divide by zero.
-        # Has to be checked!
-        ref_vectors[ref_vectors == 0] = np.finfo(float).eps
-        for i in range(len(ref_vectors)):
-            sub_population_index = np.atleast_1d(np.squeeze(np.where(assigned_vectors == i)))
-
-            # Constraint check
-            if len(sub_population_index) > 1 and constraints is not None:
-                violation_values = constraints[sub_population_index]
-                # violation_values = -violation_values
-                violation_values = np.maximum(0, violation_values)
-                # True if feasible
-                feasible_bool = (violation_values == 0).all(axis=1)
-
-                # Case when entire subpopulation is infeasible
-                if not feasible_bool.any():
-                    violation_values = violation_values.sum(axis=1)
-                    sub_population_index = sub_population_index[np.where(violation_values == violation_values.min())]
-                # Case when only some are infeasible
-                else:
-                    sub_population_index = sub_population_index[feasible_bool]
-
-            sub_population_fitness = translated_targets[sub_population_index]
-            # fast tracking singly selected individuals
-            if len(sub_population_index) == 1:
-                selx = sub_population_index
-                if selection.shape[0] == 0:
-                    selection = np.hstack((selection, np.transpose(selx[0])))
-                else:
-                    selection = np.vstack((selection, np.transpose(selx[0])))
-            elif len(sub_population_index) > 1:
-                # APD Calculation
-                angles = theta[sub_population_index, i]
-                angles = np.divide(angles, self.reference_vectors_gamma[i])  # This is correct.
-                # You have done this calculation before. Check with fitness_norm
-                # Remove this horrible line
-                sub_pop_fitness_magnitude = np.sqrt(np.sum(np.power(sub_population_fitness, 2), axis=1))
-                apd = np.multiply(
-                    np.transpose(sub_pop_fitness_magnitude),
-                    (1 + np.dot(partial_penalty_factor, angles)),
-                )
-                minidx = np.where(apd == np.nanmin(apd))
-                if np.isnan(apd).all():
-                    continue
-                selx = sub_population_index[minidx]
-                if selection.shape[0] == 0:
-                    selection = np.hstack((selection, np.transpose(selx[0])))
-                else:
-                    selection = np.vstack((selection, np.transpose(selx[0])))
-
-        self.selection = selection.tolist()
-        self.selected_individuals = solutions[selection.flatten()]
-        self.selected_targets = alltargets[selection.flatten()]
-        self.notify()
-        return self.selected_individuals, self.selected_targets
+        # Calculation of angles between solutions and their assigned reference vectors
+        angles = np.arccos(cosine[np.arange(len(cosine)), assigned_vectors])
+        return _apd_select(
+            translated_targets,
+            angles,
+            assigned_vectors,
+            self.reference_vectors_gamma,
+            partial_penalty_factor,
+            constraints,
+        )
 
     def _partial_penalty_factor(self) -> float:
         """Calculate and return the partial penalty factor for APD calculation.
@@ -675,20 +1037,16 @@ class RVEASelector(BaseDecompositionSelector):
         return state_verbose
 
     def _adapt(self):
-        self.adapted_reference_vectors = self.reference_vectors
-        if self.ideal is not None and self.nadir is not None:
-            for i in range(self.reference_vectors.shape[0]):
-                self.adapted_reference_vectors[i] = self.reference_vectors[i] * (self.nadir - self.ideal)
-        self.adapted_reference_vectors = (
-            self.adapted_reference_vectors / np.linalg.norm(self.adapted_reference_vectors, axis=1)[:, None]
-        )
+        """Adapt the reference vectors to the current range of the objectives.
 
-        # More efficient way to calculate the gamma values
-        self.reference_vectors_gamma = np.arccos(
-            np.dot(self.adapted_reference_vectors, np.transpose(self.adapted_reference_vectors))
-        )
-        self.reference_vectors_gamma[np.where(self.reference_vectors_gamma == 0)] = np.inf
-        self.reference_vectors_gamma = np.min(self.reference_vectors_gamma, axis=1)
+        The adapted vectors and their angles are taken from the cached geometry, which is only recomputed when the
+        ideal or nadir point has changed since the previous adaptation.
+        """
+        scale = self.nadir - self.ideal if self.ideal is not None and self.nadir is not None else None
+        geometry = self.reference_vector_geometry
+        geometry.adapt(scale)
+        self.adapted_reference_vectors = geometry.adapted_vectors
+        self.reference_vectors_gamma = geometry.gamma
 
 
 class NSGAIII_select(BaseDecompositionSelector):
@@ -777,6 +1135,53 @@ class NSGAIII_select(BaseDecompositionSelector):
             constraints = (
                 parents[1][self.constraints_symbols].vstack(offsprings[1][self.constraints_symbols]).to_numpy()
             )
+        final_selection = self._select(targets, constraints)
+
+        self.selection = final_selection.tolist()
+        if isinstance(solutions, pl.DataFrame) and self.selection is not None:
+            self.selected_individuals = solutions[self.selection]
+        elif isinstance(solutions, list) and self.selection is not None:
+            self.selected_individuals = [solutions[i] for i in self.selection]
+        else:
+            raise RuntimeError("Something went wrong with the selection")
+        self.selected_targets = alltargets[self.selection]
+
+        self.notify()
+        return self.selected_individuals, self.selected_targets
+
+    def do_population(self, parents: Population, offsprings: Population) -> Population:
+        """Perform the selection operation on the arrays of the populations.
+
+        Args:
+            parents (Population): the parent population, with outputs.
+            offsprings (Population): the offspring population, with outputs.
+
+        Returns:
+            Population: The selected individuals.
+        """
+        combined = parents.concat(offsprings)
+        constraints = (
+            None if self.constraints_symbols is None else combined.output_columns(self.constraints_symbols)
+        )
+        final_selection = self._select(combined.output_columns(self.target_symbols), constraints)
+
+        self.selection = final_selection.tolist()
+        selected = combined.take(final_selection)
+        self.selected_individuals = selected.solutions_view()
+        self.selected_targets = selected.outputs_view()
+        self.notify()
+        return selected
+
+    def _select(self, targets: np.ndarray, constraints: np.ndarray | None) -> np.ndarray:
+        """Select the individuals based on non-dominated sorting and niching.
+
+        Args:
+            targets (np.ndarray): the targets of the individuals to select from.
+            constraints (np.ndarray | None): the constraint values of the individuals, or None if there are none.
+
+        Returns:
+            np.ndarray: the indices of the selected individuals.
+        """
         ref_dirs = self.reference_vectors
 
         if self.ideal is None:
@@ -786,8 +1191,7 @@ class NSGAIII_select(BaseDecompositionSelector):
         fitness = targets
         # Calculating fronts and ranks
         # fronts, dl, dc, rank = nds(fitness)
-        fronts = fast_non_dominated_sort(fitness)
-        fronts = [np.where(fronts[i])[0] for i in range(len(fronts))]
+        fronts = fast_non_dominated_sort_indices(fitness)
         non_dominated = fronts[0]
 
         if self.worst_fitness is None:
@@ -856,17 +1260,7 @@ class NSGAIII_select(BaseDecompositionSelector):
         else:
             final_selection = selection
 
-        self.selection = final_selection.tolist()
-        if isinstance(solutions, pl.DataFrame) and self.selection is not None:
-            self.selected_individuals = solutions[self.selection]
-        elif isinstance(solutions, list) and self.selection is not None:
-            self.selected_individuals = [solutions[i] for i in self.selection]
-        else:
-            raise RuntimeError("Something went wrong with the selection")
-        self.selected_targets = alltargets[self.selection]
-
-        self.notify()
-        return self.selected_individuals, self.selected_targets
+        return final_selection
 
     def get_extreme_points_c(self, F, ideal_point, extreme_points=None):
         """Taken from pymoo"""
@@ -1051,7 +1445,6 @@ class NSGAIII_select(BaseDecompositionSelector):
         pass
 
 
-@njit
 def _ibea_fitness(fitness_components: np.ndarray, kappa: float) -> np.ndarray:
     """Calculates the IBEA fitness for each individual based on pairwise fitness components.
 
@@ -1062,13 +1455,9 @@ def _ibea_fitness(fitness_components: np.ndarray, kappa: float) -> np.ndarray:
     Returns:
         np.ndarray: The IBEA fitness values for each individual.
     """
-    num_individuals = fitness_components.shape[0]
-    fitness = np.zeros(num_individuals)
-    for i in range(num_individuals):
-        for j in range(num_individuals):
-            if i != j:
-                fitness[i] -= np.exp(-fitness_components[j, i] / kappa)
-    return fitness
+    contributions = np.exp(-np.asarray(fitness_components, dtype=np.float64) / kappa)
+    # The fitness of an individual is the sum over the other individuals, so the diagonal is excluded
+    return np.diagonal(contributions) - contributions.sum(axis=0)
 
 
 @njit
@@ -1104,37 +1493,38 @@ def _ibea_select(fitness_components: np.ndarray, bad_sols: np.ndarray, kappa: fl
 def _ibea_select_all(fitness_components: np.ndarray, population_size: int, kappa: float) -> np.ndarray:
     """Selects all individuals based on the IBEA indicator.
 
+    The individual with the worst fitness is removed one at a time, and the fitness of the remaining individuals is
+    updated incrementally by removing the contribution of the removed individual.
+
     Args:
         fitness_components (np.ndarray): The pairwise fitness components of the individuals.
         population_size (int): The desired size of the population after selection.
         kappa (float): The kappa value for the IBEA selection.
 
     Returns:
-        list[int]: The list of indices of the selected individuals.
+        np.ndarray: A boolean mask of the selected individuals.
     """
-    current_pop_size = len(fitness_components)
-    bad_sols = np.zeros(current_pop_size, dtype=np.bool_)
-    fitness = np.zeros(len(fitness_components))
-    mod_fit_components = np.exp(-fitness_components / kappa)
-    for i in range(len(fitness_components)):
-        for j in range(len(fitness_components)):
-            if i == j:
-                continue
-            fitness[i] -= mod_fit_components[j, i]
-    while current_pop_size - sum(bad_sols) > population_size:
-        selected = np.argmin(fitness)
-        if fitness[selected] >= 0:
-            if sum(bad_sols) == len(fitness_components) - 1:
-                # If all but one individual is chosen, select the last one
-                selected = np.where(~bad_sols)[0][0]
-            raise RuntimeError("All individuals have non-negative fitness. Cannot select a new individual.")
-        fitness[selected] = np.inf  # Make sure that this individual is not selected again
+    n_individuals = len(fitness_components)
+    fitness = np.zeros(n_individuals)
+    # Go through the matrix row by row, which is the order it is stored in
+    for j in range(n_individuals):
+        for i in range(n_individuals):
+            if i != j:
+                fitness[i] -= np.exp(-fitness_components[j, i] / kappa)
+
+    bad_sols = np.zeros(n_individuals, dtype=np.bool_)
+    current_pop_size = n_individuals
+    while current_pop_size > population_size:
+        selected = -1
+        for i in range(n_individuals):
+            if not bad_sols[i] and (selected == -1 or fitness[i] < fitness[selected]):
+                selected = i
         bad_sols[selected] = True
-        for i in range(len(mod_fit_components)):
-            if bad_sols[i]:
-                continue
+        current_pop_size -= 1
         # Update fitness of the remaining individuals
-            fitness[i] += mod_fit_components[selected, i]
+        for i in range(n_individuals):
+            if not bad_sols[i]:
+                fitness[i] += np.exp(-fitness_components[selected, i] / kappa)
     return ~bad_sols
 
 
@@ -1166,6 +1556,7 @@ class IBEA_Selector(BaseSelector):
         population_size: int,
         kappa: float = 0.05,
         binary_indicator: Callable[[np.ndarray], np.ndarray] = self_epsilon,
+        indicator_dtype: type[np.floating] = np.float64,
     ):
         """Initialize the IBEA selector.
 
@@ -1177,6 +1568,9 @@ class IBEA_Selector(BaseSelector):
             kappa (float, optional): The kappa value for the IBEA selection. Defaults to 0.05.
             binary_indicator (Callable[[np.ndarray], np.ndarray], optional): The binary indicator function to use.
                 Defaults to self_epsilon with uses binary addaptive epsilon indicator.
+            indicator_dtype (type[np.floating], optional): The dtype of the targets given to the binary indicator. With
+                np.float32, the indicators in `desdeo.tools.indicators_binary` compute the pairwise matrix in float32,
+                halving the memory needed for large populations. Defaults to np.float64.
         """
         super().__init__(problem=problem, verbosity=verbosity, publisher=publisher)
         self.selection: list[int] | None = None
@@ -1185,6 +1579,7 @@ class IBEA_Selector(BaseSelector):
         self.binary_indicator = binary_indicator
         self.kappa = kappa
         self.population_size = population_size
+        self.indicator_dtype = indicator_dtype
 
     def do(
         self, parents: tuple[SolutionType, pl.DataFrame], offsprings: tuple[SolutionType, pl.DataFrame]
@@ -1219,7 +1614,7 @@ class IBEA_Selector(BaseSelector):
         target_max = np.max(target_vals, axis=0)
         # Scale the targets to the range [0, 1]
         target_vals = (target_vals - target_min) / (target_max - target_min)
-        fitness_components = self.binary_indicator(target_vals)
+        fitness_components = self.binary_indicator(target_vals.astype(self.indicator_dtype))
         kappa_mult = np.max(np.abs(fitness_components))
 
         chosen = _ibea_select_all(
@@ -1229,7 +1624,9 @@ class IBEA_Selector(BaseSelector):
         self.selected_targets = alltargets.filter(chosen)
         self.selection = chosen
 
-        fitness_components = fitness_components[chosen][:, chosen]
+        # Take the rows and columns of the survivors in one go
+        survivors = np.flatnonzero(chosen)
+        fitness_components = fitness_components[np.ix_(survivors, survivors)]
         self.fitness = _ibea_fitness(fitness_components, kappa=self.kappa * np.abs(fitness_components).max())
 
         self.notify()
@@ -1283,3 +1680,169 @@ class IBEA_Selector(BaseSelector):
 
     def update(self, message: Message) -> None:
         pass
+
+
+class HypervolumeSelector(BaseSelector):
+    """The hypervolume based selection operator of SMS-EMOA.
+
+    The individuals are sorted into non-dominated fronts, and the fronts are added to the selection one at a time. The
+    individuals of the front that does not fit entirely are removed one at a time, always removing the individual with
+    the least exclusive hypervolume contribution in the front. The contributions are kept up to date with
+    :py:class:`desdeo.tools.indicators_unary.HypervolumeContributions`, so the hypervolume is not recomputed for
+    each removal.
+
+    Reference: Beume, N., Naujoks, B., Emmerich, M. (2007). SMS-EMOA: Multiobjective selection based on dominated
+    hypervolume. European Journal of Operational Research, 181(3), 1653-1669.
+    https://doi.org/10.1016/j.ejor.2006.08.008
+    """
+
+    @property
+    def provided_topics(self):
+        return {
+            0: [],
+            1: [SelectorMessageTopics.STATE],
+            2: [SelectorMessageTopics.STATE, SelectorMessageTopics.SELECTED_VERBOSE_OUTPUTS],
+        }
+
+    @property
+    def interested_topics(self):
+        return []
+
+    def __init__(
+        self,
+        problem: Problem,
+        verbosity: int,
+        publisher: Publisher,
+        population_size: int,
+        reference_point_component: float = 1.1,
+        n_samples: int = 100_000,
+        seed: int = 0,
+    ):
+        """Initialize the hypervolume selector.
+
+        Args:
+            problem (Problem): The problem to solve.
+            verbosity (int): The verbosity level of the selector.
+            publisher (Publisher): The publisher to send messages to.
+            population_size (int): The size of the population to select.
+            reference_point_component (float, optional): The components of the reference point. The targets are
+                normalized so that the ideal and nadir of the individuals are zero and one, respectively. Defaults
+                to 1.1.
+            n_samples (int, optional): The number of samples used to approximate the hypervolume contributions with
+                more than three objectives. Defaults to 100_000.
+            seed (int, optional): The seed of the samples. Defaults to 0.
+        """
+        super().__init__(problem=problem, verbosity=verbosity, publisher=publisher)
+        self.population_size = population_size
+        self.reference_point_component = reference_point_component
+        self.n_samples = n_samples
+        self.seed = seed
+        self.selection: list[int] | None = None
+        self.selected_individuals: SolutionType | None = None
+        self.selected_targets: pl.DataFrame | None = None
+
+    def do(
+        self, parents: tuple[SolutionType, pl.DataFrame], offsprings: tuple[SolutionType, pl.DataFrame]
+    ) -> tuple[SolutionType, pl.DataFrame]:
+        """Perform the selection operation.
+
+        Args:
+            parents (tuple[SolutionType, pl.DataFrame]): the decision variables as the first element.
+                The second element is the objective values, targets, and constraint violations.
+            offsprings (tuple[SolutionType, pl.DataFrame]): the decision variables as the first element.
+                The second element is the objective values, targets, and constraint violations.
+
+        Returns:
+            tuple[SolutionType, pl.DataFrame]: The selected decision variables and their objective values,
+                targets, and constraint violations.
+        """
+        if self.constraints_symbols is not None:
+            raise NotImplementedError(
+                "Hypervolume selector does not support constraints. Please use a different selector."
+            )
+        if isinstance(parents[0], pl.DataFrame) and isinstance(offsprings[0], pl.DataFrame):
+            solutions = parents[0].vstack(offsprings[0])
+        elif isinstance(parents[0], list) and isinstance(offsprings[0], list):
+            solutions = parents[0] + offsprings[0]
+        else:
+            raise TypeError("The decision variables must be either a list or a polars DataFrame, not both")
+        alltargets = parents[1].vstack(offsprings[1])
+
+        selection = self._select(alltargets[self.target_symbols].to_numpy())
+        self.selection = selection.tolist()
+        if isinstance(solutions, pl.DataFrame):
+            self.selected_individuals = solutions[self.selection]
+        else:
+            self.selected_individuals = [solutions[i] for i in self.selection]
+        self.selected_targets = alltargets[self.selection]
+
+        self.notify()
+        return self.selected_individuals, self.selected_targets
+
+    def _select(self, targets: np.ndarray) -> np.ndarray:
+        """Select the individuals based on non-dominated sorting and hypervolume contributions.
+
+        Args:
+            targets (np.ndarray): the targets of the individuals to select from.
+
+        Returns:
+            np.ndarray: the indices of the selected individuals.
+        """
+        selection: list[np.ndarray] = []
+        n_selected = 0
+        for front in fast_non_dominated_sort_indices(targets):
+            if n_selected + len(front) <= self.population_size:
+                selection.append(front)
+                n_selected += len(front)
+                continue
+            if n_selected < self.population_size:
+                # Normalize the targets so that a single reference point suits all the objectives
+                target_min = np.min(targets, axis=0)
+                target_range = np.max(targets, axis=0) - target_min
+                target_range[target_range == 0] = 1
+                contributions = HypervolumeContributions(
+                    (targets[front] - target_min) / target_range,
+                    reference_point=self.reference_point_component,
+                    n_samples=self.n_samples,
+                    seed=self.seed,
+                )
+                while len(contributions) > self.population_size - n_selected:
+                    contributions.remove(contributions.least_contributor())
+                selection.append(front[contributions.ids])
+            break
+        return np.sort(np.concatenate(selection)) if selection else np.array([], dtype=int)
+
+    def state(self) -> Sequence[Message]:
+        """Return the state of the selector."""
+        if self.verbosity == 0 or self.selection is None or self.selected_targets is None:
+            return []
+        state = [
+            DictMessage(
+                topic=SelectorMessageTopics.STATE,
+                value={
+                    "population_size": self.population_size,
+                    "selected_individuals": self.selection,
+                },
+                source=self.__class__.__name__,
+            )
+        ]
+        if self.verbosity == 1:
+            return state
+        # verbosity == 2
+        if isinstance(self.selected_individuals, pl.DataFrame):
+            message = PolarsDataFrameMessage(
+                topic=SelectorMessageTopics.SELECTED_VERBOSE_OUTPUTS,
+                value=pl.concat([self.selected_individuals, self.selected_targets], how="horizontal"),
+                source=self.__class__.__name__,
+            )
+        else:
+            warnings.warn("Population is not a Polars DataFrame. Defaulting to providing OUTPUTS only.", stacklevel=2)
+            message = PolarsDataFrameMessage(
+                topic=SelectorMessageTopics.SELECTED_VERBOSE_OUTPUTS,
+                value=self.selected_targets,
+                source=self.__class__.__name__,
+            )
+        return [*state, message]
+
+    def update(self, message: Message) -> None:
+        pass
@@ -14,6 +14,7 @@ Warning:
 from collections.abc import Sequence
 
 from desdeo.tools.message import (
+    BoolMessage,
     EvaluatorMessageTopics,
     GeneratorMessageTopics,
     IntMessage,
@@ -44,6 +45,7 @@ class BaseTerminator(Subscriber):
                 TerminatorMessageTopics.EVALUATION,
                 TerminatorMessageTopics.MAX_GENERATIONS,
                 TerminatorMessageTopics.MAX_EVALUATIONS,
+                TerminatorMessageTopics.TERMINATION,
             ],
         }
 
@@ -59,6 +61,7 @@ class BaseTerminator(Subscriber):
         self.current_evaluations: int = 0
         self.max_generations: int = 0
         self.max_evaluations: int = 0
+        self.terminated: bool = False
 
     def check(self) -> bool | None:
         """Check if the termination criterion is reached.
@@ -96,6 +99,15 @@ class BaseTerminator(Subscriber):
                     source=self.__class__.__name__,
                 )
             )
+        if self.terminated:
+            # sent once the termination criterion is reached, e.g., for archives to write what they have buffered
+            state.append(
+                BoolMessage(
+                    topic=TerminatorMessageTopics.TERMINATION,
+                    value=True,
+                    source=self.__class__.__name__,
+                )
+            )
         return state
 
     def update(self, message: Message) -> None:
@@ -141,8 +153,9 @@ class MaxGenerationsTerminator(BaseTerminator):
             bool: True if the termination criterion is reached, False otherwise.
         """
         super().check()
+        self.terminated = self.current_generation > self.max_generations
         self.notify()
-        return self.current_generation > self.max_generations
+        return self.terminated
 
 
 # TODO (@light-weaver): This check is done _after_ the evaluations have taken place.
@@ -173,5 +186,6 @@ class MaxEvaluationsTerminator(BaseTerminator):
             bool: True if the termination criterion is reached, False otherwise.
         """
         super().check()
+        self.terminated = self.current_evaluations >= self.max_evaluations
         self.notify()
-        return self.current_evaluations >= self.max_evaluations
+        return self.terminated
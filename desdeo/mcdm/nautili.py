@@ -19,6 +19,7 @@ from desdeo.tools.scalarization import (
     add_asf_generic_diff,
     add_epsilon_constraints,
 )
+from desdeo.tools.subproblem_executor import get_subproblem_executor
 from desdeo.tools.utils import guess_best_solver
 
 
@@ -82,22 +83,24 @@ def solve_reachable_bounds(
     # if a solver creator was provided, use that, else, guess the best one
     solver_init = guess_best_solver(problem) if solver is None else solver
 
-    lower_bounds = {}
-    upper_bounds = {}
-    for objective in problem.objectives:
-        # Lower bounds
-        eps_problem, target, _ = add_epsilon_constraints(
+    # Lower bounds
+    subproblems = [
+        add_epsilon_constraints(
             problem,
             "target",
             {f"{obj.symbol}": f"{obj.symbol}_eps" for obj in problem.objectives},
             objective.symbol,
             const_bounds,
-        )
+        )[:2]
+        for objective in problem.objectives
+    ]
 
-        # solve
-        solver = solver_init(eps_problem)
-        res = solver.solve(target)
+    # the problems are independent, and can be solved in parallel
+    results = get_subproblem_executor().solve(subproblems, solver_init)
 
+    lower_bounds = {}
+    upper_bounds = {}
+    for objective, res in zip(problem.objectives, results, strict=True):
         if not res.success:
             # could not optimize eps problem
             msg = (
@@ -7,13 +7,17 @@ optimization without trading-off." Journal of Global Optimization 74.2 (2019):
 213-231.
 """
 
+import gurobipy as gp
 import numpy as np
+import pyomo.environ as pyomo
 from pydantic import BaseModel, Field
 
 from desdeo.problem import (
     Constraint,
     ConstraintTypeEnum,
+    GurobipyEvaluator,
     Problem,
+    PyomoEvaluator,
     ScalarizationFunction,
     get_nadir_dict,
     numpy_array_to_objective_dict,
@@ -25,6 +29,7 @@ from desdeo.tools.scalarization import (
     add_asf_nondiff,
     add_epsilon_constraints,
 )
+from desdeo.tools.subproblem_executor import get_subproblem_executor
 from desdeo.tools.utils import guess_best_solver
 
 
@@ -129,8 +134,7 @@ def solve_reachable_bounds(
     # if a solver creator was provided, use that, else, guess the best one
     solver_init = guess_best_solver(problem) if solver is None else solver
 
-    lower_bounds = {}
-    upper_bounds = {}
+    subproblems = []
     for objective in problem.objectives:
         # Lower bounds
         eps_problem, target, eps_symbols = add_epsilon_constraints(
@@ -157,31 +161,9 @@ def solve_reachable_bounds(
             ]
             eps_problem = eps_problem.add_constraints(bound_constraints)
 
-        # solve
-        solver = solver_init(eps_problem)
-        res = solver.solve(target)
-
-        if not res.success:
-            # could not optimize eps problem
-            msg = (
-                f"Optimizing the epsilon constrait problem for the objective "
-                f"{objective.symbol} was not successful. Reason: {res.message}"
-            )
-            raise NautilusNavigatorError(msg)
-
-        lower_bound = res.optimal_objectives[objective.symbol]
-
-        if isinstance(lower_bound, list):
-            lower_bound = lower_bound[0]
+        subproblems.append((eps_problem, target))
 
         # solver upper bounds
-        eps_problem, target, eps_symbols = add_epsilon_constraints(
-            problem,
-            "target",
-            {f"{obj.symbol}": f"{obj.symbol}_eps" for obj in problem.objectives},
-            objective.symbol,
-            const_bounds,
-        )
         # We need to add a constrant related to the target objective to bound it to the navigation point
         # Maybe there should be a replacement to "create_epsilon_constraints_json" that allows for this
         # for now, we will add the constraint manually
@@ -226,18 +208,29 @@ def solve_reachable_bounds(
         else:
             eps_problem = eps_problem.add_constraints([bound_to_nav_constraint])
 
-        # solve
-        solver = solver_init(eps_problem)
-        res = solver.solve(target)
-        if not res.success:
-            # could not optimize eps problem
-            msg = (
-                f"Optimizing the epsilon constrait problem for the objective "
-                f"{objective.symbol} was not successful. Reason: {res.message}"
-            )
-            raise NautilusNavigatorError(msg)
+        subproblems.append((eps_problem, target))
+
+    # the lower and upper bound problems are independent, and can be solved in parallel
+    results = get_subproblem_executor().solve(subproblems, solver_init)
+
+    lower_bounds = {}
+    upper_bounds = {}
+    for i, objective in enumerate(problem.objectives):
+        for res in results[2 * i : 2 * i + 2]:
+            if not res.success:
+                # could not optimize eps problem
+                msg = (
+                    f"Optimizing the epsilon constrait problem for the objective "
+                    f"{objective.symbol} was not successful. Reason: {res.message}"
+                )
+                raise NautilusNavigatorError(msg)
 
-        upper_bound = res.optimal_objectives[objective.symbol]
+        lower_bound = results[2 * i].optimal_objectives[objective.symbol]
+
+        if isinstance(lower_bound, list):
+            lower_bound = lower_bound[0]
+
+        upper_bound = results[2 * i + 1].optimal_objectives[objective.symbol]
 
         if isinstance(upper_bound, list):
             upper_bound = upper_bound[0]
@@ -255,6 +248,199 @@ def solve_reachable_bounds(
     return lower_bounds, upper_bounds
 
 
+class NavigatorSession:
+    """A persistent session for computing the reachable bounds of NAUTILUS Navigator.
+
+    `solve_reachable_bounds` builds a new epsilon constraint problem, and a new solver model, for each of the 2k
+    optimization problems solved at every navigation step. The session instead builds the solver model once. Between
+    the solves, only the right-hand sides of the epsilon and bound constraints, and the optimization target, are
+    changed in the model. Each of the 2k optimization problems is also warm-started from its solution at the previous
+    navigation step.
+
+    The reachable bounds are computed in place for solvers based on Pyomo and gurobipy models. With any other solver,
+    the session falls back to `solve_reachable_bounds`.
+    """
+
+    def __init__(self, problem: Problem, solver: BaseSolver | None = None, bound_th: float = 1e-3):
+        """Initialize the session and build the solver model.
+
+        Args:
+            problem (Problem): the problem being solved.
+            solver (BaseSolver | None, optional): solver used to solve the problem.
+                If None, then a solver is utilized bases on the problem's properties. Defaults to None.
+            bound_th (float, optional): a threshold for comparing the bounds to the set epsilon constraints.
+        """
+        self.problem = problem
+        self.bound_th = bound_th
+        self.solver_init = guess_best_solver(problem) if solver is None else solver
+
+        self._symbols = [objective.symbol for objective in problem.objectives]
+        # the upper bounds are computed by minimizing the negated objectives
+        self._max_targets = [f"_nav_max_{symbol}" for symbol in self._symbols]
+        self._problem = problem
+        for target, objective in zip(self._max_targets, problem.objectives, strict=True):
+            self._problem = self._problem.add_scalarization(
+                ScalarizationFunction(
+                    symbol=target,
+                    name=f"Max objective {objective.symbol}",
+                    func=["Negate", f"{objective.symbol}_min"],
+                    is_linear=objective.is_linear,
+                    is_convex=objective.is_convex,
+                    is_twice_differentiable=objective.is_twice_differentiable,
+                )
+            )
+
+        self.solver = self.solver_init(self._problem)
+        evaluator = getattr(self.solver, "evaluator", None)
+        if isinstance(evaluator, PyomoEvaluator):
+            self._init_pyomo(evaluator.model)
+        elif isinstance(evaluator, GurobipyEvaluator):
+            self._init_gurobipy(evaluator.model)
+        else:
+            self.solver = None
+
+        # the solutions of the previous navigation step, used as the starting points
+        self._starts: dict[tuple[int, bool], list[float]] = {}
+
+    @property
+    def is_persistent(self) -> bool:
+        """Whether the solver model is built once and updated in place."""
+        return self.solver is not None
+
+    def _init_pyomo(self, model: pyomo.Model):
+        """Add the constraints on the objectives to a Pyomo model, with mutable right-hand sides."""
+        indices = range(len(self._symbols))
+        model.nav_rhs = pyomo.Param(indices, mutable=True, initialize=0.0, domain=pyomo.Reals)
+        model.nav_constraints = pyomo.Constraint(
+            indices, rule=lambda m, i: getattr(m, f"{self._symbols[i]}_min") <= m.nav_rhs[i]
+        )
+        self._variables = list(model.component_data_objects(pyomo.Var, descend_into=True))
+        self._set_rhs = self._set_pyomo_rhs
+        self._get_solution = lambda: [variable.value for variable in self._variables]
+        self._set_start = self._set_pyomo_start
+
+    def _set_pyomo_rhs(self, rhs: list[float]):
+        model = self.solver.evaluator.model
+        for i, value in enumerate(rhs):
+            if np.isfinite(value):
+                model.nav_rhs[i] = value
+                model.nav_constraints[i].activate()
+            else:
+                model.nav_constraints[i].deactivate()
+
+    def _set_pyomo_start(self, start: list[float]):
+        for variable, value in zip(self._variables, start, strict=True):
+            if value is not None and not variable.fixed:
+                variable.set_value(value, skip_validation=True)
+
+    def _init_gurobipy(self, model: gp.Model):
+        """Add the constraints on the objectives to a gurobipy model.
+
+        Each objective is bounded by an auxiliary variable, so that the right-hand sides are updated by changing the
+        upper bounds of the variables. When only the bounds change, gurobi reuses the previous basis of the model.
+        """
+        evaluator = self.solver.evaluator
+        self._rhs_variables = []
+        for symbol in self._symbols:
+            rhs_variable = model.addVar(lb=-gp.GRB.INFINITY, ub=gp.GRB.INFINITY, name=f"_nav_rhs_{symbol}")
+            model.addConstr(evaluator.get_expression_by_name(f"{symbol}_min") <= rhs_variable)
+            self._rhs_variables.append(rhs_variable)
+        model.update()
+        self._variables = model.getVars()
+        self._set_rhs = self._set_gurobipy_rhs
+        self._get_solution = lambda: model.getAttr(gp.GRB.Attr.X, self._variables)
+        self._set_start = lambda start: model.setAttr(gp.GRB.Attr.Start, self._variables, start)
+
+    def _set_gurobipy_rhs(self, rhs: list[float]):
+        for rhs_variable, value in zip(self._rhs_variables, rhs, strict=True):
+            rhs_variable.UB = value if np.isfinite(value) else gp.GRB.INFINITY
+
+    def _solve(self, index: int, rhs: list[float], *, maximize: bool) -> float:
+        """Solve one of the epsilon constraint problems and return the value of the optimized objective."""
+        self._set_rhs(rhs)
+        if (start := self._starts.get((index, maximize))) is not None:
+            self._set_start(start)
+
+        symbol = self._symbols[index]
+        res = self.solver.solve(self._max_targets[index] if maximize else f"{symbol}_min")
+        if not res.success:
+            # could not optimize eps problem
+            msg = (
+                f"Optimizing the epsilon constrait problem for the objective "
+                f"{symbol} was not successful. Reason: {res.message}"
+            )
+            raise NautilusNavigatorError(msg)
+        self._starts[(index, maximize)] = self._get_solution()
+
+        value = res.optimal_objectives[symbol]
+        return value[0] if isinstance(value, list) else value
+
+    def solve_reachable_bounds(
+        self, navigation_point: dict[str, float], bounds: dict[str, float] | None = None
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """Computes the current reachable (upper and lower) bounds of the solutions in the objective space.
+
+        The bounds are the same as computed by `solve_reachable_bounds`.
+
+        Args:
+            navigation_point (dict[str, float]): the navigation point limiting the
+                reachable area. The key is the objective function's symbol and the value
+                the navigation point.
+            bounds (dict[str, float]): the user provided bounds preference.
+
+        Raises:
+            NautilusNavigationError: when optimization of an epsilon constraint problem is not successful.
+
+        Returns:
+            tuple[dict[str, float], dict[str, float]]: a tuple of dicts, where the first dict are the lower bounds and
+                the second element the upper bounds, the key is the symbol of each objective.
+        """
+        if not self.is_persistent:
+            return solve_reachable_bounds(
+                self.problem, navigation_point, bounds=bounds, solver=self.solver_init, bound_th=self.bound_th
+            )
+
+        objectives = self.problem.objectives
+        # the navigation point and the bounds when each objective is to be minimized
+        const_bounds = [
+            -navigation_point[obj.symbol] if obj.maximize else navigation_point[obj.symbol] for obj in objectives
+        ]
+        user_bounds = (
+            [-bounds[obj.symbol] if obj.maximize else bounds[obj.symbol] for obj in objectives]
+            if bounds is not None
+            else [np.inf] * len(objectives)
+        )
+
+        lower_bounds = {}
+        upper_bounds = {}
+        for i, objective in enumerate(objectives):
+            # the lower bound is subject to the epsilon constraints of the other objectives
+            lower_bound = self._solve(
+                i,
+                [user_bounds[j] if j == i else min(const_bounds[j], user_bounds[j]) for j in range(len(objectives))],
+                maximize=False,
+            )
+
+            # the upper bound is subject to the navigation point of the objective itself
+            upper_bound = self._solve(
+                i,
+                [min(const_bounds[j], user_bounds[j]) if j == i else user_bounds[j] for j in range(len(objectives))],
+                maximize=True,
+            )
+
+            if not (abs(upper_bound * (-1 if objective.maximize else 1) - const_bounds[i]) < self.bound_th) and (
+                upper_bound * (-1 if objective.maximize else 1) > const_bounds[i]
+            ):
+                msg = "The upper bound is worse than the navigation point. This should not happen."
+                raise NautilusNavigatorError(msg)
+
+            # add the lower and upper bounds logically depending whether an objective is to be maximized or minimized
+            lower_bounds[objective.symbol] = lower_bound if not objective.maximize else upper_bound
+            upper_bounds[objective.symbol] = upper_bound if not objective.maximize else lower_bound
+
+        return lower_bounds, upper_bounds
+
+
 def solve_reachable_solution(
     problem: Problem,
     reference_point: dict[str, float],
@@ -406,6 +592,7 @@ def navigator_step(  # NOQA: PLR0913
     solver: BaseSolver | None = None,
     reference_point: dict | None = None,
     reachable_solution: dict[str, float] | None = None,
+    session: NavigatorSession | None = None,
 ) -> NAUTILUS_Response:
     """Performs a step of the NAUTILUS method.
 
@@ -422,6 +609,9 @@ def navigator_step(  # NOQA: PLR0913
         bounds (dict | None, optional): The bounds of the problem provided by the DM. Defaults to None.
         reachable_solution (dict | None, optional): The previous reachable solution. Must only be provided if the DM
         has not changed their preference. Defaults to None.
+        session (NavigatorSession | None, optional): A session used to compute the reachable bounds. When
+            stepping repeatedly, the same session should be passed to each step. Defaults to None, in which case
+            the reachable bounds are computed with `solve_reachable_bounds`.
 
     Raises:
         NautilusNavigatorError: If neither reference_point nor reachable_solution is provided.
@@ -447,7 +637,10 @@ def navigator_step(  # NOQA: PLR0913
 
     # update_bounds
 
-    lower_bounds, upper_bounds = solve_reachable_bounds(problem, new_nav_point, solver=solver, bounds=bounds)
+    if session is not None:
+        lower_bounds, upper_bounds = session.solve_reachable_bounds(new_nav_point, bounds=bounds)
+    else:
+        lower_bounds, upper_bounds = solve_reachable_bounds(problem, new_nav_point, solver=solver, bounds=bounds)
 
     distance = calculate_distance_to_front(problem, new_nav_point, reachable_point)
 
@@ -472,6 +665,7 @@ def navigator_all_steps(
     previous_responses: list[NAUTILUS_Response],
     bounds: dict | None = None,
     solver: BaseSolver | None = None,
+    session: NavigatorSession | None = None,
 ):
     """Performs all steps of the NAUTILUS method.
 
@@ -490,12 +684,17 @@ def navigator_all_steps(
         previous_responses (list[NAUTILUS_Response]): The previous responses of the method.
         solver (BaseSolver | None, optional): The solver to use. Defaults to None, in which case the
             algorithm will guess the best solver for the problem.
+        session (NavigatorSession | None, optional): The session used to compute the reachable bounds. Defaults to
+            None, in which case a new session is created for the steps.
 
     Returns:
         list[NAUTILUS_Response]: The new responses of the method after all steps. Note, as only new responses are
             returned, the length of the list is equal to "steps_remaining". The analyst should append these responses
             to the "previous_responses" list to keep track of the entire process.
     """
+    if session is None:
+        session = NavigatorSession(problem, solver=solver)
+
     responses: list[NAUTILUS_Response] = []
     nav_point = previous_responses[-1].navigation_point
     step_number = previous_responses[-1].step_number + 1
@@ -511,6 +710,7 @@ def navigator_all_steps(
                 reference_point=reference_point,
                 bounds=bounds,
                 solver=solver,
+                session=session,
             )
             first_iteration = False
         else:
@@ -522,6 +722,7 @@ def navigator_all_steps(
                 reachable_solution=reachable_solution,
                 bounds=bounds,
                 solver=solver,
+                session=session,
             )
         response.reference_point = reference_point
         responses.append(response)
@@ -29,6 +29,7 @@ from desdeo.tools import (
     add_nimbus_sf_nondiff,
     add_stom_sf_diff,
     add_stom_sf_nondiff,
+    get_subproblem_executor,
     guess_best_solver,
 )
 
@@ -113,19 +114,13 @@ def solve_intermediate_solutions(  # noqa: PLR0913
 
     # for each reference point, add and solve the ASF scalarization problem
     # projecting the reference point onto the Pareto optimal front of the problem.
-    # TODO(gialmisi): this can be done in parallel.
-    intermediate_solutions = []
-    for rp in reference_points:
-        # add scalarization
-        add_asf = add_asf_diff if problem.is_twice_differentiable else add_asf_nondiff
-        asf_problem, target = add_asf(problem, "target", rp, **(scalarization_options or {}))
-
-        solver = init_solver(asf_problem, _solver_options)
-
-        # solve and store results
-        result: SolverResults = solver.solve(target)
+    add_asf = add_asf_diff if problem.is_twice_differentiable else add_asf_nondiff
+    subproblems = [add_asf(problem, "target", rp, **(scalarization_options or {})) for rp in reference_points]
 
-        intermediate_solutions.append(result)
+    # the subproblems are independent, and can be solved in parallel
+    intermediate_solutions: list[SolverResults] = get_subproblem_executor().solve(
+        subproblems, init_solver, _solver_options
+    )
 
     return intermediate_solutions
 
@@ -307,54 +302,33 @@ def solve_sub_problems(  # noqa: PLR0913
     # objective function values
     classifications = infer_classifications(problem, current_objectives, reference_point)
 
-    solutions = []
-
     # solve the nimbus scalarization problem, this is done always
     add_nimbus_sf = add_nimbus_sf_diff if problem.is_twice_differentiable else add_nimbus_sf_nondiff
 
-    problem_w_nimbus, nimbus_target = add_nimbus_sf(
-        problem, "nimbus_sf", classifications, current_objectives, **(scalarization_options or {})
-    )
-
-    nimbus_solver = init_solver(problem_w_nimbus, _solver_options) if _solver_options else init_solver(problem_w_nimbus)
-
-    solutions.append(nimbus_solver.solve(nimbus_target))
+    subproblems = [
+        add_nimbus_sf(problem, "nimbus_sf", classifications, current_objectives, **(scalarization_options or {}))
+    ]
 
     if num_desired > 1:
         # solve STOM
         add_stom_sf = add_stom_sf_diff if problem.is_twice_differentiable else add_stom_sf_nondiff
 
-        problem_w_stom, stom_target = add_stom_sf(problem, "stom_sf", reference_point, **(scalarization_options or {}))
-        stom_solver = init_solver(problem_w_stom, _solver_options) if _solver_options else init_solver(problem_w_stom)
-
-        solutions.append(stom_solver.solve(stom_target))
+        subproblems.append(add_stom_sf(problem, "stom_sf", reference_point, **(scalarization_options or {})))
 
     if num_desired > 2:  # noqa: PLR2004
         # solve ASF
         add_asf = add_asf_diff if problem.is_twice_differentiable else add_asf_nondiff
 
-        problem_w_asf, asf_target = add_asf(problem, "asf", reference_point, **(scalarization_options or {}))
-
-        asf_solver = init_solver(problem_w_asf, _solver_options) if _solver_options else init_solver(problem_w_asf)
-
-        solutions.append(asf_solver.solve(asf_target))
+        subproblems.append(add_asf(problem, "asf", reference_point, **(scalarization_options or {})))
 
     if num_desired > 3:  # noqa: PLR2004
         # solve GUESS
         add_guess_sf = add_guess_sf_diff if problem.is_twice_differentiable else add_guess_sf_nondiff
 
-        problem_w_guess, guess_target = add_guess_sf(
-            problem, "guess_sf", reference_point, **(scalarization_options or {})
-        )
-
-        if _solver_options:
-            guess_solver = init_solver(problem_w_guess, _solver_options)
-        else:
-            guess_solver = init_solver(problem_w_guess)
-
-        solutions.append(guess_solver.solve(guess_target))
+        subproblems.append(add_guess_sf(problem, "guess_sf", reference_point, **(scalarization_options or {})))
 
-    return solutions
+    # the subproblems are independent, and can be solved in parallel
+    return get_subproblem_executor().solve(subproblems, init_solver, _solver_options)
 
 
 def generate_starting_point(
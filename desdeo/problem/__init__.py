@@ -1,6 +1,8 @@
 """Imports available from the desdeo-problem package."""
 
 __all__ = [
+    "CacheBackend",
+    "CachedEvaluator",
     "Constant",
     "Constraint",
     "ConstraintTypeEnum",
@@ -10,22 +12,29 @@ __all__ = [
     "flatten_variable_dict",
     "FormatEnum",
     "GurobipyEvaluator",
+    "HttpSimulatorOptions",
     "get_nadir_dict",
     "get_ideal_dict",
     "InfixExpressionParser",
+    "LMDBCacheBackend",
     "MathParser",
+    "MemoryCacheBackend",
     "numpy_array_to_objective_dict",
     "objective_dict_to_numpy_array",
     "Objective",
     "ObjectiveTypeEnum",
     "Problem",
     "PyomoEvaluator",
+    "SympyCompilationEnum",
     "SympyEvaluator",
     "tensor_constant_from_dataframe",
     "PolarsEvaluator",
     "PolarsEvaluatorModesEnum",
+    "problem_fingerprint",
+    "PolarsCompilationEnum",
     "ScalarizationFunction",
     "Simulator",
+    "SQLiteCacheBackend",
     "TensorConstant",
     "TensorVariable",
     "unflatten_variable_array",
@@ -46,7 +55,7 @@ from .evaluator import (
 )
 from .gurobipy_evaluator import GurobipyEvaluator
 from .infix_parser import InfixExpressionParser
-from .json_parser import FormatEnum, MathParser
+from .json_parser import FormatEnum, MathParser, PolarsCompilationEnum
 from .pyomo_evaluator import PyomoEvaluator
 from .schema import (
     Constant,
@@ -66,14 +75,25 @@ from .schema import (
     VariableType,
     VariableTypeEnum,
 )
+from .simulator_client import HttpSimulatorOptions
 from .simulator_evaluator import Evaluator
-from .sympy_evaluator import SympyEvaluator
+from .sympy_evaluator import SympyCompilationEnum, SympyEvaluator
 from .utils import (
     flatten_variable_dict,
     get_ideal_dict,
     get_nadir_dict,
     numpy_array_to_objective_dict,
     objective_dict_to_numpy_array,
+    problem_fingerprint,
     tensor_constant_from_dataframe,
     unflatten_variable_array,
 )
+
+# imported last, since the cache depends on the utilities importing from the package
+from .evaluation_cache import (
+    CacheBackend,
+    CachedEvaluator,
+    LMDBCacheBackend,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
@@ -0,0 +1,340 @@
+"""A cache for the results of expensive evaluations of problems.
+
+Many methods evaluate the same decision variables repeatedly, e.g., evolutionary methods evaluating elitist parents
+and offspring clipped to the bounds of the variables, and interactive methods revisiting solutions across
+iterations. When the functions of a problem are expensive, e.g., simulator based, `CachedEvaluator` can be wrapped
+around the evaluator of the problem (`Evaluator` or `PolarsEvaluator`) to only evaluate decision variables that
+have not been evaluated before.
+
+The results are cached row by row, keyed on a hash of the decision variables, rounded to a number of decimals, and
+of the fingerprint of the problem (see `problem_fingerprint`). The results can be cached in memory
+(`MemoryCacheBackend`), in an SQLite database (`SQLiteCacheBackend`), or in an LMDB database (`LMDBCacheBackend`,
+requires the `lmdb` package). The on-disk backends can be shared between runs and processes.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from desdeo.problem.schema import Problem
+from desdeo.problem.utils import problem_fingerprint
+
+
+class CacheBackend(ABC):
+    """The interface of the storages of cached evaluation results.
+
+    The keys are strings and the values are bytes. The backends must be safe to use from many threads.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """Return the cached values of the keys.
+
+        Args:
+            keys (Sequence[str]): the keys.
+
+        Returns:
+            dict[str, bytes]: the values of the keys that are cached. Keys that are not cached are left out.
+        """
+
+    @abstractmethod
+    def set_many(self, items: Mapping[str, bytes]) -> None:
+        """Cache values.
+
+        Args:
+            items (Mapping[str, bytes]): the values to cache, keyed on their keys.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all the cached values."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Caches the values in memory, dropping the least recently used values when full."""
+
+    def __init__(self, max_size: int | None = 100_000):
+        """Initialize the backend.
+
+        Args:
+            max_size (int | None, optional): the maximum number of cached values. If None, the size of the cache
+                is not limited. Defaults to 100 000.
+        """
+        self.max_size = max_size
+        self._values: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:  # noqa: D102
+        with self._lock:
+            found = {}
+            for key in keys:
+                if key in self._values:
+                    self._values.move_to_end(key)
+                    found[key] = self._values[key]
+            return found
+
+    def set_many(self, items: Mapping[str, bytes]) -> None:  # noqa: D102
+        with self._lock:
+            self._values.update(items)
+            for key in items:
+                self._values.move_to_end(key)
+            while self.max_size is not None and len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def clear(self) -> None:  # noqa: D102
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._values)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Caches the values in an SQLite database on disk."""
+
+    _MAX_PARAMETERS = 900
+    """The maximum number of keys looked up in a single query, below the limit of the older SQLite versions."""
+
+    def __init__(self, path: str | Path, table: str = "evaluations"):
+        """Initialize the backend, creating the database if it does not exist.
+
+        Args:
+            path (str | Path): the path to the database file.
+            table (str, optional): the name of the table of the cached values. Defaults to 'evaluations'.
+        """
+        self.path = Path(path)
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (key TEXT PRIMARY KEY, value BLOB)')
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:  # noqa: D102
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), self._MAX_PARAMETERS):
+                chunk = keys[start : start + self._MAX_PARAMETERS]
+                placeholders = ", ".join("?" * len(chunk))
+                found.update(
+                    self._connection.execute(
+                        f'SELECT key, value FROM "{self.table}" WHERE key IN ({placeholders})',  # noqa: S608
+                        list(chunk),
+                    ).fetchall()
+                )
+        return found
+
+    def set_many(self, items: Mapping[str, bytes]) -> None:  # noqa: D102
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f'INSERT OR REPLACE INTO "{self.table}" (key, value) VALUES (?, ?)',  # noqa: S608
+                list(items.items()),
+            )
+
+    def clear(self) -> None:  # noqa: D102
+        with self._lock, self._connection:
+            self._connection.execute(f'DELETE FROM "{self.table}"')  # noqa: S608
+
+    def __len__(self) -> int:  # noqa: D105
+        with self._lock:
+            return self._connection.execute(f'SELECT COUNT(*) FROM "{self.table}"').fetchone()[0]  # noqa: S608
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+
+class LMDBCacheBackend(CacheBackend):
+    """Caches the values in an LMDB database on disk. Requires the `lmdb` package."""
+
+    def __init__(self, path: str | Path, map_size: int = 2**30):
+        """Initialize the backend, creating the database if it does not exist.
+
+        Args:
+            path (str | Path): the path to the directory of the database.
+            map_size (int, optional): the maximum size of the database in bytes. Defaults to 1 GiB.
+
+        Raises:
+            ImportError: the `lmdb` package is not installed.
+        """
+        try:
+            import lmdb
+        except ImportError as e:
+            msg = "The LMDB cache backend requires the 'lmdb' package, which can be installed with 'pip install lmdb'."
+            raise ImportError(msg) from e
+
+        self.path = Path(path)
+        self._environment = lmdb.open(str(self.path), map_size=map_size)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:  # noqa: D102
+        found = {}
+        with self._environment.begin() as transaction:
+            for key in keys:
+                value = transaction.get(key.encode())
+                if value is not None:
+                    found[key] = bytes(value)
+        return found
+
+    def set_many(self, items: Mapping[str, bytes]) -> None:  # noqa: D102
+        with self._environment.begin(write=True) as transaction:
+            for key, value in items.items():
+                transaction.put(key.encode(), value)
+
+    def clear(self) -> None:  # noqa: D102
+        with self._environment.begin(write=True) as transaction:
+            transaction.drop(self._environment.open_db(), delete=False)
+
+    def __len__(self) -> int:  # noqa: D105
+        return self._environment.stat()["entries"]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._environment.close()
+
+
+class CachedEvaluator:
+    """Wraps an evaluator of a problem, only evaluating the decision variables whose results are not cached.
+
+    The results are cached row by row, keyed on the decision variables rounded to `decimals` decimals, the
+    fingerprint of the problem, and the keyword arguments of `evaluate`. Repeated decision variables within a
+    batch are also evaluated only once. The other attributes of the wrapped evaluator can be accessed through
+    the cached evaluator.
+
+    Note:
+        The results must be serializable as JSON, i.e., numbers, booleans, strings, or lists of them.
+    """
+
+    def __init__(self, evaluator: Any, backend: CacheBackend | None = None, decimals: int | None = 12):
+        """Initialize the cached evaluator.
+
+        Args:
+            evaluator (Any): the wrapped evaluator, e.g., an `Evaluator` or a `PolarsEvaluator`. Must have the
+                attribute `problem` and the method `evaluate`.
+            backend (CacheBackend | None, optional): where the results are cached. Defaults to None, in which case
+                the results are cached in memory with the defaults of `MemoryCacheBackend`.
+            decimals (int | None, optional): the number of decimals the decision variables are rounded to when
+                they are compared. If None, the decision variables must be exactly equal. Defaults to 12.
+        """
+        self.evaluator = evaluator
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.decimals = decimals
+        self.hits = 0
+        """The number of evaluated rows whose results were cached."""
+        self.misses = 0
+        """The number of evaluated rows whose results were not cached, and were evaluated by the wrapped evaluator."""
+        self._schema: pl.Schema | None = None
+        # the problem last evaluated and its fingerprint. The problem is kept, instead of its id, so that
+        # its id is not reused by a later problem.
+        self._fingerprint: tuple[Problem, str] | None = None
+
+    @property
+    def fingerprint(self) -> str:
+        """The fingerprint of the current problem of the wrapped evaluator.
+
+        The fingerprint is computed again when the problem changes, e.g., when its constants are updated with
+        `update_constants`, so that the results of different problems are not mixed up.
+        """
+        problem = self.evaluator.problem
+        if self._fingerprint is None or self._fingerprint[0] is not problem:
+            self._fingerprint = (problem, problem_fingerprint(problem))
+        return self._fingerprint[1]
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of the evaluated rows whose results were cached."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset the numbers of hits and misses."""
+        self.hits = 0
+        self.misses = 0
+
+    def _keys(self, xs: pl.DataFrame, kwargs: dict) -> list[str]:
+        """Return the cache keys of the rows of the decision variables."""
+        columns = sorted(xs.columns)
+        # tensor variables, given as nested lists or arrays, are flattened into as many columns as they have elements
+        values = np.hstack(
+            [
+                np.asarray(
+                    xs[column].to_numpy() if xs[column].dtype.is_numeric() else xs[column].to_list(), dtype=np.float64
+                ).reshape(xs.height, -1)
+                for column in columns
+            ]
+        )
+        if self.decimals is not None:
+            values = np.round(values, self.decimals)
+        # adding zero turns negative zeros into zeros, which would otherwise hash differently
+        values = np.ascontiguousarray(values + 0.0)
+
+        prefix = json.dumps([self.fingerprint, columns, kwargs], sort_keys=True).encode()
+        return [hashlib.blake2b(prefix + row.tobytes(), digest_size=20).hexdigest() for row in values]
+
+    def evaluate(self, xs: pl.DataFrame | dict[str, list], **kwargs) -> pl.DataFrame:
+        """Evaluate the decision variables, using the cached results when available.
+
+        Args:
+            xs (pl.DataFrame | dict[str, list]): the decision variables, as accepted by the wrapped evaluator.
+            kwargs: keyword arguments passed to the `evaluate` method of the wrapped evaluator, e.g., `flat`.
+
+        Returns:
+            pl.DataFrame: the results, in the same order as the decision variables.
+        """
+        xs = xs if isinstance(xs, pl.DataFrame) else pl.DataFrame(xs)
+        keys = self._keys(xs, kwargs)
+        cached = self.backend.get_many(list(dict.fromkeys(keys)))
+
+        # the rows of the first occurrence of each key that is not cached
+        missing: dict[str, int] = {}
+        for i, key in enumerate(keys):
+            if key not in cached and key not in missing:
+                missing[key] = i
+
+        n_hits = sum(key in cached for key in keys)
+        self.hits += n_hits
+        self.misses += len(keys) - n_hits
+
+        if missing:
+            evaluated = self.evaluator.evaluate(xs[list(missing.values())], **kwargs)
+            self._schema = evaluated.schema
+            self.backend.set_many(
+                {
+                    key: json.dumps(row).encode()
+                    for key, row in zip(missing, evaluated.iter_rows(named=True), strict=True)
+                }
+            )
+            if len(missing) == len(keys):
+                return evaluated
+        else:
+            evaluated = None
+
+        cached_keys = list(dict.fromkeys(key for key in keys if key in cached))
+        cached_df = pl.from_dicts(
+            [json.loads(cached[key]) for key in cached_keys],
+            schema=evaluated.schema if evaluated is not None else self._schema,
+        )
+        results = pl.concat([evaluated, cached_df]) if evaluated is not None else cached_df
+
+        # the position of the result of each row in the evaluated and cached results
+        positions = {key: i for i, key in enumerate([*missing, *cached_keys])}
+        return results[[positions[key] for key in keys]]
+
+    def __getattr__(self, name: str) -> Any:
+        """Access the attributes of the wrapped evaluator."""
+        if name == "evaluator":
+            # the wrapped evaluator has not been set yet, e.g., when unpickling
+            raise AttributeError(name)
+        return getattr(self.evaluator, name)
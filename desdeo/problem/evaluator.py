@@ -5,7 +5,7 @@ from enum import Enum
 import numpy as np
 import polars as pl
 
-from desdeo.problem.json_parser import MathParser, replace_str
+from desdeo.problem.json_parser import MathParser, PolarsCompilationEnum, replace_str
 from desdeo.problem.schema import (
     Constant,
     ObjectiveTypeEnum,
@@ -110,7 +110,12 @@ class PolarsEvaluator:
     #    and scalarization function valeus).
     # 6. End.
 
-    def __init__(self, problem: Problem, evaluator_mode: PolarsEvaluatorModesEnum = PolarsEvaluatorModesEnum.variables):
+    def __init__(
+        self,
+        problem: Problem,
+        evaluator_mode: PolarsEvaluatorModesEnum = PolarsEvaluatorModesEnum.variables,
+        polars_compilation: PolarsCompilationEnum = PolarsCompilationEnum.native,
+    ):
         """Create a Polars-based evaluator for a multiobjective optimization problem.
 
         By default, the evaluator expects a set of decision variables to
@@ -125,6 +130,10 @@ class PolarsEvaluator:
             problem (Problem): The problem as a pydantic 'Problem' data class.
             evaluator_mode (str): The mode of evaluator used to parse the problem into a format
                 that can be evaluated. Default 'variables'.
+            polars_compilation (PolarsCompilationEnum): How the functions of the problem are compiled
+                into polars expressions. In 'native' mode, the expressions are evaluated by the polars
+                query engine, while in 'reduce' mode, each operator is evaluated with NumPy in a Python
+                callback. Default 'native'.
         """
         # Create a MathParser of type 'evaluator_type'.
         if evaluator_mode not in PolarsEvaluatorModesEnum:
@@ -173,7 +182,18 @@ class PolarsEvaluator:
         self.tensor_constants = None
 
         # Note: `self.parser` is assumed to be set before continuing the initialization.
-        self.parser = MathParser()
+        self.polars_compilation = polars_compilation
+        self.parser = MathParser(
+            polars_compilation=polars_compilation,
+            symbol_shapes={
+                var.symbol: tuple(var.shape) for var in problem.variables if isinstance(var, TensorVariable)
+            },
+            tensor_constants={
+                const.symbol: np.array(const.get_values())
+                for const in (problem.constants or [])
+                if isinstance(const, TensorConstant)
+            },
+        )
         self._polars_init()
 
         # Note, when calling an evaluate method, it is assumed the problem has been fully parsed.
@@ -187,6 +207,27 @@ class PolarsEvaluator:
                 f"Provided 'evaluator_mode' {evaluator_mode} not supported. Must be one of {PolarsEvaluatorModesEnum}."
             )
 
+    def update_constants(self, values: dict[str, int | float | list]):
+        """Updates the values of constants of the problem being evaluated.
+
+        The values of the constants are substituted into the expressions when they are parsed, so the
+        expressions of the problem are parsed again with the updated values.
+
+        Args:
+            values (dict[str, int | float | list]): a dict with the symbols of the constants to be updated
+                as its keys and their new values as its values. The values of `TensorConstant`s are given
+                as (nested) lists with the shape of the tensor.
+
+        Raises:
+            PolarsEvaluatorError: when a symbol in `values` does not refer to a constant defined in the problem.
+        """
+        try:
+            problem = self.problem.update_constants(values)
+        except ValueError as e:
+            raise PolarsEvaluatorError(str(e)) from e
+
+        self.__init__(problem, self.evaluator_mode, self.polars_compilation)
+
     def _polars_init(self):  # noqa: C901, PLR0912
         """Initialization of the evaluator for parser type 'polars'."""
         # If any constants are defined in problem, replace their symbol with the defined numerical
@@ -307,10 +348,17 @@ class PolarsEvaluator:
         # parse extra functions, if any
         # if an extra function is simulator or surrogate based (expression is None), set the "parsed" expression as None
         if parsed_extra_funcs is not None:
-            self.extra_expressions = [
-                (symbol, self.parser.parse(expression)) if expression is not None else (symbol, None)
-                for symbol, expression in parsed_extra_funcs.items()
-            ]
+            self.extra_expressions = []
+            for symbol, expression in parsed_extra_funcs.items():
+                if expression is None:
+                    self.extra_expressions.append((symbol, None))
+                elif self.polars_compilation == PolarsCompilationEnum.native:
+                    # other functions may refer to the extra function, its shape must be known
+                    parsed, shape = self.parser.parse_with_shape(expression)
+                    self.parser.symbol_shapes[symbol] = shape
+                    self.extra_expressions.append((symbol, parsed))
+                else:
+                    self.extra_expressions.append((symbol, self.parser.parse(expression)))
         else:
             self.extra_expressions = None
 
@@ -368,10 +416,18 @@ class PolarsEvaluator:
         # Deal with TensorConstant
         # agg_df.with_columns(pl.Series(np.array(2*[self.tensor_constants["W"]])).alias("W"))
         if self.tensor_constants is not None:
-            for tc_symbol in self.tensor_constants:
+            if self.polars_compilation == PolarsCompilationEnum.native:
+                # The constants are already embedded in the natively compiled expressions, a literal
+                # column is broadcast lazily and is not copied on each row.
                 agg_df = agg_df.with_columns(
-                    pl.Series(np.array(agg_df.height * [self.tensor_constants[tc_symbol]])).alias(tc_symbol)
+                    pl.lit(pl.Series([values], dtype=pl.Array(pl.Float64, values.shape))).first().alias(tc_symbol)
+                    for tc_symbol, values in self.tensor_constants.items()
                 )
+            else:
+                for tc_symbol in self.tensor_constants:
+                    agg_df = agg_df.with_columns(
+                        pl.Series(np.array(agg_df.height * [self.tensor_constants[tc_symbol]])).alias(tc_symbol)
+                    )
 
         # Evaluate any extra functions and put the results in the aggregate dataframe.
         # If an extra function is simulator or surrogate based (expression None), skip it here
@@ -560,3 +560,65 @@ class GurobipyEvaluator:
             self.model.setObjective(obj_expr, sense=gp.GRB.MAXIMIZE)
         else:
             self.model.setObjective(obj_expr)
+
+    def update_constants(self, values: dict[str, int | float | list]):
+        """Updates the values of constants and the expressions referencing them in the gurobipy model.
+
+        Since the expressions of the gurobipy model use the numeric values of the constants, only the
+        expressions referencing the updated constants, directly or through other expressions, are
+        re-parsed, and only the constraints referencing them are replaced in the model. The rest of the
+        model, e.g., the variables and their start values, is kept as is.
+
+        Args:
+            values (dict[str, int | float | list]): a dict with the symbols of the constants to be updated
+                as its keys and their new values as its values. The values of `TensorConstant`s are given
+                as (nested) lists with the shape of the tensor.
+
+        Raises:
+            GurobipyEvaluatorError: when a symbol in `values` does not refer to a constant defined in the problem.
+        """
+        try:
+            self.problem = self.problem.update_constants(values)
+        except ValueError as e:
+            raise GurobipyEvaluatorError(str(e)) from e
+
+        self.constants.update(values)
+        changed = set(values)
+
+        # the expressions are re-parsed in the order they were initialized in, so that
+        # any expressions referencing the re-parsed ones are re-parsed as well
+        for extra in self.problem.extra_funcs or []:
+            if _referenced_symbols(extra.func) & changed:
+                self.extra_functions[extra.symbol] = self.parse(extra.func, callback=self.get_expression_by_name)
+                changed.add(extra.symbol)
+
+        for obj in self.problem.objectives:
+            if _referenced_symbols(obj.func) & changed:
+                self.add_objective(obj)
+                changed |= {obj.symbol, f"{obj.symbol}_min"}
+
+        for cons in self.problem.constraints or []:
+            if _referenced_symbols(cons.func) & changed:
+                self.model.remove(self.model.getConstrByName(cons.symbol))
+                self.add_constraint(cons)
+
+        for scal in self.problem.scalarization_funcs or []:
+            if _referenced_symbols(scal.func) & changed:
+                self.add_scalarization_function(scal)
+                changed.add(scal.symbol)
+
+
+def _referenced_symbols(expr: list | str | int | float) -> set[str]:
+    """Collects the symbols referenced in a function expression in the MathJSON format.
+
+    Args:
+        expr (list | str | int | float): the expression.
+
+    Returns:
+        set[str]: the symbols, and the operators, found in the expression.
+    """
+    if isinstance(expr, str):
+        return {expr}
+    if isinstance(expr, list):
+        return set().union(*(_referenced_symbols(e) for e in expr))
+    return set()
@@ -25,6 +25,18 @@ class FormatEnum(str, Enum):
     gurobipy = "gurobipy"
 
 
+class PolarsCompilationEnum(str, Enum):
+    """Enumerates the ways MathJSON may be compiled into polars expressions."""
+
+    reduce = "reduce"
+    """Every operator is evaluated by a NumPy ufunc inside a `pl.reduce` callback. Works for
+    operands of any shape, but each node is evaluated in Python, one at a time."""
+    native = "native"
+    """Operators are compiled into native polars expressions whenever the shapes of the operands
+    allow it, and the expressions are evaluated by the polars query engine. Only genuine tensor
+    contractions fall back to the NumPy callbacks of the `reduce` mode."""
+
+
 class ParserError(Exception):
     """Raised when an error related to the MathParser class in encountered."""
 
@@ -35,12 +47,27 @@ class MathParser:
     Currently only parses MathJSON to polars expressions. Pyomo WIP.
     """
 
-    def __init__(self, to_format: FormatEnum = "polars"):
+    def __init__(
+        self,
+        to_format: FormatEnum = "polars",
+        polars_compilation: PolarsCompilationEnum = PolarsCompilationEnum.reduce,
+        symbol_shapes: dict[str, tuple[int, ...]] | None = None,
+        tensor_constants: dict[str, np.ndarray] | None = None,
+    ):
         """Create a parser instance for parsing MathJSON notation into polars expressions.
 
         Args:
             to_format (FormatEnum, optional): to which format a JSON representation should be parsed to.
                 Defaults to "polars".
+            polars_compilation (PolarsCompilationEnum, optional): how MathJSON is compiled into polars
+                expressions. Only relevant when `to_format` is "polars". Defaults to "reduce".
+            symbol_shapes (dict[str, tuple[int, ...]], optional): the shapes of the tensor valued symbols
+                (e.g., TensorVariables and TensorConstants) that may appear in the parsed expressions.
+                Symbols not found in the dict are assumed to be scalar valued. Only used when
+                `polars_compilation` is "native". Defaults to None.
+            tensor_constants (dict[str, np.ndarray], optional): the values of TensorConstants, which are
+                embedded in the parsed expressions as literals instead of being read from the columns of
+                the evaluated dataframe. Only used when `polars_compilation` is "native". Defaults to None.
         """
         # Define operator names. Change these when the name is altered in the JSON format.
         # Basic arithmetic operators
@@ -208,6 +235,179 @@ class MathParser:
             self.MIN: lambda *args: reduce(lambda x, y: pl.min_horizontal(to_expr(x), to_expr(y)), args),
         }
 
+        # The native polars operators work on (expression, shape) pairs, where shape is the shape of
+        # the value of the expression on a single row, e.g., () for scalars and (3,) for vectors.
+        # A shape of None means that the shape cannot be known before evaluation, in which case the
+        # operators fall back to the reduce based operators in `polars_env`.
+        def _native_elementwise_shape(*shapes):
+            """The shape of the result of an element-wise operation, or None if it is not known."""
+            if any(shape is None for shape in shapes):
+                return None
+
+            tensor_shapes = {shape for shape in shapes if shape != ()}
+
+            if len(tensor_shapes) == 0:
+                return ()
+            if len(tensor_shapes) == 1:
+                return tensor_shapes.pop()
+
+            # differently shaped tensors, left for numpy to broadcast
+            return None
+
+        def _from_polars_env(op_name, shape, *args):
+            """Apply the operator defined in `polars_env`, i.e., usually fall back to a reduce based operator."""
+            # the reduce based operators expect constant tensors (e.g., TensorConstants) to be repeated on each row
+            exprs = [
+                expr.gather(pl.int_range(pl.len()) * 0)
+                if arg_shape not in [(), None] and not expr.meta.root_names()
+                else expr
+                for expr, arg_shape in args
+            ]
+            return polars_env[op_name](*exprs), shape
+
+        def _native_from_env(op_name):
+            """Use the operator defined in `polars_env` as is, keeping track of the shape."""
+
+            def _op(*args):
+                return _from_polars_env(op_name, _native_elementwise_shape(*[shape for _, shape in args]), *args)
+
+            return _op
+
+        def _native_map_elements(expr, shape, op):
+            """Apply an element-wise unary operation on a tensor valued expression."""
+            size = int(np.prod(shape))
+
+            return (
+                expr.reshape((-1, size))
+                .arr.to_list()
+                .list.eval(op(pl.element()))
+                .list.to_array(size)
+                .reshape((-1, *shape))
+            )
+
+        def _native_unary(op_name, op):
+            """Native unary operator, `op` must be an element-wise operation on polars expressions."""
+
+            def _unary(arg):
+                expr, shape = arg
+                if shape is None:
+                    return _from_polars_env(op_name, None, arg)
+                if shape == ():
+                    return op(expr), ()
+
+                return _native_map_elements(expr, shape, op), shape
+
+            return _unary
+
+        def _native_arithmetic(op_name, op):
+            """Native element-wise arithmetic between scalars and equally shaped tensors."""
+
+            def _arithmetic(*args):
+                shape = _native_elementwise_shape(*[arg_shape for _, arg_shape in args])
+                if shape is None:
+                    return _from_polars_env(op_name, None, *args)
+
+                return reduce(op, [expr for expr, _ in args]), shape
+
+            return _arithmetic
+
+        def _native_power(base, exponent):
+            base_expr, base_shape = base
+            exp_expr, exp_shape = exponent
+
+            if base_shape == () and exp_shape == ():
+                return base_expr**exp_expr, ()
+
+            if base_shape is not None and exp_shape == () and exp_expr.meta.is_literal():
+                # the exponent can be broadcast inside the element-wise evaluation
+                return _native_map_elements(base_expr, base_shape, lambda x: x**exp_expr), base_shape
+
+            return _from_polars_env(self.POW, _native_elementwise_shape(base_shape, exp_shape), base, exponent)
+
+        def _native_summation(arg):
+            expr, shape = arg
+            if shape is None:
+                return _from_polars_env(self.SUM, (), arg)
+            if shape == ():
+                return expr, ()
+            if len(shape) == 1:
+                return expr.arr.sum(), ()
+
+            return expr.reshape((-1, int(np.prod(shape)))).arr.sum(), ()
+
+        def _native_matmul(*args):
+            def _matmul(a, b):
+                a_expr, a_shape = a
+                b_expr, b_shape = b
+
+                if a_shape is not None and b_shape is not None and len(a_shape) == 1 and a_shape == b_shape:
+                    # dot product of two vectors
+                    return (a_expr * b_expr).arr.sum(), ()
+
+                # a genuine tensor contraction
+                if (
+                    a_shape is not None
+                    and b_shape is not None
+                    and len(a_shape) == len(b_shape) == 2  # noqa: PLR2004
+                    and a_shape[1] == b_shape[0]
+                ):
+                    shape = (a_shape[0], b_shape[1])
+                else:
+                    shape = None
+
+                return _from_polars_env(self.MATMUL, shape, a, b)
+
+            return reduce(_matmul, args)
+
+        def _native_random_access(arg, *indices):
+            expr, shape = arg
+            shape = shape[len(indices) :] if shape is not None and len(shape) >= len(indices) else None
+
+            return _polars_random_access(expr, *[index_expr for index_expr, _ in indices]), shape
+
+        polars_native_env = {
+            # Basic arithmetic operations
+            self.NEGATE: _native_unary(self.NEGATE, lambda x: x * -1),
+            self.ADD: _native_arithmetic(self.ADD, lambda x, y: x + y),
+            self.SUB: _native_arithmetic(self.SUB, lambda x, y: x - y),
+            self.MUL: _native_arithmetic(self.MUL, lambda x, y: x * y),
+            self.DIV: _native_arithmetic(self.DIV, lambda x, y: x / y),
+            # Vector and matrix operations
+            self.MATMUL: _native_matmul,
+            self.SUM: _native_summation,
+            self.RANDOM_ACCESS: _native_random_access,
+            # Exponentiation and logarithms
+            self.EXP: _native_unary(self.EXP, lambda x: x.exp()),
+            self.LN: _native_unary(self.LN, lambda x: x.log()),
+            self.LB: _native_unary(self.LB, lambda x: x.log(2)),
+            self.LG: _native_unary(self.LG, lambda x: x.log10()),
+            self.LOP: _native_unary(self.LOP, lambda x: x.log1p()),
+            self.SQRT: _native_unary(self.SQRT, lambda x: x.sqrt()),
+            self.SQUARE: _native_unary(self.SQUARE, lambda x: x**2),
+            self.POW: _native_power,
+            # Trigonometric operations
+            self.ARCCOS: _native_unary(self.ARCCOS, lambda x: x.arccos()),
+            self.ARCCOSH: _native_unary(self.ARCCOSH, lambda x: x.arccosh()),
+            self.ARCSIN: _native_unary(self.ARCSIN, lambda x: x.arcsin()),
+            self.ARCSINH: _native_unary(self.ARCSINH, lambda x: x.arcsinh()),
+            self.ARCTAN: _native_unary(self.ARCTAN, lambda x: x.arctan()),
+            self.ARCTANH: _native_unary(self.ARCTANH, lambda x: x.arctanh()),
+            self.COS: _native_unary(self.COS, lambda x: x.cos()),
+            self.COSH: _native_unary(self.COSH, lambda x: x.cosh()),
+            self.SIN: _native_unary(self.SIN, lambda x: x.sin()),
+            self.SINH: _native_unary(self.SINH, lambda x: x.sinh()),
+            self.TAN: _native_unary(self.TAN, lambda x: x.tan()),
+            self.TANH: _native_unary(self.TANH, lambda x: x.tanh()),
+            # Rounding operations
+            self.ABS: _native_unary(self.ABS, lambda x: x.abs()),
+            self.CEIL: _native_unary(self.CEIL, lambda x: x.ceil()),
+            self.FLOOR: _native_unary(self.FLOOR, lambda x: x.floor()),
+            # Other operations
+            self.RATIONAL: _native_from_env(self.RATIONAL),  # Not supported
+            self.MAX: _native_from_env(self.MAX),  # max_horizontal is already native
+            self.MIN: _native_from_env(self.MIN),  # min_horizontal is already native
+        }
+
         def _pyomo_negate(x):
             """Negates the given operand."""
 
@@ -688,6 +888,18 @@ class MathParser:
         }
 
         match to_format:
+            case FormatEnum.polars if polars_compilation == PolarsCompilationEnum.native:
+                self.env = polars_native_env
+                self.reduce_env = polars_env
+                self.parse = self._parse_to_polars_native
+                self.symbol_shapes = {
+                    symbol: tuple(shape)
+                    for symbol, shape in (symbol_shapes if symbol_shapes is not None else {}).items()
+                }
+                self.tensor_constants = {
+                    symbol: np.asarray(values, dtype=float)
+                    for symbol, values in (tensor_constants if tensor_constants is not None else {}).items()
+                }
             case FormatEnum.polars:
                 self.env = polars_env
                 self.parse = self._parse_to_polars
@@ -757,6 +969,88 @@ class MathParser:
         msg = f"Encountered unsupported type '{type(expr)}' during parsing."
         raise ParserError(msg)
 
+    def _parse_to_polars_native(self, expr: list | str | int | float) -> pl.Expr:
+        """Recursively parses JSON math expressions into native polars expressions.
+
+        Arguments:
+            expr (list): A list with a Polish notation expression that describes a, e.g.,
+                ["Multiply", ["Sqrt", 2], "x2"]
+
+        Raises:
+            ParserError: when a unsupported operator type is encountered.
+
+        Returns:
+            pl.Expr: A polars expression that may be evaluated further.
+        """
+
+        def _drop_shapes(parsed):
+            if isinstance(parsed, list):
+                return [_drop_shapes(e) for e in parsed]
+
+            return parsed[0]
+
+        return _drop_shapes(self.parse_with_shape(expr))
+
+    def parse_with_shape(self, expr: list | str | int | float) -> tuple[pl.Expr, tuple[int, ...] | None] | list:
+        """Parses JSON math expressions into native polars expressions and infers their shapes.
+
+        The shape is the shape of the value of the expression on a single row, e.g., `()` for
+        scalars and `(3,)` for vectors with three elements. Only available when the parser
+        has been created with `polars_compilation="native"`.
+
+        Arguments:
+            expr (list): A list with a Polish notation expression that describes a, e.g.,
+                ["Multiply", ["Sqrt", 2], "x2"]
+
+        Raises:
+            ParserError: when a unsupported operator type is encountered.
+
+        Returns:
+            tuple[pl.Expr, tuple[int, ...] | None] | list: A polars expression that may be evaluated
+                further, and its shape. The shape is None if it cannot be inferred before evaluation.
+                If `expr` is a list of expressions, returns a list of such pairs instead.
+        """
+        if isinstance(expr, pl.Expr):
+            # Terminal case: polars expression, shape unknown
+            return expr, None
+        if isinstance(expr, str):
+            if expr in self.tensor_constants:
+                # Terminal case: TensorConstant, embedded as a literal broadcast to each row
+                values = self.tensor_constants[expr]
+                return pl.lit(pl.Series([values], dtype=pl.Array(pl.Float64, values.shape))).first(), values.shape
+            # Terminal case: str expression (represents a column name)
+            return pl.col(expr), self.symbol_shapes.get(expr, ())
+        if isinstance(expr, self.literals):
+            # Terminal case: numeric literal
+            return pl.lit(expr), ()
+
+        if isinstance(expr, list):
+            if len(expr) == 1 and isinstance(expr[0], str | self.literals):
+                # Terminal case, single symbol expression or literal
+                return self.parse_with_shape(expr[0])
+
+            # Extract the operation name
+            if isinstance(expr[0], str) and expr[0] in self.env:
+                op_name = expr[0]
+                # Parse the operands
+                operands = [self.parse_with_shape(e) for e in expr[1:]]
+
+                if len(operands) == 1 and isinstance(operands[0], list):
+                    # if the operands have redundant brackets, remove them
+                    operands = operands[0]
+
+                if any(isinstance(operand, list) for operand in operands):
+                    # nested lists of operands, let the reduce based operator deal with them
+                    return self.reduce_env[op_name](*self._parse_to_polars_native(expr[1:])), None
+
+                return self.env[op_name](*operands)
+
+            # else, assume the list contents are parseable expressions
+            return [self.parse_with_shape(e) for e in expr]
+
+        msg = f"Encountered unsupported type '{type(expr)}' during parsing."
+        raise ParserError(msg)
+
     def _parse_to_pyomo(
         self, expr: list | str | int | float | pyomo.Expression, model: pyomo.Model
     ) -> pyomo.Expression:
@@ -5,6 +5,7 @@ from collections.abc import Iterable
 from operator import eq as _eq
 from operator import le as _python_le
 
+import numpy as np
 import pyomo.environ as pyomo
 
 from desdeo.problem.json_parser import FormatEnum, MathParser
@@ -219,7 +220,7 @@ class PyomoEvaluator:
             model (pyomo.Model): the pyomo model to add the constants to.
 
         Raises:
-            PyomoEvaluatorError: when the domain of a constant cannot be figured out.
+            PyomoEvaluatorError: when an unsupported constant type is encountered.
 
         Returns:
             pyomo.Model: the pyomo model with the constants added as attributes.
@@ -227,26 +228,9 @@ class PyomoEvaluator:
         for con in problem.constants:
             # Handle regular constnants
             if isinstance(con, Constant):
-                # figure out the domain of the constant
-                match (isinstance(con.value, int), isinstance(con.value, float), con.value >= 0):
-                    case (True, False, True):
-                        # positive integer
-                        domain = pyomo.NonNegativeIntegers
-                    case (True, False, False):
-                        # negative integer
-                        domain = pyomo.NegativeIntegers
-                    case (False, True, True):
-                        # positive real
-                        domain = pyomo.NonNegativeReals
-                    case (False, True, False):
-                        # negative real
-                        domain = pyomo.NegativeReals
-                    case _:
-                        # not possible, something went wrong
-                        msg = f"Failed to figure out the domain for the constant {con.symbol}."
-                        raise PyomoEvaluatorError(msg)
-
-                pyomo_param = pyomo.Param(name=con.name, default=con.value, domain=domain)
+                # the constants are mutable so that they can be updated without rebuilding the model,
+                # therefore their values may change sign or type and their domain is all reals
+                pyomo_param = pyomo.Param(name=con.name, initialize=con.value, domain=pyomo.Reals, mutable=True)
 
             elif isinstance(con, TensorConstant):
                 # handle TensorConstants, like vectors
@@ -263,6 +247,7 @@ class PyomoEvaluator:
                     name=con.name,
                     initialize=self._init_rule(con.get_values()),
                     domain=domain,
+                    mutable=True,
                 )
             else:
                 msg = f"Unsupported constant type '{type(con)}' encountered."
@@ -485,3 +470,31 @@ class PyomoEvaluator:
 
         # add the postfix '_objective' to the attribute name of the pyomo objective
         setattr(self.model, f"{target}_objective", objective)
+
+    def update_constants(self, values: dict[str, int | float | list]):
+        """Updates the values of constants in the pyomo model without rebuilding it.
+
+        The constants are mutable parameters of the pyomo model, so the expressions referencing them,
+        e.g., the reference point of a parametric scalarization function, are updated in place.
+
+        Args:
+            values (dict[str, int | float | list]): a dict with the symbols of the constants to be updated
+                as its keys and their new values as its values. The values of `TensorConstant`s are given
+                as (nested) lists with the shape of the tensor.
+
+        Raises:
+            PyomoEvaluatorError: when a symbol in `values` does not refer to a constant defined in the problem.
+        """
+        try:
+            self.problem = self.problem.update_constants(values)
+        except ValueError as e:
+            raise PyomoEvaluatorError(str(e)) from e
+
+        for symbol, value in values.items():
+            param = getattr(self.model, symbol)
+            if param.is_indexed():
+                # the indices of the tensor constants start from 1
+                for index, element in np.ndenumerate(np.asarray(value)):
+                    param[tuple(i + 1 for i in index) if len(index) > 1 else index[0] + 1] = element.item()
+            else:
+                param.set_value(value)
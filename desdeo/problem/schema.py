@@ -1285,6 +1285,90 @@ class Problem(BaseModel):
         # proceed to add the new variables, assumed existing variables are defined
         return self.model_copy(update={"variables": [*self.variables, *new_variables]})
 
+    def add_constants(self, new_constants: list[Constant | TensorConstant]) -> "Problem":
+        """Adds new constants to the problem model.
+
+        Does not modify the original problem model, but instead returns a copy of it with
+        the added constants. The symbols of the new constants to be added must be
+        unique.
+
+        Args:
+            new_constants (list[Constant | TensorConstant]): the new constants to be added to the model.
+
+        Raises:
+            TypeError: when the `new_constants` is not a list.
+            ValueError: when duplicate symbols are found among the new_constants, or
+                any of the new constants utilized an existing symbol in the problem's model.
+
+        Returns:
+            Problem: a copy of the problem with the added constants.
+        """
+        if not isinstance(new_constants, list):
+            # not a list
+            msg = "The argument `new_constants` must be a list."
+            raise TypeError(msg)
+
+        all_symbols = self.get_all_symbols()
+        new_symbols = [const.symbol for const in new_constants]
+
+        if len(new_symbols) > len(set(new_symbols)):
+            # duplicate symbols in the new constants
+            msg = "Duplicate symbols found in the new constants to be added."
+            raise ValueError(msg)
+
+        for s in new_symbols:
+            if s in all_symbols:
+                # symbol already exists
+                msg = "A symbol was provided for a new constant that already exists in the problem definition."
+                raise ValueError(msg)
+
+        # proceed to add the new constants
+        return self.model_copy(
+            update={"constants": new_constants if self.constants is None else [*self.constants, *new_constants]}
+        )
+
+    def update_constants(self, values: dict[str, VariableType | list]) -> "Problem":
+        """Updates the values of existing constants in the problem model.
+
+        Does not modify the original problem model, but instead returns a copy of it with
+        the updated constants. Only the constants are copied, the rest of the model is shared
+        with the original problem, which makes this cheap enough to be called every time, e.g.,
+        the reference point of a parametric scalarization function changes.
+
+        Args:
+            values (dict[str, VariableType | list]): a dict with the symbols of the constants to be
+                updated as its keys and their new values as its values. The values of `TensorConstant`s
+                are given as (nested) lists with the shape of the tensor.
+
+        Raises:
+            ValueError: when a symbol in `values` does not refer to a constant defined in the problem.
+
+        Returns:
+            Problem: a copy of the problem with the updated constants.
+        """
+        constant_symbols = [const.symbol for const in self.constants] if self.constants is not None else []
+
+        for s in values:
+            if s not in constant_symbols:
+                msg = f"The symbol '{s}' does not refer to a constant defined in the problem."
+                raise ValueError(msg)
+
+        updated_constants = []
+        for const in self.constants or []:
+            if const.symbol not in values:
+                updated_constants.append(const)
+            elif isinstance(const, TensorConstant):
+                # the values of a tensor constant are stored in the MathJSON format, so they must be validated
+                updated_constants.append(
+                    TensorConstant(
+                        name=const.name, symbol=const.symbol, shape=const.shape, values=values[const.symbol]
+                    )
+                )
+            else:
+                updated_constants.append(const.model_copy(update={"value": values[const.symbol]}))
+
+        return self.model_copy(update={"constants": updated_constants})
+
     def get_flattened_variables(self) -> list[Variable]:
         """Return a list of the (flattened) variables of the problem.
 
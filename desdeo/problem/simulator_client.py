@@ -0,0 +1,168 @@
+"""A client for evaluating the simulators of problems served over HTTP.
+
+The simulators defined by a `Url` are called with a GET request, whose body has the decision variables and the
+parameters of the simulator, by default as JSON: `{"d": {"x_1": [...], ...}, "p": {...}}`. The response is expected
+to have the values of the simulated functions as JSON: `{"f_1": [...], ...}`.
+
+The `SimulatorClient` keeps the connections to the simulators alive between evaluations, splits large batches of
+decision variables into chunks, sends the chunks concurrently, and retries failed requests with a backoff. If the
+simulator supports it, the decision variables and results can be sent in the Arrow IPC stream format instead of
+JSON, see `HttpSimulatorOptions.arrow`. The benchmark server in `desdeo.problem.testproblems.benchmarks_server`
+supports both formats.
+"""
+
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+import requests
+from pydantic import BaseModel, ConfigDict, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from desdeo.problem.schema import Url
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+"""The media type of the Arrow IPC stream format."""
+
+
+class HttpSimulatorOptions(BaseModel):
+    """Options for evaluating the simulators served over HTTP."""
+
+    model_config = ConfigDict(frozen=True)
+
+    chunk_size: int | None = Field(
+        description=(
+            "The maximum number of samples sent to a simulator in a single request. Larger batches are split into "
+            "chunks, which are sent concurrently. If 'None', each batch is sent in a single request."
+        ),
+        default=None,
+        ge=1,
+    )
+    """The maximum number of samples sent to a simulator in a single request. Larger batches are split into chunks,
+    which are sent concurrently. If 'None', each batch is sent in a single request. Defaults to 'None'."""
+    max_connections: int = Field(
+        description="The maximum number of concurrent requests, and of connections kept alive to each simulator.",
+        default=8,
+        ge=1,
+    )
+    """The maximum number of concurrent requests, and of connections kept alive to each simulator. Defaults to 8."""
+    timeout: float | None = Field(
+        description="The number of seconds to wait for a response from a simulator. If 'None', waits forever.",
+        default=60.0,
+    )
+    """The number of seconds to wait for a response from a simulator. If 'None', waits forever. Defaults to 60."""
+    retries: int = Field(
+        description=(
+            "The number of times a request is retried if the connection fails or the simulator responds with "
+            "429, 502, 503 or 504."
+        ),
+        default=3,
+        ge=0,
+    )
+    """The number of times a request is retried if the connection fails or the simulator responds with
+    429, 502, 503 or 504. Defaults to 3."""
+    backoff_factor: float = Field(
+        description=(
+            "The factor of the exponential backoff between the retries. The n-th retry waits "
+            "backoff_factor * 2^(n-1) seconds."
+        ),
+        default=0.5,
+        ge=0,
+    )
+    """The factor of the exponential backoff between the retries. The n-th retry waits
+    backoff_factor * 2^(n-1) seconds. Defaults to 0.5."""
+    arrow: bool = Field(
+        description=(
+            "Whether the decision variables and results are sent in the Arrow IPC stream format instead of JSON. "
+            "The parameters of the simulator are then sent as JSON in the query parameter 'p'."
+        ),
+        default=False,
+    )
+    """Whether the decision variables and results are sent in the Arrow IPC stream format instead of JSON.
+    The parameters of the simulator are then sent as JSON in the query parameter 'p'. Defaults to False."""
+
+
+class SimulatorClient:
+    """Evaluates simulators served over HTTP, reusing the connections between evaluations.
+
+    The client can be used from many threads, e.g., to evaluate several simulators concurrently.
+    """
+
+    def __init__(self, options: HttpSimulatorOptions | None = None):
+        """Initialize the client.
+
+        Args:
+            options (HttpSimulatorOptions | None, optional): the options of the client. Defaults to None, in which
+                case the default options are used.
+        """
+        self.options = options if options is not None else HttpSimulatorOptions()
+
+        retry = Retry(
+            total=self.options.retries,
+            backoff_factor=self.options.backoff_factor,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=None,  # the simulators are called with GET requests, but retry any method
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.options.max_connections, pool_maxsize=self.options.max_connections, max_retries=retry
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=self.options.max_connections)
+
+    def _request(self, url: Url, xs: pl.DataFrame, params: dict) -> pl.DataFrame:
+        """Send a single request to a simulator and return its results."""
+        if self.options.arrow:
+            buffer = io.BytesIO()
+            xs.write_ipc_stream(buffer)
+            res = self._session.get(
+                url.url,
+                auth=url.auth,
+                params={"p": json.dumps(params)},
+                data=buffer.getvalue(),
+                headers={"Content-Type": ARROW_MEDIA_TYPE, "Accept": ARROW_MEDIA_TYPE},
+                timeout=self.options.timeout,
+            )
+        else:
+            res = self._session.get(
+                url.url,
+                auth=url.auth,
+                json={"d": xs.to_dict(as_series=False), "p": params},
+                timeout=self.options.timeout,
+            )
+        res.raise_for_status()  # raise an error if the request failed
+
+        if res.headers.get("Content-Type", "").startswith(ARROW_MEDIA_TYPE):
+            return pl.read_ipc_stream(io.BytesIO(res.content))
+        return pl.DataFrame(res.json())
+
+    def evaluate(self, url: Url, xs: pl.DataFrame, params: dict) -> pl.DataFrame:
+        """Evaluate a batch of decision variables with a simulator.
+
+        Args:
+            url (Url): the URL of the simulator.
+            xs (pl.DataFrame): the decision variables, with a column for each decision variable.
+            params (dict): the parameters of the simulator. Must be serializable as JSON.
+
+        Raises:
+            requests.RequestException: a request to the simulator failed, even after the retries.
+
+        Returns:
+            pl.DataFrame: the results of the simulator, with a column for each simulated function.
+        """
+        chunk_size = self.options.chunk_size
+        if chunk_size is None or xs.height <= chunk_size:
+            return self._request(url, xs, params)
+
+        chunks = [xs.slice(offset, chunk_size) for offset in range(0, xs.height, chunk_size)]
+        # map returns the results in the order of the chunks
+        return pl.concat(self._executor.map(lambda chunk: self._request(url, chunk, params), chunks))
+
+    def close(self) -> None:
+        """Close the connections to the simulators."""
+        self._executor.shutdown()
+        self._session.close()
@@ -3,8 +3,11 @@ from numpy._core.multiarray import scalar
 """Evaluators are defined to evaluate simulator based and surrogate based objectives, constraints and extras."""
 
 import json
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from inspect import getfullargspec
 from pathlib import Path
 
@@ -21,17 +24,59 @@ from desdeo.problem import (
     Problem,
     MathParser
 )
+from desdeo.problem.schema import Simulator
+from desdeo.problem.simulator_client import HttpSimulatorOptions, SimulatorClient
+from desdeo.problem.simulator_worker import SimulatorWorkerError, SimulatorWorkerPool
 
 
 class EvaluatorError(Exception):
     """Error raised when exceptions are encountered in an Evaluator."""
 
 
+SURROGATE_MEMORY_BUDGET = 2**28
+"""The default number of bytes the predictions of a surrogate model may use at once, 256 MiB."""
+
+
+def _prediction_row_bytes(model, n_features: int) -> int:
+    """Estimate the memory used by a surrogate model to predict a single row of decision variables.
+
+    Models predicting with their training data, e.g., Gaussian process regressors and nearest neighbors, compare
+    each row with each training sample, while the other models are assumed to only use the row itself.
+    """
+    training_data = getattr(model, "X_train_", getattr(model, "_fit_X", None))
+    n_training_samples = np.shape(training_data)[0] if training_data is not None else 0
+    return 8 * (n_features + n_training_samples)
+
+
+def _predict(model, var: np.ndarray, return_std: bool, chunk_rows: int) -> tuple[np.ndarray, np.ndarray]:
+    """Predict the values and uncertainties of a surrogate model, in chunks of at most `chunk_rows` rows.
+
+    If the model does not provide uncertainty predictions, the uncertainties are NaN.
+    """
+    values, uncertainties = [], []
+    for start in range(0, max(len(var), 1), chunk_rows):
+        chunk = var[start : start + chunk_rows]
+        if return_std:
+            value, uncertainty = model.predict(chunk, return_std=True)
+        else:
+            value = model.predict(chunk)
+            uncertainty = np.full(np.shape(value), np.nan)
+        values.append(value)
+        uncertainties.append(uncertainty)
+    return np.concatenate(values), np.concatenate(uncertainties)
+
+
 class Evaluator:
     """A class for creating evaluators for simulator based and surrogate based objectives, constraints and extras."""
 
-    def __init__(
-        self, problem: Problem, params: dict[str, dict] | None = None, surrogate_paths: dict[str, Path] | None = None
+    def __init__(  # noqa: PLR0913
+        self,
+        problem: Problem,
+        params: dict[str, dict] | None = None,
+        surrogate_paths: dict[str, Path] | None = None,
+        http_options: HttpSimulatorOptions | None = None,
+        surrogate_memory_budget: int | None = SURROGATE_MEMORY_BUDGET,
+        simulator_workers: int | None = None,
     ):
         """Creating an evaluator for simulator based and surrogate based objectives, constraints and extras.
 
@@ -44,6 +89,15 @@ class Evaluator:
                 constraints and extra functions and the values are the paths to the surrogate models saved on disk.
                 The names of the objectives, constraints and extra functions should match the names of the objectives,
                 constraints and extra functions in the problem JSON. Defaults to None.
+            http_options (HttpSimulatorOptions, optional): Options for calling the simulators served over HTTP, e.g.,
+                the chunk size of the batches, timeouts and retries. Defaults to None, in which case the default
+                options are used.
+            surrogate_memory_budget (int | None, optional): The approximate number of bytes the predictions of each
+                surrogate model may use at once. Larger batches of decision variables are predicted in chunks. If None,
+                each batch is predicted at once. Defaults to `SURROGATE_MEMORY_BUDGET`.
+            simulator_workers (int | None, optional): The maximum number of worker processes per simulator file, i.e.,
+                of batches evaluated at the same time with each simulator file. If None, the number of CPUs is used.
+                Defaults to None.
         """
         self.problem = problem
         # store the symbol and min or max multiplier as well (symbol, min/max multiplier [1 | -1])
@@ -102,6 +156,12 @@ class Evaluator:
             self.analytical_symbols + self.data_based_symbols + self.simulator_symbols + self.surrogate_symbols
         )
 
+        # Parse the analytical and data based functions only once, the evaluator is reused on each evaluation
+        if len(self.analytical_symbols + self.data_based_symbols) > 0:
+            self.polars_evaluator = PolarsEvaluator(self.problem, evaluator_mode=PolarsEvaluatorModesEnum.mixed)
+        else:
+            self.polars_evaluator = None
+
         # Gather the possible simulators
         self.simulators = problem.simulators if problem.simulators is not None else []
         # Gather the possibly given parameters
@@ -113,7 +173,22 @@ class Evaluator:
                     sim_params[key] = sim.parameter_options[key]
             self.params[sim.name] = sim_params
 
+        # The simulator files are evaluated in pools of long-lived worker processes, started on demand
+        self._simulator_workers = {
+            sim.name: SimulatorWorkerPool(sim.file, max_workers=simulator_workers)
+            for sim in self.simulators
+            if sim.file is not None
+        }
+        # The simulators served over HTTP are called with a client keeping the connections alive, created on first use
+        self.http_options = http_options
+        self._simulator_client: SimulatorClient | None = None
+        # the simulators are run in parallel threads, which must not create a client each
+        self._simulator_client_lock = threading.Lock()
+
+        self.surrogate_memory_budget = surrogate_memory_budget
         self.surrogates = {}
+        # whether the predict method of each surrogate model accepts "return_std", checked once when the models load
+        self._surrogate_returns_std: dict[str, bool] = {}
         if surrogate_paths is not None:
             self._load_surrogates(surrogate_paths)
         else:
@@ -128,7 +203,7 @@ class Evaluator:
             if len(missing_surrogates) > 0:
                 raise EvaluatorError(f"Some surrogates missing: {missing_surrogates}.")
 
-    def _evaluate_simulator(self, xs: dict[str, list[int | float]]) -> pl.DataFrame:
+    def _evaluate_simulator(self, xs: dict[str, list[int | float]] | pl.DataFrame) -> pl.DataFrame:
         """Evaluate the problem for the given decision variables using the problem's simulators.
 
         Args:
@@ -143,34 +218,18 @@ class Evaluator:
                 and the length of the columns is the number of samples. Will return those objective, constraint and
                 extra function values that are gained from simulators listed in the problem object.
         """
-        res_df = pl.DataFrame()
-        for sim in self.simulators:
-            # gather the possible parameters for the simulator
-            params = self.params.get(sim.name, {})
-            if sim.file is not None:
-                # call the simulator with the decision variable values and parameters as dicts
-                res = subprocess.run(
-                    [sys.executable, sim.file, "-d", str(xs), "-p", str(params)], capture_output=True, text=True
-                )
-                if res.returncode == 0:
-                    # gather the simulation results (a dict) into the results dataframe
-                    res_df = res_df.hstack(pl.DataFrame(json.loads(res.stdout)))
-                else:
-                    raise EvaluatorError(res.stderr)
-            elif sim.url is not None:
-                # call the endpoint
-                try:
-                    if isinstance(xs, pl.DataFrame):
-                        # if xs is a polars dataframe, convert it to a dict
-                        xs = xs.to_dict(as_series=False)
-                    res = requests.get(sim.url.url, auth=sim.url.auth, json={"d": xs, "p": params})
-                    res.raise_for_status()  # raise an error if the request failed
-                except requests.RequestException as e:
-                    raise EvaluatorError(
-                        f"Failed to call the simulator at {sim.url}. Is the simulator server running?"
-                        ) from e
-                res_df = res_df.hstack(pl.DataFrame(res.json()))
+        xs_df = xs if isinstance(xs, pl.DataFrame) else pl.DataFrame(xs)
 
+        if len(self.simulators) > 1:
+            # the simulators are independent of each other, so they are run concurrently
+            with ThreadPoolExecutor(max_workers=len(self.simulators)) as executor:
+                results = list(executor.map(lambda sim: self._run_simulator(sim, xs_df), self.simulators))
+        else:
+            results = [self._run_simulator(sim, xs_df) for sim in self.simulators]
+
+        res_df = pl.DataFrame()
+        for result in results:
+            res_df = res_df.hstack(result)
 
         # Evaluate the minimization form of the objective functions
         min_obj_columns = pl.DataFrame()
@@ -185,7 +244,56 @@ class Evaluator:
         scalarization_columns = res_df.select(*[expr.alias(symbol) for symbol, expr in self.scalarization_funcs])
         return res_df.hstack(scalarization_columns)
 
-    def _evaluate_surrogates(self, xs: dict[str, list[int | float]]) -> pl.DataFrame:
+    def _run_simulator(self, sim: Simulator, xs: pl.DataFrame) -> pl.DataFrame:
+        """Run a simulator for the given decision variables.
+
+        Simulator files defining a `simulator` function are evaluated in a pool of long-lived worker processes (see
+        `SimulatorWorkerPool`). Other simulator files are run in a new process for each call, with the decision
+        variables and parameters given as command line arguments.
+
+        Args:
+            sim (Simulator): the simulator.
+            xs (pl.DataFrame): the decision variables, with a column for each decision variable.
+
+        Raises:
+            EvaluatorError: the simulator failed.
+
+        Returns:
+            pl.DataFrame: the results of the simulator, with a column for each simulated function.
+        """
+        # gather the possible parameters for the simulator
+        params = self.params.get(sim.name, {})
+        if sim.file is not None:
+            workers = self._simulator_workers[sim.name]
+            if workers.supported is not False:
+                try:
+                    return workers.evaluate(xs, params)
+                except SimulatorWorkerError as e:
+                    if workers.supported:
+                        raise EvaluatorError(str(e)) from e
+
+            # call the simulator with the decision variable values and parameters as dicts
+            res = subprocess.run(
+                [sys.executable, sim.file, "-d", str(xs.to_dict(as_series=False)), "-p", str(params)],
+                capture_output=True,
+                text=True,
+            )
+            if res.returncode != 0:
+                raise EvaluatorError(res.stderr)
+            # gather the simulation results (a dict) into a dataframe
+            return pl.DataFrame(json.loads(res.stdout))
+
+        # call the endpoint
+        with self._simulator_client_lock:
+            if self._simulator_client is None:
+                self._simulator_client = SimulatorClient(self.http_options)
+            client = self._simulator_client
+        try:
+            return client.evaluate(sim.url, xs, params)
+        except requests.RequestException as e:
+            raise EvaluatorError(f"Failed to call the simulator at {sim.url}. Is the simulator server running?") from e
+
+    def _evaluate_surrogates(self, xs: dict[str, list[int | float]] | pl.DataFrame) -> pl.DataFrame:
         """Evaluate the problem for the given decision variables using the surrogate models.
 
         Args:
@@ -199,23 +307,39 @@ class Evaluator:
                 dataframe. The uncertainty prediction values are also returned. If a model does not provide
                 uncertainty predictions, then they are set as NaN.
         """
-        res = pl.DataFrame()
-        var = np.array([value for _, value in xs.items()]).T  # has to be transpose (at least for sklearn models)
-        for symbol in self.surrogates:
-            # get a list of args accepted by the model's predict function
-            accepted_args = getfullargspec(self.surrogates[symbol].predict).args
-            # if "return_std" accepted, gather the uncertainty predictions as well
-            if "return_std" in accepted_args:
-                value, uncertainty = self.surrogates[symbol].predict(var, return_std=True)
-            # otherwise, set the uncertainties as NaN
-            else:
-                value = self.surrogates[symbol].predict(var)
-                uncertainty = np.full(np.shape(value), np.nan)
-            # add the objects, constraints and extra functions into the polars dataframe
-            # values go into columns with the symbol as the column names
-            res = res.with_columns(pl.Series(value).alias(symbol))
-            # uncertainties go into columns with {symbol}_uncert as the column names
-            res = res.with_columns(pl.Series(uncertainty).alias(f"{symbol}_uncert"))
+        # a single contiguous array of the decision variables, shared by all the models
+        if isinstance(xs, pl.DataFrame):
+            var = np.ascontiguousarray(xs.to_numpy(), dtype=np.float64)
+        else:
+            # has to be transpose (at least for sklearn models)
+            var = np.ascontiguousarray(np.array([value for _, value in xs.items()], dtype=np.float64).T)
+
+        def predict(symbol: str) -> tuple[np.ndarray, np.ndarray]:
+            model = self.surrogates[symbol]
+            chunk_rows = (
+                max(1, self.surrogate_memory_budget // _prediction_row_bytes(model, var.shape[1]))
+                if self.surrogate_memory_budget is not None
+                else max(len(var), 1)
+            )
+            return _predict(model, var, self._surrogate_returns_std[symbol], chunk_rows)
+
+        symbols = list(self.surrogates)
+        if len(symbols) > 1:
+            # the models are independent of each other, and sklearn and numpy release the GIL while predicting
+            with ThreadPoolExecutor(max_workers=min(len(symbols), os.cpu_count() or 1)) as executor:
+                predictions = list(executor.map(predict, symbols))
+        else:
+            predictions = [predict(symbol) for symbol in symbols]
+
+        # values go into columns with the symbol as the column names, and
+        # uncertainties go into columns with {symbol}_uncert as the column names
+        res = pl.DataFrame(
+            [
+                series
+                for symbol, (value, uncertainty) in zip(symbols, predictions, strict=True)
+                for series in (pl.Series(symbol, value), pl.Series(f"{symbol}_uncert", uncertainty))
+            ]
+        )
 
         # Evaluate the minimization form of the objective functions
         min_obj_columns = pl.DataFrame()
@@ -224,10 +348,10 @@ class Evaluator:
                 min_obj_columns = min_obj_columns.hstack(
                     res.select((min_max_mult * pl.col(f"{symbol}")).alias(f"{symbol}_min"))
                 )
-        res_df = res_df.hstack(min_obj_columns)
+        res = res.hstack(min_obj_columns)
         # If there are scalarization functions, evaluate them as well
-        scalarization_columns = res_df.select(*[expr.alias(symbol) for symbol, expr in self.scalarization_funcs])
-        return res_df.hstack(scalarization_columns)
+        scalarization_columns = res.select(*[expr.alias(symbol) for symbol, expr in self.scalarization_funcs])
+        return res.hstack(scalarization_columns)
 
     def _load_surrogates(self, surrogate_paths: dict[str, Path] | None = None):
         """Load the surrogate models from disk and store them within the evaluator.
@@ -286,31 +410,48 @@ class Evaluator:
                             self.surrogates[extra.symbol] = sio.load(file, unknown_types)
                             #raise EvaluatorError(f"Untrusted types found in the model of {obj.symbol}: {unknown_types}")"""
 
-    def evaluate(self, xs: dict[str, list[int | float]], flat: bool = False) -> pl.DataFrame:
+        # check once which models can predict uncertainties
+        self._surrogate_returns_std = {
+            symbol: "return_std" in getfullargspec(model.predict).args for symbol, model in self.surrogates.items()
+        }
+
+    def close(self) -> None:
+        """Stop the worker processes of the simulators and close the connections to the simulators, if any.
+
+        The workers are restarted and the connections reopened if the evaluator is used again.
+        """
+        for workers in self._simulator_workers.values():
+            workers.close()
+        with self._simulator_client_lock:
+            if self._simulator_client is not None:
+                self._simulator_client.close()
+                self._simulator_client = None
+
+    def evaluate(self, xs: dict[str, list[int | float]] | pl.DataFrame, flat: bool = False) -> pl.DataFrame:
         """Evaluate the functions for the given decision variables.
 
         Evaluates analytical, simulation based and surrogate based functions. For now, the evaluator assumes that there
         are no data based objectives.
 
         Args:
-            xs (dict[str, list[int | float]]): The decision variables for which the functions are to be evaluated.
-                Given as a dictionary with the decision variable symbols as keys and a list of decision variable values
-                as the values. The length of the lists is the number of samples and each list should have the same
-                length (same number of samples).
+            xs (dict[str, list[int | float]] | pl.DataFrame): The decision variables for which the functions are to be
+                evaluated. Given as a dictionary (or dataframe) with the decision variable symbols as keys (columns)
+                and a list of decision variable values as the values. The length of the lists is the number of
+                samples and each list should have the same length (same number of samples).
             flat (bool, optional): whether the valuation is done using flattened variables or not. Defaults to False.
 
         Returns:
             pl.DataFrame: polars dataframe with the evaluated function values.
         """
-        # TODO (@gialmisi): Make work with polars dataframes as well in addition to dict.
-        # See, e.g., PolarsEvaluator._polars_evaluate. Then, remove the arg `flat`.
+        # TODO (@gialmisi): Remove the arg `flat`.
         res = pl.DataFrame()
 
         # Evaluate the analytical functions
-        if len(self.analytical_symbols + self.data_based_symbols) > 0:
-            polars_evaluator = PolarsEvaluator(self.problem, evaluator_mode=PolarsEvaluatorModesEnum.mixed)
+        if self.polars_evaluator is not None:
             analytical_values = (
-                polars_evaluator._polars_evaluate(xs) if not flat else polars_evaluator._polars_evaluate_flat(xs)
+                self.polars_evaluator._polars_evaluate(xs)
+                if not flat
+                else self.polars_evaluator._polars_evaluate_flat(xs)
             )
             res = res.hstack(analytical_values)
 
@@ -0,0 +1,323 @@
+"""Long-lived worker processes for evaluating the simulator files of problems.
+
+Instead of starting a new Python interpreter for each evaluated batch of decision variables, a `SimulatorWorker`
+starts a worker process once, which imports the simulator file and then evaluates batches sent to it until it is
+closed. A `SimulatorWorkerPool` keeps a few workers per simulator file, so that concurrent batches are evaluated in
+parallel. The batches of decision variables and the results are exchanged over the pipes of the worker
+in the Arrow IPC format, so that there are no limits on the size of the batches.
+
+To be evaluated in a worker, the simulator file must define a top-level function
+`simulator(xs: dict, params: dict) -> dict`, where `xs` has the decision variable symbols as keys and lists of their
+values as values, `params` are the parameters of the simulator, and the returned dict has the symbols of the
+simulated functions as keys and lists of their values as values. The simulator files of the tests in `tests/data`
+are examples of this. The files that do not define the function are not run in a worker at all.
+
+Each message is sent as two frames, each prefixed by its length as an unsigned 64-bit little-endian integer: a JSON
+header, and a payload in the Arrow IPC format. The requests have the parameters of the simulator in their header and
+the decision variables as their payload. The responses have the status of the evaluation in their header and the
+results as their payload.
+"""
+
+import ast
+import importlib.util
+import io
+import json
+import os
+import struct
+import subprocess
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import BinaryIO
+
+import polars as pl
+
+_LENGTH = struct.Struct("<Q")
+"""The length prefix of the frames of the messages."""
+
+
+class SimulatorWorkerError(Exception):
+    """Raised when a simulator file cannot be evaluated in a worker."""
+
+
+def _write_message(stream: BinaryIO, header: dict, payload: bytes = b"") -> None:
+    """Write a message, i.e., a JSON header and a payload, to a stream."""
+    for frame in (json.dumps(header).encode(), payload):
+        stream.write(_LENGTH.pack(len(frame)))
+        stream.write(frame)
+    stream.flush()
+
+
+def _read_frame(stream: BinaryIO) -> bytes | None:
+    """Read a frame from a stream, returning None if the stream ends before the frame does."""
+    prefix = stream.read(_LENGTH.size)
+    if len(prefix) < _LENGTH.size:
+        return None
+    (length,) = _LENGTH.unpack(prefix)
+    frame = stream.read(length)
+    return frame if len(frame) == length else None
+
+
+def _read_message(stream: BinaryIO) -> tuple[dict, bytes] | None:
+    """Read a message from a stream, returning None if the stream ends before the message does."""
+    header = _read_frame(stream)
+    payload = _read_frame(stream) if header is not None else None
+    if payload is None:
+        return None
+    return json.loads(header), payload
+
+
+def _defines_simulator(file: str | Path) -> bool:
+    """Check whether a simulator file defines a top-level `simulator` function, without running the file.
+
+    Args:
+        file (str | Path): the path to the simulator file.
+
+    Returns:
+        bool: whether the file defines the function, and can therefore be evaluated in a worker.
+    """
+    try:
+        tree = ast.parse(Path(file).read_bytes(), filename=str(file))
+    except (OSError, SyntaxError, ValueError):
+        return False
+    return any(isinstance(node, ast.FunctionDef) and node.name == "simulator" for node in tree.body)
+
+
+def _to_ipc(df: pl.DataFrame) -> bytes:
+    """Serialize a dataframe in the Arrow IPC format."""
+    return df.write_ipc(None).getvalue()
+
+
+def _from_ipc(payload: bytes) -> pl.DataFrame:
+    """Deserialize a dataframe from the Arrow IPC format."""
+    return pl.read_ipc(io.BytesIO(payload))
+
+
+class SimulatorWorker:
+    """A long-lived worker process evaluating a simulator file.
+
+    The worker process is started on first use. If it crashes, e.g., because the simulator runs out of memory,
+    it is restarted and the batch is evaluated again, up to `max_restarts` times per batch. The worker can be used
+    from many threads, but it evaluates a single batch at a time, see `SimulatorWorkerPool` for evaluating batches
+    in parallel.
+    """
+
+    def __init__(self, file: str | Path, max_restarts: int = 2):
+        """Initialize the worker of a simulator file.
+
+        Args:
+            file (str | Path): the path to the simulator file.
+            max_restarts (int, optional): the number of times the worker process is restarted, if it crashes
+                while evaluating a batch. Defaults to 2.
+        """
+        self.file = Path(file)
+        self.max_restarts = max_restarts
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+        self.supported: bool | None = None
+        """Whether the simulator file can be evaluated in a worker, or None if the worker has not been started."""
+        self._unsupported_reason = ""
+
+    def _start(self) -> bool:
+        """Start the worker process, if it is not running, and return whether the simulator file is supported."""
+        if self._process is not None and self._process.poll() is None:
+            return True
+        if self.supported is None and not _defines_simulator(self.file):
+            # the file is not run at all, e.g., a script that would run a simulation when imported
+            self.supported = False
+            self._unsupported_reason = "it does not define a top-level 'simulator' function."
+        if self.supported is False:
+            return False
+
+        self._process = subprocess.Popen(
+            [sys.executable, __file__, str(self.file)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        # the worker responds with a message once it has imported the simulator file
+        message = _read_message(self._process.stdout)
+        self.supported = message is not None and message[0]["ok"]
+        if not self.supported:
+            self._unsupported_reason = (
+                f"importing it failed:\n{message[0]['error']}" if message is not None else "the worker crashed."
+            )
+            self._stop()
+        return self.supported
+
+    def _stop(self) -> None:
+        """Stop the worker process, if it has been started."""
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.stdin.close()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+    def evaluate(self, xs: pl.DataFrame, params: dict) -> pl.DataFrame:
+        """Evaluate a batch of decision variables with the simulator.
+
+        Args:
+            xs (pl.DataFrame): the decision variables, with a column for each decision variable.
+            params (dict): the parameters of the simulator. Must be serializable as JSON.
+
+        Raises:
+            SimulatorWorkerError: the simulator file cannot be evaluated in a worker, the simulator raised an
+                exception, or the worker crashed more than `max_restarts` times.
+
+        Returns:
+            pl.DataFrame: the results of the simulator, with a column for each simulated function.
+        """
+        payload = _to_ipc(xs)
+        with self._lock:
+            for _ in range(self.max_restarts + 1):
+                if not self._start():
+                    msg = f"The simulator file {self.file} cannot be evaluated in a worker, {self._unsupported_reason}"
+                    raise SimulatorWorkerError(msg)
+
+                try:
+                    _write_message(self._process.stdin, {"params": params}, payload)
+                    message = _read_message(self._process.stdout)
+                except BrokenPipeError:
+                    message = None
+
+                if message is None:
+                    # the worker crashed, restart it and try again
+                    self._stop()
+                    continue
+
+                header, results = message
+                if not header["ok"]:
+                    msg = f"The simulator {self.file} failed:\n{header['error']}"
+                    raise SimulatorWorkerError(msg)
+                return _from_ipc(results)
+
+        msg = f"The worker of the simulator {self.file} crashed {self.max_restarts + 1} times."
+        raise SimulatorWorkerError(msg)
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            self._stop()
+
+    def __del__(self):
+        """Stop the worker process when the worker is garbage collected."""
+        if getattr(self, "_process", None) is not None:
+            self._stop()
+
+
+class SimulatorWorkerPool:
+    """A pool of workers evaluating a simulator file, so that concurrent batches are evaluated in parallel.
+
+    Each evaluation takes an idle worker from the pool. If all the workers are busy, a new one is started, unless
+    there are already `max_workers` of them, in which case the evaluation waits for a worker to become idle. The
+    lock of the pool only guards taking and returning the workers, the batches are evaluated outside of it.
+    """
+
+    def __init__(self, file: str | Path, max_workers: int | None = None, max_restarts: int = 2):
+        """Initialize an empty pool of workers of a simulator file.
+
+        Args:
+            file (str | Path): the path to the simulator file.
+            max_workers (int | None, optional): the maximum number of workers, i.e., of batches evaluated at the
+                same time. If None, the number of CPUs is used. Defaults to None.
+            max_restarts (int, optional): the number of times a worker process is restarted, if it crashes
+                while evaluating a batch. Defaults to 2.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be a positive integer or None.")
+        self.file = Path(file)
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self.max_restarts = max_restarts
+        self._workers: list[SimulatorWorker] = []
+        self._idle: list[SimulatorWorker] = []
+        self._available = threading.Condition()
+        self.supported: bool | None = None
+        """Whether the simulator file can be evaluated in a worker, or None if no worker has been started."""
+
+    def _acquire(self) -> SimulatorWorker:
+        """Take an idle worker, starting a new one if there are none and the pool is not full."""
+        with self._available:
+            while not self._idle and len(self._workers) >= self.max_workers:
+                self._available.wait()
+            if self._idle:
+                # the most recently used worker is the most likely to still be in memory
+                return self._idle.pop()
+            worker = SimulatorWorker(self.file, max_restarts=self.max_restarts)
+            self._workers.append(worker)
+            return worker
+
+    def _release(self, worker: SimulatorWorker) -> None:
+        """Return a worker to the idle workers of the pool."""
+        with self._available:
+            self._idle.append(worker)
+            self._available.notify()
+
+    def evaluate(self, xs: pl.DataFrame, params: dict) -> pl.DataFrame:
+        """Evaluate a batch of decision variables with the simulator, in an idle worker of the pool.
+
+        Args:
+            xs (pl.DataFrame): the decision variables, with a column for each decision variable.
+            params (dict): the parameters of the simulator. Must be serializable as JSON.
+
+        Raises:
+            SimulatorWorkerError: the simulator file cannot be evaluated in a worker, the simulator raised an
+                exception, or the worker crashed more than `max_restarts` times.
+
+        Returns:
+            pl.DataFrame: the results of the simulator, with a column for each simulated function.
+        """
+        worker = self._acquire()
+        try:
+            return worker.evaluate(xs, params)
+        finally:
+            if worker.supported is not None:
+                self.supported = worker.supported
+            self._release(worker)
+
+    def close(self) -> None:
+        """Stop the worker processes, waiting for the batches being evaluated to finish."""
+        with self._available:
+            workers = list(self._workers)
+        # the lock of the pool is not held, so that the busy workers can be returned to the pool
+        for worker in workers:
+            worker.close()
+
+
+def _serve(file: Path) -> None:
+    """Evaluate the batches sent to the worker process with the simulator defined in a file."""
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    # anything printed by the simulator must not end up in the messages
+    sys.stdout = sys.stderr
+
+    # the simulator files are usually run as scripts, which can import the modules next to them
+    sys.path.insert(0, str(file.parent))
+    try:
+        spec = importlib.util.spec_from_file_location(file.stem, file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        simulator = module.simulator
+        if not callable(simulator):
+            raise TypeError("'simulator' is not callable.")  # noqa: TRY301
+    except BaseException:
+        # also, e.g., SystemExit from a script parsing the arguments of the worker
+        _write_message(stdout, {"ok": False, "error": traceback.format_exc()})
+        return
+    _write_message(stdout, {"ok": True})
+
+    while (message := _read_message(stdin)) is not None:
+        header, payload = message
+        try:
+            results = pl.DataFrame(simulator(_from_ipc(payload).to_dict(as_series=False), header["params"]))
+        except Exception:
+            _write_message(stdout, {"ok": False, "error": traceback.format_exc()})
+            continue
+        _write_message(stdout, {"ok": True}, _to_ipc(results))
+
+
+if __name__ == "__main__":
+    _serve(Path(sys.argv[1]))
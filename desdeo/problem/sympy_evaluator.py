@@ -1,7 +1,11 @@
 """Implements and evaluator based on sympy expressions."""
 
+import warnings
+from collections.abc import Callable, Sequence
 from copy import deepcopy
+from enum import Enum
 
+import numpy as np
 import sympy as sp
 
 from desdeo.problem.evaluator import variable_dimension_enumerate
@@ -15,14 +19,54 @@ class SympyEvaluatorError(Exception):
     """Raised when an exception with a Sympy evaluator is encountered."""
 
 
+class SympyCompilationEnum(str, Enum):
+    """Enumerates the ways the expressions are compiled for evaluating batches of decision variables."""
+
+    numpy = "numpy"
+    """Each expression is lambdified into NumPy code on its own."""
+    cse = "cse"
+    """The expressions are lambdified into a single NumPy function, in which the subexpressions
+    common to the expressions are evaluated only once."""
+    numba = "numba"
+    """Like `cse`, but the function is also compiled with numba. Requires the `numba` package. If numba
+    cannot compile the function, e.g., because an operator is not supported by numba, `cse` is used instead."""
+
+
+def _numba_jit(function: Callable) -> Callable:
+    """Compile a lambdified function with numba, falling back to the function itself if it cannot be compiled."""
+    try:
+        import numba  # noqa: PLC0415
+    except ImportError as e:
+        msg = "Compiling the expressions with numba requires the 'numba' package."
+        raise SympyEvaluatorError(msg) from e
+
+    jitted = numba.njit(function)
+
+    def call(*args):
+        nonlocal jitted
+        if jitted is not None:
+            try:
+                return jitted(*args)
+            # numba raises various errors for code it does not support
+            except Exception as e:
+                msg = f"The expressions could not be compiled with numba, using NumPy instead: {e}"
+                warnings.warn(msg, stacklevel=2)
+                jitted = None
+        return function(*args)
+
+    return call
+
+
 class SympyEvaluator:
     """Defines an evaluator that can be used to evaluate instances of Problem utilizing sympy."""
 
-    def __init__(self, problem: Problem):
+    def __init__(self, problem: Problem, compilation: SympyCompilationEnum = SympyCompilationEnum.cse):
         """Initializes the evaluator.
 
         Args:
             problem (Problem): the problem to be evaluated.
+            compilation (SympyCompilationEnum, optional): how the expressions are compiled for evaluating
+                batches of decision variables, see `evaluate_batch`. Defaults to `SympyCompilationEnum.cse`.
         """
         if variable_dimension_enumerate(problem) not in SUPPORTED_VAR_DIMENSIONS:
             msg = "SymPy evaluator does not yet support tensors."
@@ -183,26 +227,52 @@ class SympyEvaluator:
         else:
             _scalarization_expressions = None
 
+        # the expressions with all the symbols, except the variables, substituted
+        self._substituted_expressions = {
+            k: d[k]
+            for d in [
+                _extra_expressions,
+                _objective_expressions,
+                _objective_expressions_min,
+                _constraint_expressions,
+                _scalarization_expressions,
+            ]
+            if d is not None
+            for k in d
+        }
+
         # initialize callable lambdas
         self.lambda_exprs = {
-            _k: _v
-            for _d in [
-                {k: sp.lambdify(self.variable_symbols, d[k]) for k in d}
-                for d in [
-                    _extra_expressions,
-                    _objective_expressions,
-                    _objective_expressions_min,
-                    _constraint_expressions,
-                    _scalarization_expressions,
-                ]
-                if d is not None
-            ]
-            for _k, _v in _d.items()
+            k: sp.lambdify(self.variable_symbols, expr) for k, expr in self._substituted_expressions.items()
         }
 
+        self.compilation = SympyCompilationEnum(compilation)
+        # the functions evaluating batches, compiled on first use for each combination of targets
+        self._batch_functions: dict[tuple[str, ...], Callable] = {}
+
         self.problem = problem
         self.parser = parser
 
+    def update_constants(self, values: dict[str, int | float]):
+        """Updates the values of constants of the problem being evaluated.
+
+        The values of the constants are substituted into the expressions when they are lambdified,
+        so the expressions of the problem are lambdified again with the updated values.
+
+        Args:
+            values (dict[str, int | float]): a dict with the symbols of the constants to be updated
+                as its keys and their new values as its values.
+
+        Raises:
+            SympyEvaluatorError: when a symbol in `values` does not refer to a constant defined in the problem.
+        """
+        try:
+            problem = self.problem.update_constants(values)
+        except ValueError as e:
+            raise SympyEvaluatorError(str(e)) from e
+
+        self.__init__(problem, self.compilation)
+
     def evaluate(self, xs: dict[str, float | int | bool]) -> dict[str, float | int | bool]:
         """Evaluate the the whole problem with a given decision variable dict.
 
@@ -242,3 +312,53 @@ class SympyEvaluator:
                 and values being the value of the corresponding constraint.
         """
         return {k: self.lambda_exprs[k](**xs) for k in [constr.symbol for constr in self.problem.constraints]}
+
+    def _batch_function(self, targets: tuple[str, ...]) -> Callable:
+        """Return a function evaluating the targets with the columns of the decision variables as its arguments."""
+        if targets not in self._batch_functions:
+            expressions = tuple(self._substituted_expressions[target] for target in targets)
+            if self.compilation == SympyCompilationEnum.numpy:
+                functions = [sp.lambdify(self.variable_symbols, expr, modules="numpy") for expr in expressions]
+                function = lambda *args: tuple(f(*args) for f in functions)  # noqa: E731
+            else:
+                function = sp.lambdify(self.variable_symbols, expressions, modules="numpy", cse=True)
+                if self.compilation == SympyCompilationEnum.numba:
+                    function = _numba_jit(function)
+            self._batch_functions[targets] = function
+        return self._batch_functions[targets]
+
+    def evaluate_batch(
+        self, xs: np.ndarray | dict[str, Sequence[float]], targets: Sequence[str] | None = None
+    ) -> dict[str, np.ndarray]:
+        """Evaluate the problem with a batch of decision variables at once.
+
+        The expressions of all the targets are evaluated with a single vectorized call, compiled as
+        defined by `compilation` (see `SympyCompilationEnum`).
+
+        Args:
+            xs (np.ndarray | dict[str, Sequence[float]]): the decision variables, either as a 2-D array with a
+                row for each solution and a column for each variable, in the order of `variable_symbols`, or as
+                a dict with the variable symbols as its keys and sequences of the variable values as its values.
+            targets (Sequence[str] | None, optional): the symbols of the functions to be evaluated. If None,
+                all the functions of the problem are evaluated. Defaults to None.
+
+        Returns:
+            dict[str, np.ndarray]: a dict with the symbols of the evaluated functions as its keys, and arrays
+                with the values of the functions for each solution as its values. If all the functions are
+                evaluated, the decision variables are included as well.
+        """
+        if isinstance(xs, dict):
+            xs = np.column_stack([np.asarray(xs[symbol], dtype=np.float64) for symbol in self.variable_symbols])
+        xs = np.asarray(xs, dtype=np.float64).reshape(-1, len(self.variable_symbols))
+
+        _targets = tuple(self._substituted_expressions) if targets is None else tuple(targets)
+        values = self._batch_function(_targets)(*xs.T)
+
+        # expressions that do not depend on the variables are evaluated into scalars
+        results = {
+            target: np.full(len(xs), value, dtype=np.float64) if np.ndim(value) == 0 else np.asarray(value)
+            for target, value in zip(_targets, values, strict=True)
+        }
+        if targets is None:
+            results |= {symbol: xs[:, i] for i, symbol in enumerate(self.variable_symbols)}
+        return results
@@ -1,15 +1,16 @@
 # A FastAPI server to expose pymoo benchmark problems
-from sqlalchemy.sql._elements_constructors import desc
-from sqlalchemy.util.langhelpers import symbol
+import io
 from functools import lru_cache
-from typing import Any
 
 import polars as pl
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from pymoo.problems import get_problem
 
 from desdeo.problem.schema import Variable, Objective, Simulator, Problem, Url
+from desdeo.problem.simulator_client import ARROW_MEDIA_TYPE
 import requests
 
 
@@ -39,18 +40,33 @@ def get_pymoo_problem(p: PymooParameters):
 
 
 @app.get("/evaluate")
-def evaluate(d: dict[str, list[float]], p: PymooParameters) -> dict[str, Any]:
+async def evaluate(request: Request) -> Response:
     """
     Evaluate a pymoo problem instance with given parameters and input values.
+
+    The input values and parameters are given either as JSON, `{"d": {"x_1": [...], ...}, "p": {...}}`, or, if the
+    content type is the Arrow IPC stream format, as an Arrow IPC stream with the parameters as JSON in the query
+    parameter 'p'. The outputs are returned in the Arrow IPC stream format if it is accepted, and as JSON otherwise.
     """
-    problem = get_pymoo_problem(p)
+    if request.headers.get("content-type") == ARROW_MEDIA_TYPE:
+        xs_df = pl.read_ipc_stream(io.BytesIO(await request.body()))
+        p = PymooParameters.model_validate_json(request.query_params["p"])
+    else:
+        body = await request.json()
+        xs_df = pl.DataFrame(body["d"])
+        p = PymooParameters.model_validate(body["p"])
 
-    xs_df = pl.DataFrame(d)
+    problem = get_pymoo_problem(p)
 
-    output = problem.evaluate(xs_df.to_numpy())
-    output_df = pl.DataFrame(output, schema=[f"f_{i+1}" for i in range(problem.n_obj)])
+    # evaluate in a thread, so that concurrent requests are not blocked
+    output = await run_in_threadpool(problem.evaluate, xs_df.to_numpy())
+    output_df = xs_df.hstack(pl.DataFrame(output, schema=[f"f_{i+1}" for i in range(problem.n_obj)]))
 
-    return d | output_df.to_dict(as_series=False)
+    if ARROW_MEDIA_TYPE in request.headers.get("accept", ""):
+        buffer = io.BytesIO()
+        output_df.write_ipc_stream(buffer)
+        return Response(content=buffer.getvalue(), media_type=ARROW_MEDIA_TYPE)
+    return JSONResponse(output_df.to_dict(as_series=False))
 
 
 @app.get("/info")
@@ -71,18 +87,23 @@ url = "http://127.0.0.1"
 port = 8000
 
 
-def server_problem(parameters: PymooParameters)-> Problem:
+def server_problem(parameters: PymooParameters, server_url: str = f"{url}:{port}") -> Problem:
     """
     Create a Problem instance from pymoo parameters.
+
+    Args:
+        parameters (PymooParameters): the parameters of the pymoo problem.
+        server_url (str, optional): the URL of the server, without a path. Defaults to the URL the server is run at
+            when this module is run as a script.
     """
     try:
-        info = requests.get(url + f":{port}/info", json=parameters.dict())
+        info = requests.get(f"{server_url}/info", json=parameters.dict())
         info.raise_for_status()
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to fetch problem info. Is the server running?") from e
     info: ProblemInfo= ProblemInfo.model_validate(info.json())
 
-    simulator_url = Url(url=f"{url}:{port}/evaluate")
+    simulator_url = Url(url=f"{server_url}/evaluate")
         
 
     return Problem(
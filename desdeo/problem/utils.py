@@ -1,5 +1,6 @@
 """Various utilities used across the framework related to the Problem formulation."""
 
+import hashlib
 import itertools
 import warnings
 from functools import reduce
@@ -201,6 +202,22 @@ def get_ideal_dict(problem: Problem) -> dict[str, float]:
     return {objective.symbol: objective.ideal for objective in problem.objectives}
 
 
+def problem_fingerprint(problem: Problem) -> str:
+    """Return a hash of the structure of a problem.
+
+    Two problems have the same fingerprint when all of their fields, e.g., variables,
+    objectives, constraints, and scalarization functions, are equal, even if they are
+    different instances.
+
+    Args:
+        problem (Problem): the problem to fingerprint.
+
+    Returns:
+        str: a hex digest of the serialized problem.
+    """
+    return hashlib.sha256(problem.model_dump_json().encode()).hexdigest()
+
+
 def tensor_constant_from_dataframe(
     df: pl.DataFrame, name: str, symbol: str, n_rows: int, column_names: list[str]
 ) -> TensorConstant:
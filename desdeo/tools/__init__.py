@@ -17,6 +17,7 @@ __all__ = [
     "ScipyMinimizeSolver",
     "SolverOptions",
     "SolverResults",
+    "SubproblemExecutor",
     "ScalarizationError",
     "add_asf_diff",
     "add_asf_generic_nondiff",
@@ -44,10 +45,14 @@ __all__ = [
     "find_compatible_solvers",
     "get_corrected_ideal_and_nadir",
     "flip_maximized_objective_values",
+    "get_subproblem_executor",
     "guess_best_solver",
     "payoff_table_method",
+    "scalarization_parameters",
+    "solve_asf_batch",
 ]
 
+from desdeo.tools.asf_batch import solve_asf_batch
 from desdeo.tools.generics import BaseSolver, SolverOptions, SolverResults
 from desdeo.tools.gurobipy_solver_interfaces import (
     GurobipySolver,
@@ -90,8 +95,10 @@ from desdeo.tools.scalarization import (
     add_stom_sf_diff,
     add_stom_sf_nondiff,
     add_weighted_sums,
+    scalarization_parameters,
 )
 from desdeo.tools.scipy_solver_interfaces import ScipyDeSolver, ScipyMinimizeSolver
+from desdeo.tools.subproblem_executor import SubproblemExecutor, get_subproblem_executor
 from desdeo.tools.utils import (
     available_solvers,
     find_compatible_solvers,
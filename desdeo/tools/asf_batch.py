@@ -0,0 +1,160 @@
+"""Projection of many reference points onto the Pareto front with the achievement scalarizing function.
+
+Many methods project a set of reference points onto the Pareto front, e.g., the Iterative Pareto Representer,
+the precomputation of E-NAUTILUS, and the generation of data for explanations. Instead of adding the achievement
+scalarizing function (ASF) to the problem and initializing a solver separately for each reference point,
+`solve_asf_batch` adds a parametric ASF once and only updates its reference point between the solves. Each solve
+is warm-started from the solution of the closest reference point already projected successfully.
+"""
+
+from collections.abc import Sequence
+
+import gurobipy as gp
+import numpy as np
+import polars as pl
+
+from desdeo.problem import GurobipyEvaluator, Problem, PyomoEvaluator, Variable
+from desdeo.tools.generics import BaseSolver, SolverOptions, SolverResults
+from desdeo.tools.scalarization import add_asf_diff, add_asf_nondiff, scalarization_parameters
+from desdeo.tools.subproblem_executor import SubproblemExecutor, get_subproblem_executor
+from desdeo.tools.utils import guess_best_solver
+
+_ASF_SYMBOL = "_asf"
+"""The symbol of the parametric ASF added to the problem."""
+
+
+def _warm_start(solver: BaseSolver, variables: dict[str, float]) -> None:
+    """Set the starting point of the next solve, if the evaluator of the solver supports it.
+
+    Only the scalar variables of the problem are set, the auxiliary variables of the scalarization are not.
+
+    Args:
+        solver (BaseSolver): the solver.
+        variables (dict[str, float]): the values of the variables.
+    """
+    evaluator = getattr(solver, "evaluator", None)
+    if isinstance(evaluator, PyomoEvaluator):
+        for symbol, value in variables.items():
+            getattr(evaluator.model, symbol).set_value(value, skip_validation=True)
+    elif isinstance(evaluator, GurobipyEvaluator):
+        for symbol, value in variables.items():
+            evaluator.model.getVarByName(symbol).setAttr(gp.GRB.Attr.Start, value)
+
+
+def _solve_asf_chunk(task: tuple) -> list[SolverResults]:
+    """Project a chunk of reference points reusing a single solver, in the calling process or in a worker."""
+    problem_w_asf, solver, solver_options, reference_points, variable_symbols = task
+
+    solver_instance = solver(problem_w_asf, solver_options) if solver_options is not None else solver(problem_w_asf)
+
+    results = []
+    # the reference points projected successfully and their results, the only ones warm-started from
+    solved_points = []
+    solved_results = []
+    for reference_point in reference_points:
+        solver_instance.update_constants(scalarization_parameters(_ASF_SYMBOL, "rp", reference_point))
+
+        if solved_points:
+            # warm-start from the solution of the closest reference point already projected
+            distances = np.linalg.norm(np.array(solved_points) - np.array(list(reference_point.values())), axis=1)
+            closest = solved_results[int(np.argmin(distances))]
+            _warm_start(solver_instance, {s: closest.optimal_variables[s] for s in variable_symbols})
+
+        result = solver_instance.solve(_ASF_SYMBOL)
+        results.append(result)
+        if result.success:
+            solved_points.append(list(reference_point.values()))
+            solved_results.append(result)
+
+    return results
+
+
+def solve_asf_batch(
+    problem: Problem,
+    reference_points: Sequence[dict[str, float]] | pl.DataFrame,
+    solver: type[BaseSolver] | None = None,
+    solver_options: SolverOptions | None = None,
+    scalarization_options: dict | None = None,
+    executor: SubproblemExecutor | None = None,
+) -> pl.DataFrame:
+    """Project many reference points onto the Pareto front of a problem with the achievement scalarizing function.
+
+    The ASF is added to the problem once, with its reference point as constants (see `add_asf_diff`
+    with `parametric=True`), and a single solver is initialized for it. For each reference point, only
+    the reference point is updated in the solver, and the solve is warm-started from the solution of the
+    closest reference point already projected successfully. If the executor has many workers, the reference
+    points are split into as many chunks, which are projected in parallel, each with its own solver.
+
+    Args:
+        problem (Problem): the problem.
+        reference_points (Sequence[dict[str, float]] | pl.DataFrame): the reference points, either as a
+            sequence of objective dicts, or as a dataframe with a column for each objective function.
+        solver (type[BaseSolver] | None, optional): the solver used to project the reference points. The solver
+            must support updating constants, see `BaseSolver.update_constants`. If not given, the method tries
+            to guess the most suitable solver based on the problem. Defaults to None.
+        solver_options (SolverOptions | None, optional): options passed to the solver. Defaults to None.
+        scalarization_options (dict | None, optional): keyword arguments passed to the ASF. Defaults to None.
+        executor (SubproblemExecutor | None, optional): the executor used to project the chunks of the reference
+            points. Defaults to None, in which case the shared executor returned by `get_subproblem_executor` is
+            used.
+
+    Note:
+        If the problem is twice differentiable, `add_asf_diff` is used. Otherwise, `add_asf_nondiff` is used.
+
+    Raises:
+        ValueError: no reference points are given.
+
+    Returns:
+        pl.DataFrame: a dataframe with a row for each reference point, in the same order as the reference points.
+            The columns are the decision variables, the objective functions, the constraints of the problem (if any),
+            and a column 'success' indicating whether the solver was successful.
+    """
+    if isinstance(reference_points, pl.DataFrame):
+        reference_points = reference_points.to_dicts()
+
+    if len(reference_points) == 0:
+        msg = "At least one reference point must be given."
+        raise ValueError(msg)
+
+    # the components of the reference points are ordered like the objectives of the problem
+    reference_points = [{obj.symbol: float(rp[obj.symbol]) for obj in problem.objectives} for rp in reference_points]
+
+    add_asf = add_asf_diff if problem.is_twice_differentiable else add_asf_nondiff
+    problem_w_asf, _ = add_asf(
+        problem,
+        _ASF_SYMBOL,
+        reference_points[0],
+        **scalarization_options if scalarization_options is not None else {},
+        parametric=True,
+    )
+
+    _solver = guess_best_solver(problem_w_asf) if solver is None else solver
+    _executor = get_subproblem_executor() if executor is None else executor
+
+    variable_symbols = [var.symbol for var in problem.variables if isinstance(var, Variable)]
+
+    n_chunks = min(_executor.n_workers, len(reference_points))
+    if n_chunks > 1:
+        solver_options = _executor.limit_threads(_solver, solver_options)
+    chunks = [chunk.tolist() for chunk in np.array_split(np.arange(len(reference_points)), n_chunks)]
+    tasks = [
+        (problem_w_asf, _solver, solver_options, [reference_points[i] for i in chunk], variable_symbols)
+        for chunk in chunks
+    ]
+
+    # the chunks are contiguous, so the results are in the order of the reference points
+    results = [result for chunk_results in _executor.map(_solve_asf_chunk, tasks) for result in chunk_results]
+
+    constraint_symbols = [con.symbol for con in problem.constraints] if problem.constraints is not None else []
+
+    return pl.DataFrame(
+        [
+            {
+                **{var.symbol: result.optimal_variables[var.symbol] for var in problem.variables},
+                **{obj.symbol: result.optimal_objectives[obj.symbol] for obj in problem.objectives},
+                **{symbol: result.constraint_values[symbol] for symbol in constraint_symbols},
+                "success": result.success,
+            }
+            for result in results
+        ]
+    )
@@ -68,6 +68,26 @@ class BaseSolver(ABC):
             SolverResults: The results of the solver
         """
 
+    def update_constants(self, values: dict[str, int | float | list]):
+        """Updates the values of constants of the problem without re-initializing the solver.
+
+        Can be used to, e.g., change the reference point of a parametric scalarization function
+        between solves. The solver model is updated in place when the evaluator of the solver supports it.
+
+        Args:
+            values (dict[str, int | float | list]): a dict with the symbols of the constants to be updated
+                as its keys and their new values as its values.
+
+        Raises:
+            SolverError: when the evaluator of the solver does not support updating constants.
+        """
+        if not hasattr(getattr(self, "evaluator", None), "update_constants"):
+            msg = f"The solver {type(self).__name__} does not support updating constants."
+            raise SolverError(msg)
+
+        self.evaluator.update_constants(values)
+        self.problem = self.evaluator.problem
+
 
 class PersistentSolver:
     """Defines a schema for a persistent solver class.
@@ -116,6 +136,14 @@ class PersistentSolver:
             variable (Variable): The definition of the variable to be added.
         """
 
+    def update_constants(self, values: dict[str, int | float | list]):
+        """Updates the values of constants in the solver.
+
+        Args:
+            values (dict[str, int | float | list]): a dict with the symbols of the constants to be updated
+                as its keys and their new values as its values.
+        """
+
     def remove_constraint(self, symbol: str):
         """Removes a constraint from the solver.
 
@@ -215,6 +215,22 @@ class PersistentGurobipySolver(PersistentSolver):
 
         return self.evaluator.add_variable(variable)
 
+    def update_constants(self, values: dict[str, int | float | list]):
+        """Updates the values of constants and the expressions referencing them in the solver.
+
+        Only the expressions defined in the problem referencing the updated constants are re-parsed.
+        Expressions added to the solver afterwards keep using the old values of the constants.
+
+        Args:
+            values (dict[str, int | float | list]): a dict with the symbols of the constants to be updated
+                as its keys and their new values as its values.
+
+        Raises:
+            GurobipyEvaluatorError: when a symbol in `values` does not refer to a constant defined in the problem.
+        """
+        self.evaluator.update_constants(values)
+        self.problem = self.evaluator.problem
+
     def remove_constraint(self, symbol: str | list[str]):
         """Removes a constraint from the solver.
 
@@ -41,23 +41,40 @@ def epsilon_component(solution1: np.ndarray, solution2: np.ndarray) -> float:
     return max(0.0, max(solution1 - solution2))
 
 
-@njit()
-def self_epsilon(solution_set: np.ndarray) -> np.ndarray:
+def _indicator_dtype(solution_set: np.ndarray) -> np.dtype:
+    """The dtype of a pairwise indicator matrix: float32 for float32 inputs, float64 otherwise."""
+    return np.dtype(np.float32) if solution_set.dtype == np.float32 else np.dtype(np.float64)
+
+
+def self_epsilon(solution_set: np.ndarray, block_size: int = 256) -> np.ndarray:
     """Computes the pairwise additive epsilon-indicator for a solution set.
 
+    The matrix is computed in blocks of rows, one objective at a time, so that the temporary arrays stay small. If the
+    solution set is given as float32, the matrix is computed in float32 as well, halving the memory needed.
+
     Args:
         solution_set (np.ndarray): Should be a two-dimensional array, where each row is a
             solution normalized between [0, 1].
+        block_size (int, optional): The number of rows computed at a time. Defaults to 256.
 
     Returns:
         np.ndarray: A two-dimensional array where the entry at (i, j) is the
             additive epsilon-indicator between the i-th and j-th solution in the set.
     """
+    dtype = _indicator_dtype(solution_set)
+    solution_set = np.asarray(solution_set, dtype=dtype)
     n_solutions = solution_set.shape[0]
-    eps_matrix = np.zeros((n_solutions, n_solutions), dtype=np.float64)
-    for i in range(n_solutions):
-        for j in range(n_solutions):
-            eps_matrix[i, j] = epsilon_component(solution_set[i], solution_set[j])
+    # The objectives of all the solutions, one objective per row
+    columns = np.ascontiguousarray(solution_set.T)
+    eps_matrix = np.empty((n_solutions, n_solutions), dtype=dtype)
+    difference = np.empty((min(block_size, n_solutions), n_solutions), dtype=dtype)
+    for start in range(0, n_solutions, block_size):
+        stop = min(start + block_size, n_solutions)
+        block = eps_matrix[start:stop]
+        block.fill(0)
+        for k in range(columns.shape[0]):
+            np.subtract(columns[k, start:stop, None], columns[k], out=difference[: stop - start])
+            np.maximum(block, difference[: stop - start], out=block)
     return eps_matrix
 
 
@@ -97,21 +114,38 @@ def hv_component(solution1: np.ndarray, solution2: np.ndarray, ref: float = 2.0)
     return hv(solution_set=np.array([solution1, solution2]), reference_point_component=ref)
 
 
-def self_hv(solution_set: np.ndarray, ref: float = 2.0) -> np.ndarray:
+def self_hv(solution_set: np.ndarray, ref: float = 2.0, block_size: int = 256) -> np.ndarray:
     """Computes the pairwise hypervolume contribution for a solution set.
 
+    The entries are the same as the ones given by `hv_component`. As the hypervolume of two points is the sum of the
+    volumes they dominate minus the volume of the intersection, the matrix is computed in closed form in blocks of
+    rows. If the solution set is given as float32, the matrix is computed in float32 as well.
+
     Args:
         solution_set (np.ndarray): Should be a two-dimensional array, where each row is a
             solution normalized between [0, 1].
         ref (float): The reference point for the hypervolume calculation. Defaults to 2.0.
+        block_size (int, optional): The number of rows computed at a time. Defaults to 256.
 
     Returns:
         np.ndarray: A two-dimensional array where the entry at (i, j) is the
             hypervolume contribution of the i-th solution with respect to the j-th solution in the set.
     """
+    dtype = _indicator_dtype(solution_set)
+    solution_set = np.asarray(solution_set, dtype=dtype)
     n_solutions = solution_set.shape[0]
-    hv_matrix = np.zeros((n_solutions, n_solutions), dtype=np.float64)
-    for i in range(n_solutions):
-        for j in range(n_solutions):
-            hv_matrix[i, j] = hv_component(solution_set[i], solution_set[j], ref=ref)
+    # Points that do not strictly dominate the reference point do not contribute to the hypervolume
+    contributes = (solution_set < ref).all(axis=1)
+    volumes = np.where(contributes, np.prod(ref - solution_set, axis=1), 0).astype(dtype)
+
+    hv_matrix = np.empty((n_solutions, n_solutions), dtype=dtype)
+    for start in range(0, n_solutions, block_size):
+        stop = min(start + block_size, n_solutions)
+        rows = solution_set[start:stop, None, :]
+        # The volume dominated by both points is the one dominated by their component-wise maximum
+        overlap = np.prod(np.clip(ref - np.maximum(rows, solution_set[None, :, :]), 0, None), axis=2)
+        union = volumes[start:stop, None] + volumes[None, :] - overlap
+        # When the i-th solution dominates the j-th one, the contribution is the difference of their volumes
+        dominating = (rows <= solution_set[None, :, :]).all(axis=2) & (rows < solution_set[None, :, :]).any(axis=2)
+        hv_matrix[start:stop] = np.where(dominating, volumes[None, :] - volumes[start:stop, None], union)
     return hv_matrix
@@ -14,15 +14,30 @@ Audet, Charles, et al. "Performance indicators in multiobjective optimization."
 European journal of operational research 292.2 (2021): 397-422.
 """
 
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from warnings import warn
 
 import numpy as np
+import polars as pl
 from pydantic import BaseModel, Field
-from moocore import Hypervolume
+from moocore import Hypervolume, hv_contributions
 from pymoo.indicators.rmetric import RMetric
 from scipy.spatial.distance import cdist
 from typing import Dict
 
+from desdeo.tools.non_dominated_sorting import non_dominated_ranks
+
+MEMORY_BUDGET = 64 * 2**20
+"""The default maximum size in bytes of the temporary pairwise arrays of the distance based indicators."""
+
+
+def _chunk_size(bytes_per_row: int, memory_budget: int) -> int:
+    """The number of rows that fit into the memory budget, at least one."""
+    return max(1, memory_budget // max(1, bytes_per_row))
+
 
 def hv(solution_set: np.ndarray, reference_point_component: float) -> float:
     """Calculate the hypervolume indicator for a set of solutions.
@@ -85,6 +100,152 @@ def hv_batch(
     return hvs
 
 
+class HypervolumeContributions:
+    """The exclusive hypervolume contributions of a set of points, kept up to date as points are added and removed.
+
+    The contribution of a point is the hypervolume lost if the point is removed from the set. With at most
+    `max_exact_objectives` objectives, the contributions are exact. They are computed with the dimension-sweep
+    algorithms of moocore, in O(n log n) time for two and three objectives, and only after the set has changed.
+
+    With more objectives, the contributions are approximated by Monte Carlo sampling. The box between the points and
+    the reference point is sampled once, and the number of points dominating each sample is kept up to date when points
+    are added or removed. Samples dominated by exactly one point count towards the contribution of that point. The
+    approximation error shrinks with the number of samples.
+
+    The points are identified by integer ids, given in the order the points are added. The points are expected to be
+    mutually non-dominated. Dominated points have no contribution.
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        reference_point: np.ndarray | float,
+        n_samples: int = 100_000,
+        max_exact_objectives: int = 3,
+        seed: int = 0,
+    ):
+        """Initialize the contributions of a set of points.
+
+        Args:
+            points (np.ndarray): The initial points, with each row being a single point. Minimization is assumed.
+            reference_point (np.ndarray | float): The reference point, or a value used for all of its components.
+            n_samples (int, optional): The number of samples used by the Monte Carlo approximation. Defaults to
+                100_000.
+            max_exact_objectives (int, optional): The largest number of objectives for which the contributions are
+                computed exactly. Defaults to 3.
+            seed (int, optional): The seed of the samples. Defaults to 0.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        self.n_objectives = points.shape[1]
+        self.reference_point = np.broadcast_to(np.asarray(reference_point, dtype=float), (self.n_objectives,)).copy()
+        self.exact = self.n_objectives <= max_exact_objectives
+        self.n_samples = n_samples
+        self._rng = np.random.default_rng(seed)
+
+        self._points = np.empty((0, self.n_objectives))
+        self._alive = np.empty(0, dtype=bool)
+        self._contributions: np.ndarray | None = None
+
+        # The Monte Carlo samples, the number of points dominating each of them, and the sum of their ids
+        self._samples: np.ndarray | None = None
+        self._lower_bound: np.ndarray | None = None
+        self._dominator_count = np.empty(0, dtype=np.int32)
+        self._dominator_id_sum = np.empty(0, dtype=np.int64)
+
+        self.add(points)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """The ids of the points currently in the set."""
+        return np.flatnonzero(self._alive)
+
+    @property
+    def points(self) -> np.ndarray:
+        """The points currently in the set, in the order of `ids`."""
+        return self._points[self._alive]
+
+    def __len__(self) -> int:
+        """Return the number of points currently in the set."""
+        return int(self._alive.sum())
+
+    def add(self, points: np.ndarray) -> np.ndarray:
+        """Add points to the set.
+
+        Args:
+            points (np.ndarray): The points to add, with each row being a single point.
+
+        Returns:
+            np.ndarray: The ids given to the points.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float)).reshape(-1, self.n_objectives)
+        ids = np.arange(len(self._points), len(self._points) + len(points))
+        self._points = np.vstack((self._points, points))
+        self._alive = np.concatenate((self._alive, np.ones(len(points), dtype=bool)))
+        self._contributions = None
+
+        if not self.exact and len(points) > 0:
+            lower_bound = np.minimum(points.min(axis=0), self.reference_point)
+            if self._samples is None or (lower_bound < self._lower_bound).any():
+                # The samples no longer cover the dominated region, so they are drawn again
+                self._resample()
+            else:
+                for point_id in ids:
+                    self._update_samples(point_id, 1)
+        return ids
+
+    def remove(self, ids: int | Sequence[int] | np.ndarray) -> None:
+        """Remove points from the set.
+
+        Args:
+            ids (int | Sequence[int] | np.ndarray): The ids of the points to remove.
+        """
+        for point_id in np.atleast_1d(ids):
+            if not self._alive[point_id]:
+                raise ValueError(f"The point {point_id} is not in the set.")
+            self._alive[point_id] = False
+            if not self.exact:
+                self._update_samples(point_id, -1)
+        self._contributions = None
+
+    @property
+    def contributions(self) -> np.ndarray:
+        """The hypervolume contributions of the points currently in the set, in the order of `ids`."""
+        if self._contributions is None:
+            if len(self) == 0:
+                self._contributions = np.empty(0)
+            elif self.exact:
+                self._contributions = hv_contributions(self.points, ref=self.reference_point)
+            else:
+                single = self._dominator_count == 1
+                sole_counts = np.bincount(self._dominator_id_sum[single], minlength=len(self._points))
+                volume = np.prod(self.reference_point - self._lower_bound)
+                self._contributions = sole_counts[self._alive] * (volume / self.n_samples)
+        return self._contributions
+
+    def least_contributor(self) -> int:
+        """Return the id of the point with the smallest contribution. Ties are broken by the smallest id."""
+        if len(self) == 0:
+            raise ValueError("The set is empty.")
+        return int(self.ids[np.argmin(self.contributions)])
+
+    def _resample(self) -> None:
+        """Draw new samples in the box between the points and the reference point and find their dominators."""
+        self._lower_bound = np.minimum(self._points[self._alive].min(axis=0), self.reference_point)
+        self._samples = self._rng.uniform(
+            self._lower_bound, self.reference_point, size=(self.n_samples, self.n_objectives)
+        )
+        self._dominator_count = np.zeros(self.n_samples, dtype=np.int32)
+        self._dominator_id_sum = np.zeros(self.n_samples, dtype=np.int64)
+        for point_id in self.ids:
+            self._update_samples(point_id, 1)
+
+    def _update_samples(self, point_id: int, sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) a point from the dominators of the samples."""
+        dominated = (self._samples >= self._points[point_id]).all(axis=1)
+        self._dominator_count[dominated] += sign
+        self._dominator_id_sum[dominated] += sign * point_id
+
+
 class DistanceIndicators(BaseModel):
     """A container for closely related distance based indicators."""
 
@@ -112,9 +273,13 @@ class DistanceIndicators(BaseModel):
     "The average Hausdorff distance indicator value."
 
 
-def distance_indicators(solution_set: np.ndarray, reference_set: np.ndarray, p: float = 2.0) -> DistanceIndicators:
+def distance_indicators(
+    solution_set: np.ndarray, reference_set: np.ndarray, p: float = 2.0, memory_budget: int = MEMORY_BUDGET
+) -> DistanceIndicators:
     """Calculates various distance based indicators between a solution set and a reference set.
 
+    The distance matrix is computed in chunks of solutions, so that no chunk is larger than `memory_budget` bytes.
+
     Args:
         solution_set (np.ndarray): A 2D numpy array where each row is a solution and each column is an objective value.
             The solutions are assumed to be normalized within the unit hypercube. The ideal and nadir of the set itself
@@ -125,13 +290,21 @@ def distance_indicators(solution_set: np.ndarray, reference_set: np.ndarray, p:
             non-dominated.
         p (float, optional): The power of the Minkowski metric. Set to 1 for Manhattan distance and 2 for Euclidean
             distance, and np.inf (or math.inf) for Chebyshev distance. Defaults to 2.0.
+        memory_budget (int, optional): The maximum size of a chunk of the distance matrix in bytes. Defaults to
+            `MEMORY_BUDGET`.
 
     Returns:
         DistanceIndicators: A Pydantic class containing the IGD, IGD+, GD, GD+, and AHD indicators values.
     """
-    distance_matrix = cdist(solution_set, reference_set, metric="minkowski", p=p)
-    _igd = np.min(distance_matrix, axis=0).mean()
-    _gd = np.min(distance_matrix, axis=1).mean()
+    chunk_size = _chunk_size(8 * reference_set.shape[0], memory_budget)
+    min_to_reference = np.empty(solution_set.shape[0])
+    min_to_solutions = np.full(reference_set.shape[0], np.inf)
+    for start in range(0, solution_set.shape[0], chunk_size):
+        distance_matrix = cdist(solution_set[start : start + chunk_size], reference_set, metric="minkowski", p=p)
+        min_to_reference[start : start + chunk_size] = np.min(distance_matrix, axis=1)
+        np.minimum(min_to_solutions, np.min(distance_matrix, axis=0), out=min_to_solutions)
+    _igd = min_to_solutions.mean()
+    _gd = min_to_reference.mean()
     ref_size = reference_set.shape[0]
     set_size = solution_set.shape[0]
 
@@ -179,9 +352,13 @@ class IGDPlusIndicators(BaseModel):
     igd_plus: float = Field(description="The modified inverted generational distance (IGD+) indicator value.")
 
 
-def igd_plus_indicator(solution_set: np.ndarray, reference_set: np.ndarray, p: float = 2.0) -> IGDPlusIndicators:
+def igd_plus_indicator(
+    solution_set: np.ndarray, reference_set: np.ndarray, p: float = 2.0, memory_budget: int = MEMORY_BUDGET
+) -> IGDPlusIndicators:
     """Computes the IGD+ indicator for a given solution set.
 
+    The distances are computed in chunks of reference points, so that no chunk is larger than `memory_budget` bytes.
+
     Notes:
         The minimization of the objective function values is assumed.
 
@@ -189,6 +366,8 @@ def igd_plus_indicator(solution_set: np.ndarray, reference_set: np.ndarray, p: f
         solution_set (np.ndarray): The solution set being evaluated.
         reference_set (np.ndarray): The reference Pareto front.
         p (float, optional): The power of the Minkowski metric. Defaults to 2.0 (Euclidean distance).
+        memory_budget (int, optional): The maximum size of the temporary arrays in bytes. Defaults to
+            `MEMORY_BUDGET`.
 
     Returns:
         IGDPlusIndicators: A Pydantic class containing the IGD+ indicator value.
@@ -196,17 +375,15 @@ def igd_plus_indicator(solution_set: np.ndarray, reference_set: np.ndarray, p: f
     num_ref_points = reference_set.shape[0]
     total_distance = 0.0
 
-    for y_p in reference_set:
-        min_distance = float("inf")
-
-        for y_n in solution_set:
-            # Compute IGD+ distance (only positive differences)
-            distance = np.sum(np.maximum(0, y_n - y_p) ** p)  # Sum over objectives
-            min_distance = min(min_distance, distance)  # Store the closest one
+    chunk_size = _chunk_size(8 * solution_set.shape[0] * solution_set.shape[1], memory_budget)
+    for start in range(0, num_ref_points, chunk_size):
+        y_p = reference_set[start : start + chunk_size, None, :]
+        # Compute IGD+ distance (only positive differences), summed over objectives
+        distances = np.sum(np.maximum(0, solution_set[None, :, :] - y_p) ** p, axis=2)
+        # Apply the root AFTER summing over objectives
+        total_distance += np.sum(np.min(distances, axis=1) ** (1 / p))
 
-        total_distance += min_distance ** (1 / p)  # Apply the root AFTER summing over objectives
-
-    igd_plus_value = total_distance / num_ref_points
+    igd_plus_value = float(total_distance / num_ref_points)
     return IGDPlusIndicators(igd_plus=igd_plus_value)
 
 
@@ -245,30 +422,39 @@ def r2_indicator(
     solution_set: np.ndarray,
     lambda_set: np.ndarray,
     z_star: np.ndarray,
-    rho: float = 0.05
+    rho: float = 0.05,
+    memory_budget: int = MEMORY_BUDGET,
 ) -> R2Indicator:
     """Computes the unary R2 indicator for a given solution set.
 
+    The augmented Tchebycheff utilities of all the (weight vector, solution) pairs are computed at once, in chunks of
+    weight vectors so that no chunk is larger than `memory_budget` bytes.
+
     Args:
         solution_set (np.ndarray): The Pareto front approximation.
         lambda_set (np.ndarray): The set of normalized weight vectors (λ).
         z_star (np.ndarray): The ideal point (must dominate or weakly dominate all solutions).
         rho (float, optional): Small positive number for augmented Tchebycheff. Default is 0.05.
+        memory_budget (int, optional): The maximum size of the temporary arrays in bytes. Defaults to
+            `MEMORY_BUDGET`.
 
     Returns:
         R2IndicatorResult: Pydantic class with R2 value.
     """
+    diff = np.abs(z_star - solution_set)
+    sum_term = np.sum(diff, axis=1)
     total_score = 0.0
-    for lambd in lambda_set:
-        best_score = max(
-            tchebycheff_utility(fx, lambd, z_star, rho)
-            for fx in solution_set
-        )
-        total_score += best_score
 
-    r2_value = total_score / len(lambda_set)
+    chunk_size = _chunk_size(8 * diff.shape[0] * diff.shape[1], memory_budget)
+    for start in range(0, len(lambda_set), chunk_size):
+        max_term = np.max(lambda_set[start : start + chunk_size, None, :] * diff[None, :, :], axis=2)
+        utilities = -(max_term + rho * sum_term[None, :])
+        total_score += np.sum(np.max(utilities, axis=1))
+
+    r2_value = float(total_score / len(lambda_set))
     return R2Indicator(r2_value=r2_value)
 
+
 def r2_batch(
     solution_sets: Dict[str, np.ndarray],
     lambda_set: np.ndarray,
@@ -347,12 +533,128 @@ def is_dominated(solution, other_solutions):
 
 def get_pareto_front(solutions):
     """Extract the Pareto front from a set of solutions."""
-    pareto_front = []
-    for i, solution in enumerate(solutions):
-        remaining_solutions = np.delete(solutions, i, axis=0)
-        if not is_dominated(solution, remaining_solutions):
-            pareto_front.append(solution)
-    return np.array(pareto_front)
+    solutions = np.asarray(solutions)
+    return solutions[non_dominated_ranks(solutions) == 0]
+
+
+def _hv_task(solution_set: np.ndarray, reference_point_component: float) -> list[tuple[str, float | None]]:
+    """Calculate the hypervolume of a set for the batch engine."""
+    ind = Hypervolume(reference_point_component)(solution_set)
+    if ind is None:
+        warn("Hypervolume calculation failed. Setting value to None", category=RuntimeWarning, stacklevel=2)
+        return [("hv", None)]
+    return [("hv", float(ind))]
+
+
+def _distance_task(solution_set: np.ndarray, reference_set: np.ndarray, p: float) -> list[tuple[str, float | None]]:
+    """Calculate the distance based indicators and IGD+ of a set for the batch engine."""
+    return [
+        *distance_indicators(solution_set, reference_set, p=p).model_dump().items(),
+        ("igd_plus", igd_plus_indicator(solution_set, reference_set, p=p).igd_plus),
+    ]
+
+
+def _r2_task(
+    solution_set: np.ndarray, lambda_set: np.ndarray, z_star: np.ndarray, rho: float
+) -> list[tuple[str, float | None]]:
+    """Calculate the R2 indicator of a set for the batch engine."""
+    return [("r2", r2_indicator(solution_set, lambda_set, z_star, rho).r2_value)]
+
+
+def _r_metric_task(
+    solution_set: np.ndarray, ref_points: np.ndarray, w: np.ndarray | None, delta: float
+) -> list[tuple[str, float | None]]:
+    """Calculate the R-metrics of a set for the batch engine."""
+    return list(r_metric_indicator(solution_set, ref_points, w, delta).model_dump().items())
+
+
+def _run_task(task: tuple[Callable, tuple]) -> list[tuple[str, float | None]]:
+    """Run a task of the batch engine."""
+    function, args = task
+    return function(*args)
+
+
+def indicators_batch(
+    solution_sets: dict[str, np.ndarray],
+    reference_points_component: Sequence[float] | None = None,
+    reference_set: np.ndarray | None = None,
+    lambda_set: np.ndarray | None = None,
+    z_star: np.ndarray | None = None,
+    r_metric_ref_points: np.ndarray | None = None,
+    p: float = 2.0,
+    rho: float = 0.05,
+    w: np.ndarray | None = None,
+    delta: float = 0.2,
+    n_workers: int | None = None,
+) -> pl.DataFrame:
+    """Calculate many indicators for many solution sets in parallel.
+
+    Each indicator is calculated only if the arguments it needs are given:
+
+    - the hypervolume for each of `reference_points_component`, see `hv`,
+    - the distance based indicators and IGD+ with respect to `reference_set`, see `distance_indicators` and
+        `igd_plus_indicator`,
+    - the R2 indicator with `lambda_set` and `z_star`, see `r2_indicator`, and
+    - the R-metrics (R-HV and R-IGD) with respect to `r_metric_ref_points`, see `r_metric_indicator`.
+
+    The (solution set, indicator, reference point) combinations are calculated across a pool of processes.
+
+    Args:
+        solution_sets (dict[str, np.ndarray]): A dict of strings mapped to 2D numpy arrays where each array contains a
+            set of solutions. The same assumptions as in the individual indicators apply.
+        reference_points_component (Sequence[float] | None, optional): The reference point components for the
+            hypervolume. Defaults to None.
+        reference_set (np.ndarray | None, optional): The reference set for the distance based indicators and IGD+.
+            Defaults to None.
+        lambda_set (np.ndarray | None, optional): The weight vectors for the R2 indicator. Defaults to None.
+        z_star (np.ndarray | None, optional): The ideal point for the R2 indicator. Defaults to None.
+        r_metric_ref_points (np.ndarray | None, optional): The reference points for the R-metrics. Defaults to None.
+        p (float, optional): The power of the Minkowski metric of the distance based indicators. Defaults to 2.0.
+        rho (float, optional): The augmentation coefficient of the R2 indicator. Defaults to 0.05.
+        w (np.ndarray | None, optional): The weights of the R-metrics. Defaults to None.
+        delta (float, optional): The region of interest of the R-metrics. Defaults to 0.2.
+        n_workers (int | None, optional): The number of processes. If 1, everything is calculated in this process.
+            Defaults to None, in which case the number of CPUs is used.
+
+    Returns:
+        pl.DataFrame: A tidy dataframe with the columns "set_name", "indicator", "reference_point_component"
+            (null for indicators other than the hypervolume), and "value" (null if the calculation failed).
+    """
+    tasks: list[tuple[str, float | None, tuple[Callable, tuple]]] = []
+    for set_name, solution_set in solution_sets.items():
+        for rp in reference_points_component or []:
+            tasks.append((set_name, float(rp), (_hv_task, (solution_set, rp))))
+        if reference_set is not None:
+            tasks.append((set_name, None, (_distance_task, (solution_set, reference_set, p))))
+        if lambda_set is not None and z_star is not None:
+            tasks.append((set_name, None, (_r2_task, (solution_set, lambda_set, z_star, rho))))
+        if r_metric_ref_points is not None:
+            tasks.append((set_name, None, (_r_metric_task, (solution_set, r_metric_ref_points, w, delta))))
+
+    n_workers = min(n_workers or os.cpu_count() or 1, max(1, len(tasks)))
+    if n_workers == 1:
+        results = [_run_task(task) for _, _, task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            results = list(
+                executor.map(_run_task, [task for _, _, task in tasks], chunksize=max(1, len(tasks) // (4 * n_workers)))
+            )
+
+    rows = [
+        (set_name, indicator, rp, value)
+        for (set_name, rp, _), result in zip(tasks, results, strict=True)
+        for indicator, value in result
+    ]
+    return pl.DataFrame(
+        rows,
+        schema={
+            "set_name": pl.String,
+            "indicator": pl.String,
+            "reference_point_component": pl.Float64,
+            "value": pl.Float64,
+        },
+        orient="row",
+    )
 
 
 # Additional unary indicators can be added here.
@@ -3,7 +3,6 @@
 For more info, see https://facebookresearch.github.io/nevergrad/index.html
 """
 
-from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
 import nevergrad as ng
@@ -32,8 +31,9 @@ class NevergradGenericOptions(BaseModel):
     """The maximum number of allowed function evaluations. Defaults to 100."""
 
     num_workers: int = Field(description="The maximum number of allowed parallel evaluations.", default=1)
-    """The maximum number of allowed parallel evaluations. This is currently
-    used to define the batch size when evaluating problems. Defaults to 1."""
+    """The maximum number of allowed parallel evaluations. This is used to define the batch size when
+    evaluating problems: the candidates of each batch are evaluated at once with a single vectorized
+    call. Defaults to 1."""
 
     optimizer: Literal[*available_nevergrad_optimizers] = Field(
         description=(
@@ -132,6 +132,27 @@ class NevergradGenericSolver(BaseSolver):
         self.options = options if options is not None else _default_nevergrad_generic_options
         self.evaluator = SympyEvaluator(problem)
 
+    @staticmethod
+    def _ask(optimizer: ng.optimizers.base.Optimizer, n: int) -> list[ng.p.Parameter]:
+        """Ask the optimizer for up to n candidates, without exceeding its budget.
+
+        Args:
+            optimizer (ng.optimizers.base.Optimizer): the optimizer.
+            n (int): the maximum number of candidates.
+
+        Returns:
+            list[ng.p.Parameter]: the candidates. Fewer than n if the budget is used up or the optimizer stopped.
+        """
+        candidates = []
+        for _ in range(n):
+            if optimizer.budget is not None and optimizer.num_ask >= optimizer.budget:
+                break
+            try:
+                candidates.append(optimizer.ask())
+            except ng.errors.NevergradEarlyStopping:
+                break
+        return candidates
+
     def solve(self, target: str) -> SolverResults:
         """Solve the problem for the given target.
 
@@ -161,38 +182,42 @@ class NevergradGenericSolver(BaseSolver):
             None if self.problem.constraints is None else [con.symbol for con in self.problem.constraints]
         )
 
+        targets = [target, *constraint_symbols] if constraint_symbols is not None else [target]
+
         try:
-            if optimizer.num_workers == 1:
-                # single thread
-                recommendation = optimizer.minimize(
-                    lambda xs, t=target: self.evaluator.evaluate_target(xs, t),
-                    constraint_violation=[
-                        lambda xs, t=con_t: self.evaluator.evaluate_target(xs, t) for con_t in constraint_symbols
-                    ]
-                    if constraint_symbols is not None
-                    else None,
+            # up to num_workers candidates are pending at a time. The pending candidates are evaluated with a
+            # single vectorized call, and each candidate is told to the optimizer and replaced by a new one right
+            # away, like when the candidates are evaluated in parallel workers.
+            pending = self._ask(optimizer, optimizer.num_workers)
+            while pending:
+                values = self.evaluator.evaluate_batch(
+                    {
+                        var.symbol: [candidate.value[var.symbol] for candidate in pending]
+                        for var in self.problem.variables
+                    },
+                    targets,
                 )
-
-            elif optimizer.num_workers > 1:
-                # multiple processors
-                with ThreadPoolExecutor(max_workers=optimizer.num_workers) as executor:
-                    recommendation = optimizer.minimize(
-                        lambda xs, t=target: self.evaluator.evaluate_target(xs, t),
-                        constraint_violation=[
-                            lambda xs, t=con_t: self.evaluator.evaluate_target(xs, t) for con_t in constraint_symbols
-                        ]
+                replacements = []
+                for i, candidate in enumerate(pending):
+                    optimizer.tell(
+                        candidate,
+                        float(values[target][i]),
+                        [float(values[con_t][i]) for con_t in constraint_symbols]
                         if constraint_symbols is not None
                         else None,
-                        executor=executor,
-                        batch_mode=False,
                     )
+                    replacements.extend(self._ask(optimizer, 1))
+                pending = replacements
 
+            recommendation = optimizer.provide_recommendation()
             msg = f"Recommendation found by {self.options.optimizer}."
             success = True
 
         except Exception as e:
             msg = f"{self.options.optimizer} failed. Possible reason: {e}"
             success = False
+            # the best candidate told to the optimizer before the failure, or its initial guess
+            recommendation = optimizer.provide_recommendation()
 
         result = {"recommendation": recommendation, "message": msg, "success": success}
 
@@ -1,4 +1,4 @@
-"""This module contains functions for non-dominated sorting of solutions."""
+"""This module contains functions for non-dominated sorting of solutions, and an index of non-dominated solutions."""
 
 import numpy as np
 from numba import njit  # type: ignore
@@ -52,34 +52,131 @@ def non_dominated(data: np.ndarray) -> np.ndarray:
 
 
 @njit()
+def _bi_objective_ranks(data: np.ndarray) -> np.ndarray:
+    """Rank unique, lexicographically sorted solutions with two objectives in O(n log n) time.
+
+    Since the solutions are sorted, a solution can only be dominated by the solutions before it, and it is
+    dominated by a front if and only if the smallest second objective value in the front is not larger than its own.
+    These smallest values increase with the front index, so the front of each solution is found with a binary search.
+
+    Args:
+        data (np.ndarray): 2-D array of unique solutions with two columns, sorted lexicographically.
+
+    Returns:
+        np.ndarray: The index of the front of each solution, starting from 0.
+    """
+    num_solutions = len(data)
+    ranks = np.empty(num_solutions, dtype=np.int64)
+    front_min = np.empty(num_solutions, dtype=data.dtype)
+    num_fronts = 0
+    for i in range(num_solutions):
+        rank = np.searchsorted(front_min[:num_fronts], data[i, 1], side="right")
+        front_min[rank] = data[i, 1]
+        if rank == num_fronts:
+            num_fronts += 1
+        ranks[i] = rank
+    return ranks
+
+
+@njit()
+def _ens_ranks(data: np.ndarray) -> np.ndarray:
+    """Rank unique, lexicographically sorted solutions with the efficient non-dominated sort (ENS-BS).
+
+    Since the solutions are sorted, a solution can only be dominated by the solutions before it, and the
+    solutions before it in the same front never dominate each other. If a solution is dominated by a member of
+    a front, it is also dominated by a member of every earlier front, so the front of each solution is found
+    with a binary search over the fronts. The members of each front are kept in a linked list, starting from the
+    most recently added member, which is the most likely to dominate the next solutions.
+
+    Args:
+        data (np.ndarray): 2-D array of unique solutions, sorted lexicographically.
+
+    Returns:
+        np.ndarray: The index of the front of each solution, starting from 0.
+    """
+    num_solutions, num_objectives = data.shape
+    ranks = np.empty(num_solutions, dtype=np.int64)
+    front_last = np.empty(num_solutions, dtype=np.int64)
+    previous_in_front = np.empty(num_solutions, dtype=np.int64)
+    num_fronts = 0
+    for i in range(num_solutions):
+        low = 0
+        high = num_fronts
+        while low < high:
+            middle = (low + high) // 2
+            dominated = False
+            j = front_last[middle]
+            while j != -1:
+                # The first objective of j is never larger than that of i, and j differs from i
+                dominated = True
+                for k in range(1, num_objectives):
+                    if data[j, k] > data[i, k]:
+                        dominated = False
+                        break
+                if dominated:
+                    break
+                j = previous_in_front[j]
+            if dominated:
+                low = middle + 1
+            else:
+                high = middle
+        if low == num_fronts:
+            front_last[low] = -1
+            num_fronts += 1
+        previous_in_front[i] = front_last[low]
+        front_last[low] = i
+        ranks[i] = low
+    return ranks
+
+
+def non_dominated_ranks(data: np.ndarray) -> np.ndarray:
+    """Conduct non-dominated sorting on a population of solutions and return the front of each solution.
+
+    Duplicate solutions are sorted only once and share the same front. Populations with one or two
+    objectives are sorted in O(n log n) time, while populations with more objectives are sorted with the
+    efficient non-dominated sort (ENS-BS), which is usually much faster than the O(mn^2) fast non-dominated sort.
+
+    Args:
+        data (np.ndarray): 2-D array of solutions, with each row being a single solution.
+
+    Returns:
+        np.ndarray: 1-D integer array with the index of the front of each solution. The first (non-dominated)
+            front has the index 0.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    if len(data) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # np.unique sorts the unique solutions lexicographically, which all the sorts below rely on
+    unique, inverse = np.unique(data, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    num_objectives = unique.shape[1]
+
+    if num_objectives == 1:
+        unique_ranks = np.arange(len(unique), dtype=np.int64)
+    elif num_objectives == 2:  # noqa: PLR2004
+        unique_ranks = _bi_objective_ranks(unique)
+    else:
+        unique_ranks = _ens_ranks(unique)
+    return unique_ranks[inverse]
+
+
 def fast_non_dominated_sort(data: np.ndarray) -> np.ndarray:
     """Conduct fast non-dominated sorting on a population of solutions.
 
+    The fronts are computed with `non_dominated_ranks`, which should be preferred when the dense output is not needed.
+
     Args:
         data (np.ndarray): 2-D array of solutions, with each row being a single solution.
 
     Returns:
-        np.ndarray: n x f boolean array. n is the number of solutions, f is the number of fronts.
+        np.ndarray: f x n boolean array. n is the number of solutions, f is the number of fronts.
             The value of an array element is true if the corresponding solution id (column) belongs in
             the corresponding front (row).
     """
-    num_solutions = len(data)
-    indices = np.arange(num_solutions)
-    taken = np.zeros(num_solutions, dtype=np.bool_)
-    fronts = np.zeros((num_solutions, num_solutions), dtype=np.bool_)
-
-    for i in indices:
-        current_front = non_dominated(data[~taken])
-
-        current_front_all = np.zeros(num_solutions, dtype=np.bool_)
-        current_front_all[~taken] = current_front
-        fronts[i] = current_front_all
-
-        taken = taken + fronts[i]
-        if not fronts[i].any():
-            # if the current front is empty or if all the solutions have been sorted, stop
-            break
-    return fronts[:i]
+    ranks = non_dominated_ranks(data)
+    num_fronts = ranks.max() + 1 if len(ranks) > 0 else 0
+    return ranks[None, :] == np.arange(num_fronts)[:, None]
 
 
 def fast_non_dominated_sort_indices(data: np.ndarray) -> list[np.ndarray]:
@@ -96,8 +193,9 @@ def fast_non_dominated_sort_indices(data: np.ndarray) -> list[np.ndarray]:
             arranged in ascending order. Each element is a numpy array of the indices of solutions
             belonging to the corresponding front.
     """
-    fronts = fast_non_dominated_sort(data)
-    return [np.where(fronts[i])[0] for i in range(len(fronts))]
+    ranks = non_dominated_ranks(data)
+    order = np.argsort(ranks, kind="stable")
+    return np.split(order, np.flatnonzero(np.diff(ranks[order])) + 1) if len(ranks) > 0 else []
 
 
 @njit()
@@ -131,3 +229,319 @@ def non_dominated_merge(set1: np.ndarray, set2: np.ndarray) -> tuple[np.ndarray,
                 set1_mask[i] = False
 
     return set1_mask, set2_mask
+
+
+@njit()
+def _build_tree(points: np.ndarray, slots: np.ndarray, leaf_size: int) -> tuple:
+    """Build a k-d tree over the given rows of points.
+
+    Each node is split at the median of the objective with the largest spread. The tree is stored in flat arrays,
+    with the bounding box of the points of each node, and the range of the node in the returned permutation of slots.
+
+    Args:
+        points (np.ndarray): 2-D array of points.
+        slots (np.ndarray): the rows of points to include in the tree.
+        leaf_size (int): the maximum number of points in a leaf node.
+
+    Returns:
+        tuple: the permutation of slots, and the lower corners, upper corners, start and end indices in the
+            permutation, and the left and right children of the nodes. Leaves have -1 as their children.
+    """
+    num_objectives = points.shape[1]
+    # Both children of a split node have at least (leaf_size + 1) // 2 points
+    max_nodes = 2 * (len(slots) // ((leaf_size + 1) // 2) + 1)
+    lower = np.empty((max_nodes, num_objectives))
+    upper = np.empty((max_nodes, num_objectives))
+    start = np.empty(max_nodes, dtype=np.int64)
+    end = np.empty(max_nodes, dtype=np.int64)
+    left = np.full(max_nodes, -1, dtype=np.int64)
+    right = np.full(max_nodes, -1, dtype=np.int64)
+    perm = slots.copy()
+
+    start[0] = 0
+    end[0] = len(perm)
+    num_nodes = 1
+    stack = [0]
+    while len(stack) > 0:
+        node = stack.pop()
+        spread_dim = 0
+        spread = -1.0
+        for k in range(num_objectives):
+            low = np.inf
+            high = -np.inf
+            for i in range(start[node], end[node]):
+                value = points[perm[i], k]
+                low = min(low, value)
+                high = max(high, value)
+            lower[node, k] = low
+            upper[node, k] = high
+            if high - low > spread:
+                spread = high - low
+                spread_dim = k
+        if end[node] - start[node] <= leaf_size or spread <= 0:
+            continue
+        segment = perm[start[node] : end[node]]
+        perm[start[node] : end[node]] = segment[np.argsort(points[segment, spread_dim])]
+        middle = (start[node] + end[node]) // 2
+        left[node] = num_nodes
+        right[node] = num_nodes + 1
+        start[num_nodes], end[num_nodes] = start[node], middle
+        start[num_nodes + 1], end[num_nodes + 1] = middle, end[node]
+        stack.append(num_nodes)
+        stack.append(num_nodes + 1)
+        num_nodes += 2
+
+    return perm, lower[:num_nodes], upper[:num_nodes], start[:num_nodes], end[:num_nodes], left, right
+
+
+@njit()
+def _index_dominated(
+    candidate: np.ndarray,
+    points: np.ndarray,
+    alive: np.ndarray,
+    size: int,
+    tree_size: int,
+    perm: np.ndarray,
+    lower: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    left: np.ndarray,
+    stack: np.ndarray,
+) -> bool:
+    """Check whether a candidate is dominated by a point in the index.
+
+    A node can only contain a point dominating the candidate if its lower corner is not worse than the candidate.
+    `stack` is a work array with room for all the nodes of the tree.
+    """
+    # Returning from inside the loops compiles to markedly slower code, hence the flag
+    dominated = False
+    for j in range(tree_size, size):
+        if alive[j] and dominates(points[j], candidate):
+            dominated = True
+            break
+    stack[0] = 0
+    top = 1
+    while top > 0 and not dominated:
+        top -= 1
+        node = stack[top]
+        prune = False
+        for k in range(len(candidate)):
+            if lower[node, k] > candidate[k]:
+                prune = True
+                break
+        if prune:
+            continue
+        if left[node] == -1:
+            for i in range(start[node], end[node]):
+                if alive[perm[i]] and dominates(points[perm[i]], candidate):
+                    dominated = True
+                    break
+        else:
+            stack[top] = left[node]
+            stack[top + 1] = left[node] + 1
+            top += 2
+    return dominated
+
+
+@njit()
+def _index_remove_dominated(
+    candidate: np.ndarray,
+    points: np.ndarray,
+    alive: np.ndarray,
+    size: int,
+    tree_size: int,
+    perm: np.ndarray,
+    upper: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    left: np.ndarray,
+    stack: np.ndarray,
+) -> None:
+    """Remove the points in the index dominated by a candidate.
+
+    A node can only contain a point dominated by the candidate if its upper corner is not better than the candidate.
+    `stack` is a work array with room for all the nodes of the tree.
+    """
+    for j in range(tree_size, size):
+        if alive[j] and dominates(candidate, points[j]):
+            alive[j] = False
+    stack[0] = 0
+    top = 1
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        prune = False
+        for k in range(len(candidate)):
+            if upper[node, k] < candidate[k]:
+                prune = True
+                break
+        if prune:
+            continue
+        if left[node] == -1:
+            for i in range(start[node], end[node]):
+                if alive[perm[i]] and dominates(candidate, points[perm[i]]):
+                    alive[perm[i]] = False
+        else:
+            stack[top] = left[node]
+            stack[top + 1] = left[node] + 1
+            top += 2
+
+
+@njit()
+def _index_insert(
+    candidates: np.ndarray,
+    points: np.ndarray,
+    alive: np.ndarray,
+    size: int,
+    tree_size: int,
+    perm: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    left: np.ndarray,
+) -> np.ndarray:
+    """Insert mutually non-dominated candidates to the index, removing the points they dominate.
+
+    The points in the slots before `tree_size` are indexed by the tree, while the rest are scanned linearly.
+
+    Returns:
+        np.ndarray: Boolean array, True if the corresponding candidate was inserted. The inserted candidates
+            are stored to the slots following `size`, in order.
+    """
+    inserted = np.zeros(len(candidates), dtype=np.bool_)
+    stack = np.empty(len(start) + 1, dtype=np.int64)
+    for c in range(len(candidates)):
+        candidate = candidates[c]
+        if _index_dominated(candidate, points, alive, size, tree_size, perm, lower, start, end, left, stack):
+            continue
+        _index_remove_dominated(candidate, points, alive, size, tree_size, perm, upper, start, end, left, stack)
+        points[size] = candidate
+        alive[size] = True
+        size += 1
+        inserted[c] = True
+    return inserted
+
+
+class NonDominatedIndex:
+    """A growable set of mutually non-dominated points, indexed for fast dominance queries.
+
+    The points are stored in NumPy buffers, whose capacity is doubled when they are full. Each inserted point is
+    identified by its slot in the buffers, and the points dominated by later insertions are only marked as removed.
+    The points are indexed by a k-d tree, whose nodes store the bounding boxes of their points. The points inserted
+    after the tree was built are scanned linearly, and the tree is rebuilt once there are too many of them.
+    """
+
+    def __init__(self, num_objectives: int, leaf_size: int = 16, rebuild_threshold: int = 1024):
+        """Initialize an empty index.
+
+        Args:
+            num_objectives (int): the number of objectives of the points.
+            leaf_size (int, optional): the maximum number of points in a leaf of the tree. Defaults to 16.
+            rebuild_threshold (int, optional): the number of points inserted after the tree was built, that triggers
+                a rebuild of the tree. Defaults to 1024.
+        """
+        self.num_objectives = num_objectives
+        self.leaf_size = leaf_size
+        self.rebuild_threshold = rebuild_threshold
+        self._points = np.empty((16, num_objectives))
+        self._alive = np.zeros(16, dtype=np.bool_)
+        self._size = 0
+        self._build_tree()
+
+    def __len__(self) -> int:
+        """Return the number of points in the set."""
+        return int(self._alive[: self._size].sum())
+
+    @property
+    def n_removed(self) -> int:
+        """The number of slots of removed points, which are only freed by `compact`."""
+        return self._size - len(self)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """The slots of the points in the set, in the order they were inserted."""
+        return np.flatnonzero(self._alive[: self._size])
+
+    @property
+    def points(self) -> np.ndarray:
+        """The points in the set, in the order they were inserted."""
+        return self._points[self.ids]
+
+    def _build_tree(self) -> None:
+        """Build the tree over the points in the set."""
+        (
+            self._perm,
+            self._lower,
+            self._upper,
+            self._start,
+            self._end,
+            self._left,
+            _,
+        ) = _build_tree(self._points, self.ids, self.leaf_size)
+        self._tree_size = self._size
+
+    def insert(self, points: np.ndarray) -> np.ndarray:
+        """Insert the points that are not dominated by the set, and remove the points in the set they dominate.
+
+        Args:
+            points (np.ndarray): 2-D array of points, with each row being a single point.
+
+        Returns:
+            np.ndarray: The slots of the inserted points, with -1 for the points that were not inserted.
+        """
+        points = np.ascontiguousarray(points, dtype=np.float64)
+        slots = np.full(len(points), -1, dtype=np.int64)
+        if len(points) == 0:
+            return slots
+        # The points not dominated by the other new points
+        candidates = np.flatnonzero(non_dominated_ranks(points) == 0)
+
+        if self._size + len(candidates) > len(self._points):
+            capacity = max(2 * len(self._points), self._size + len(candidates))
+            self._points = np.concatenate((self._points, np.empty((capacity - len(self._points), self.num_objectives))))
+            self._alive = np.concatenate((self._alive, np.zeros(capacity - len(self._alive), dtype=np.bool_)))
+
+        inserted = _index_insert(
+            points[candidates],
+            self._points,
+            self._alive,
+            self._size,
+            self._tree_size,
+            self._perm,
+            self._lower,
+            self._upper,
+            self._start,
+            self._end,
+            self._left,
+        )
+        slots[candidates[inserted]] = self._size + np.arange(inserted.sum())
+        self._size += int(inserted.sum())
+
+        if self._size - self._tree_size > self.rebuild_threshold:
+            self._build_tree()
+        return slots
+
+    def compact(self) -> np.ndarray:
+        """Drop the removed points from the buffers, and renumber the slots of the remaining points.
+
+        The remaining points keep their order, i.e., the point in the i-th slot of `ids` moves to slot i. The buffers
+        are shrunk if they are more than four times larger than needed.
+
+        Returns:
+            np.ndarray: The old slots of the remaining points.
+        """
+        ids = self.ids
+        capacity = max(16, 2 * len(ids))
+        if len(self._points) > 2 * capacity:
+            points = np.empty((capacity, self.num_objectives))
+            points[: len(ids)] = self._points[ids]
+            self._points = points
+            self._alive = np.zeros(capacity, dtype=np.bool_)
+        else:
+            self._points[: len(ids)] = self._points[ids]
+            self._alive[:] = False
+        self._alive[: len(ids)] = True
+        self._size = len(ids)
+        self._build_tree()
+        return ids
@@ -11,6 +11,7 @@ from typing import Literal
 import numpy as np
 
 from desdeo.problem import (
+    Constant,
     Constraint,
     ConstraintTypeEnum,
     Problem,
@@ -95,6 +96,72 @@ def objective_dict_has_all_symbols(problem: Problem, obj_dict: dict[str, float])
     return all(obj.symbol in obj_dict for obj in problem.objectives)
 
 
+_PARAMETER_NAMES = {"rp": "Reference point component", "w": "Weight", "eps": "Epsilon bound"}
+"""Descriptive names of the parameters of the parametric scalarization functions."""
+
+
+def scalarization_parameters(
+    symbol: str, parameter: Literal["rp", "w", "eps"], values: dict[str, float]
+) -> dict[str, float]:
+    """Return the values of the parameters of a parametric scalarization function as constant values.
+
+    The parameters of a scalarization function added with `parametric=True`, e.g., the components of
+    a reference point, are constants of the problem. The returned dict can be passed to the
+    `update_constants` method of a problem, an evaluator, or a solver to change the parameters without
+    adding the scalarization function again. E.g., `solver.update_constants(scalarization_parameters("asf",
+    "rp", new_reference_point))`.
+
+    Args:
+        symbol (str): the symbol of the parametric scalarization function.
+        parameter (Literal["rp", "w", "eps"]): the parameter, "rp" for the reference point, "w" for the weights,
+            and "eps" for the epsilon bounds.
+        values (dict[str, float]): the new values of the parameter as an objective dict.
+
+    Returns:
+        dict[str, float]: the values with the symbols of the corresponding constants as the keys.
+    """
+    return {f"{symbol}_{parameter}_{obj_symbol}": value for obj_symbol, value in values.items()}
+
+
+def _add_parameters(
+    problem: Problem,
+    symbol: str,
+    parameter: Literal["rp", "w", "eps"],
+    values: dict[str, float],
+    objective_symbols: list[str] | None = None,
+) -> tuple[Problem, dict[str, str]]:
+    """Add the parameters of a parametric scalarization function to a problem as constants.
+
+    Args:
+        problem (Problem): the problem the parameters are added to.
+        symbol (str): the symbol of the parametric scalarization function.
+        parameter (Literal["rp", "w", "eps"]): the parameter, see `scalarization_parameters`.
+        values (dict[str, float]): the values of the parameter as an objective dict.
+        objective_symbols (list[str] | None, optional): the symbols of the objectives a constant is added for.
+            Defaults to None, in which case a constant is added for each objective of the problem.
+
+    Returns:
+        tuple[Problem, dict[str, str]]: a copy of the problem with the constants added, and a dict
+            with the objective symbols as keys and the symbols of the corresponding constants as values.
+    """
+    if objective_symbols is None:
+        objective_symbols = [obj.symbol for obj in problem.objectives]
+
+    constant_values = scalarization_parameters(symbol, parameter, {s: values[s] for s in objective_symbols})
+    constant_symbols = dict(zip(objective_symbols, constant_values, strict=True))
+
+    constants = [
+        Constant(
+            name=f"{_PARAMETER_NAMES[parameter]} of {symbol} for {obj_symbol}",
+            symbol=constant_symbols[obj_symbol],
+            value=constant_values[constant_symbols[obj_symbol]],
+        )
+        for obj_symbol in objective_symbols
+    ]
+
+    return problem.add_constants(constants), constant_symbols
+
+
 def add_asf_nondiff(  # noqa: PLR0913
     problem: Problem,
     symbol: str,
@@ -105,6 +172,7 @@ def add_asf_nondiff(  # noqa: PLR0913
     rho: float = 0.000001,
     *,
     reference_in_aug=False,
+    parametric: bool = False,
 ) -> tuple[Problem, str]:
     r"""Add the achievement scalarizing function for a problem with the reference point.
 
@@ -153,6 +221,9 @@ def add_asf_nondiff(  # noqa: PLR0913
         rho (float, optional): the weight factor used in the augmentation term. Defaults to 0.000001.
         reference_in_aug (bool): whether the reference point should be used in
             the augmentation term as well. Defaults to False.
+        parametric (bool, optional): whether the reference point is added to the problem as constants
+            instead of literal values, so that it can be changed later without adding the scalarization
+            again, see `scalarization_parameters`. Defaults to False.
 
     Raises:
         ScalarizationError: there are missing elements in the reference point, or if any of the ideal or nadir
@@ -191,10 +262,16 @@ def add_asf_nondiff(  # noqa: PLR0913
         msg = f"There are undefined values in either the ideal ({ideal_point}) or the nadir point ({nadir_point})."
         raise ScalarizationError(msg)
 
+    # the reference point components are either literal values or the symbols of constants
+    if parametric:
+        problem, rp = _add_parameters(problem, symbol, "rp", reference_point)
+    else:
+        rp = reference_point
+
     # Build the max term
     max_operands = [
         (
-            f"({obj.symbol}_min - {reference_point[obj.symbol]}{" * -1" if obj.maximize else ''}) "
+            f"({obj.symbol}_min - {rp[obj.symbol]}{" * -1" if obj.maximize else ''}) "
             f"/ ({nadir_point[obj.symbol]} - ({ideal_point[obj.symbol]} - {delta}))"
         )
         for obj in problem.objectives
@@ -210,7 +287,7 @@ def add_asf_nondiff(  # noqa: PLR0913
     else:
         aug_operands = [
             (
-                f"({obj.symbol}_min - {reference_point[obj.symbol]}{" * -1" if obj.maximize else 1}) "
+                f"({obj.symbol}_min - {rp[obj.symbol]}{" * -1" if obj.maximize else ''}) "
                 f"/ ({nadir_point[obj.symbol]} - ({ideal_point[obj.symbol]} - {delta}))"
             )
             for obj in problem.objectives
@@ -1744,6 +1821,8 @@ def add_stom_sf_diff(
     ideal: dict[str, float] | None = None,
     rho: float = 1e-6,
     delta: float = 1e-6,
+    *,
+    parametric: bool = False,
 ) -> tuple[Problem, str]:
     r"""Adds the differentiable variant of the STOM scalarizing function.
 
@@ -1776,6 +1855,9 @@ def add_stom_sf_diff(
         rho (float, optional): a small scalar value to scale the sum in the objective
             function of the scalarization. Defaults to 1e-6.
         delta (float, optional): a small scalar value to define the utopian point. Defaults to 1e-6.
+        parametric (bool, optional): whether the reference point is added to the problem as constants
+            instead of literal values, so that it can be changed later without adding the scalarization
+            again, see `scalarization_parameters`. Defaults to False.
 
     Returns:
         tuple[Problem, str]: a tuple with the copy of the problem with the added
@@ -1796,7 +1878,15 @@ def add_stom_sf_diff(
         msg = "Ideal point not defined!"
         raise ScalarizationError(msg)
 
-    corrected_rp = flip_maximized_objective_values(problem, reference_point)
+    # the reference point components are either literal values or the symbols of constants
+    if parametric:
+        problem, rp = _add_parameters(problem, symbol, "rp", reference_point)
+        corrected_rp = {
+            obj.symbol: f"{rp[obj.symbol]}{' * -1' if obj.maximize else ''}" for obj in problem.objectives
+        }
+    else:
+        rp = reference_point
+        corrected_rp = flip_maximized_objective_values(problem, reference_point)
 
     # define the auxiliary variable
     alpha = Variable(
@@ -1811,7 +1901,7 @@ def add_stom_sf_diff(
     # define the objective function of the scalarization
     aug_expr = " + ".join(
         [
-            f"{obj.symbol}_min / ({reference_point[obj.symbol]} - {ideal_point[obj.symbol] - delta})"
+            f"{obj.symbol}_min / ({rp[obj.symbol]} - {ideal_point[obj.symbol] - delta})"
             for obj in problem.objectives
         ]
     )
@@ -1831,7 +1921,7 @@ def add_stom_sf_diff(
     for obj in problem.objectives:
         expr = (
             f"({obj.symbol}_min - {ideal_point[obj.symbol] - delta}) / "
-            f"({corrected_rp[obj.symbol] - (ideal_point[obj.symbol] - delta)}) - _alpha"
+            f"({corrected_rp[obj.symbol]} - {ideal_point[obj.symbol] - delta}) - _alpha"
         )
         constraints.append(
             Constraint(
@@ -1857,6 +1947,8 @@ def add_stom_sf_nondiff(
     ideal: dict[str, float] | None = None,
     rho: float = 1e-6,
     delta: float = 1e-6,
+    *,
+    parametric: bool = False,
 ) -> tuple[Problem, str]:
     r"""Adds the non-differentiable variant of the STOM scalarizing function.
 
@@ -1890,6 +1982,9 @@ def add_stom_sf_nondiff(
         rho (float, optional): a small scalar value to scale the sum in the objective
             function of the scalarization. Defaults to 1e-6.
         delta (float, optional): a small scalar value to define the utopian point. Defaults to 1e-6.
+        parametric (bool, optional): whether the reference point is added to the problem as constants
+            instead of literal values, so that it can be changed later without adding the scalarization
+            again, see `scalarization_parameters`. Defaults to False.
 
     Returns:
         tuple[Problem, str]: a tuple with the copy of the problem with the added
@@ -1910,7 +2005,15 @@ def add_stom_sf_nondiff(
         msg = "Ideal point not defined!"
         raise ScalarizationError(msg)
 
-    corrected_rp = flip_maximized_objective_values(problem, reference_point)
+    # the reference point components are either literal values or the symbols of constants
+    if parametric:
+        problem, rp = _add_parameters(problem, symbol, "rp", reference_point)
+        corrected_rp = {
+            obj.symbol: f"{rp[obj.symbol]}{' * -1' if obj.maximize else ''}" for obj in problem.objectives
+        }
+    else:
+        rp = reference_point
+        corrected_rp = flip_maximized_objective_values(problem, reference_point)
 
     # define the objective function of the scalarization
     max_expr = ", ".join(
@@ -1924,7 +2027,7 @@ def add_stom_sf_nondiff(
     )
     aug_expr = " + ".join(
         [
-            f"{obj.symbol}_min / ({reference_point[obj.symbol]} - {ideal_point[obj.symbol] - delta})"
+            f"{obj.symbol}_min / ({rp[obj.symbol]} - {ideal_point[obj.symbol] - delta})"
             for obj in problem.objectives
         ]
     )
@@ -2722,6 +2825,8 @@ def add_asf_diff(
     nadir: dict[str, float] | None = None,
     rho: float = 1e-6,
     delta: float = 1e-6,
+    *,
+    parametric: bool = False,
 ) -> tuple[Problem, str]:
     r"""Adds the differentiable variant of the achievement scalarizing function.
 
@@ -2754,6 +2859,9 @@ def add_asf_diff(
         rho (float, optional): a small scalar value to scale the sum in the objective
             function of the scalarization. Defaults to 1e-6.
         delta (float, optional): a small scalar to define the utopian point. Defaults to 1e-6.
+        parametric (bool, optional): whether the reference point is added to the problem as constants
+            instead of literal values, so that it can be changed later without adding the scalarization
+            again, see `scalarization_parameters`. Defaults to False.
 
     Returns:
         tuple[Problem, str]: a tuple with the copy of the problem with the added
@@ -2787,7 +2895,14 @@ def add_asf_diff(
         msg = "Nadir point not defined!"
         raise ScalarizationError(msg)
 
-    corrected_rp = flip_maximized_objective_values(problem, reference_point)
+    # the reference point components are either literal values or the symbols of constants
+    if parametric:
+        problem, rp = _add_parameters(problem, symbol, "rp", reference_point)
+        corrected_rp = {
+            obj.symbol: f"{rp[obj.symbol]}{' * -1' if obj.maximize else ''}" for obj in problem.objectives
+        }
+    else:
+        corrected_rp = flip_maximized_objective_values(problem, reference_point)
 
     # define the auxiliary variable
     alpha = Variable(
@@ -2842,7 +2957,9 @@ def add_asf_diff(
     return _problem.add_constraints(constraints), symbol
 
 
-def add_weighted_sums(problem: Problem, symbol: str, weights: dict[str, float]) -> tuple[Problem, str]:
+def add_weighted_sums(
+    problem: Problem, symbol: str, weights: dict[str, float], *, parametric: bool = False
+) -> tuple[Problem, str]:
     r"""Add the weighted sums scalarization to a problem with the given weights.
 
     It is assumed that the weights add to 1.
@@ -2869,6 +2986,9 @@ def add_weighted_sums(problem: Problem, symbol: str, weights: dict[str, float])
         symbol (str): the symbol to reference the added scalarization function.
         weights (dict[str, float]): the weights. For the method to work, the weights
             should sum to 1. However, this is not a condition that is checked.
+        parametric (bool, optional): whether the weights are added to the problem as constants
+            instead of literal values, so that they can be changed later without adding the scalarization
+            again, see `scalarization_parameters`. Defaults to False.
 
     Raises:
         ScalarizationError: if the weights are missing any of the objective components.
@@ -2882,6 +3002,10 @@ def add_weighted_sums(problem: Problem, symbol: str, weights: dict[str, float])
         msg = f"The given weight vector {weights} does not have a component defined for all the objectives."
         raise ScalarizationError(msg)
 
+    # the weights are either literal values or the symbols of constants
+    if parametric:
+        problem, weights = _add_parameters(problem, symbol, "w", weights)
+
     # Build the sum
     sum_terms = [f"({weights[obj.symbol]} * {obj.symbol}_min)" for obj in problem.objectives]
 
@@ -2945,7 +3069,13 @@ def add_objective_as_scalarization(problem: Problem, symbol: str, objective_symb
 
 
 def add_epsilon_constraints(
-    problem: Problem, symbol: str, constraint_symbols: dict[str, str], objective_symbol: str, epsilons: dict[str, float]
+    problem: Problem,
+    symbol: str,
+    constraint_symbols: dict[str, str],
+    objective_symbol: str,
+    epsilons: dict[str, float],
+    *,
+    parametric: bool = False,
 ) -> tuple[Problem, str, list[str]]:
     r"""Creates expressions for an epsilon constraints scalarization and constraints.
 
@@ -2975,6 +3105,9 @@ def add_epsilon_constraints(
         epsilons (dict[str, float]): the epsilon constraint values in a dict
             with each key being an objective's symbol. The corresponding value
             is then used as the epsilon value for the respective objective function.
+        parametric (bool, optional): whether the epsilon values are added to the problem as constants
+            instead of literal values, so that they can be changed later without adding the scalarization
+            again, see `scalarization_parameters`. Defaults to False.
 
     Raises:
         ScalarizationError: `objective_symbol` not found in problem definition.
@@ -2991,6 +3124,11 @@ def add_epsilon_constraints(
 
     _problem, _ = add_objective_as_scalarization(problem, symbol, objective_symbol)
 
+    # the epsilons are either literal values or the symbols of constants
+    if parametric:
+        constrained_symbols = [obj.symbol for obj in problem.objectives if obj.symbol != objective_symbol]
+        _problem, epsilons = _add_parameters(_problem, symbol, "eps", epsilons, constrained_symbols)
+
     # the epsilons must be given such that each objective function is to be minimized
     constraints = [
         Constraint(
@@ -0,0 +1,189 @@
+"""A shared executor for solving independent single-objective subproblems in parallel.
+
+Many of the interactive methods solve several independent scalarized subproblems for each interaction with the
+decision maker, e.g., the subproblems of NIMBUS, the epsilon constraint problems of the reachable bounds in the
+NAUTILUS family of methods, and the rows of a payoff table. The `SubproblemExecutor` solves such subproblems in a
+pool of processes and returns the results in the order the subproblems were given.
+
+The methods use the executor returned by `get_subproblem_executor` by default. It solves the subproblems serially in
+the calling process, unless the environment variable `DESDEO_SUBPROBLEM_WORKERS` is set to a number of workers
+greater than one, e.g., when serving the API.
+"""
+
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar
+
+from desdeo.problem import Problem
+from desdeo.tools.generics import BaseSolver, SolverOptions, SolverResults
+from desdeo.tools.gurobipy_solver_interfaces import GurobipySolver, PersistentGurobipySolver
+from desdeo.tools.pyomo_solver_interfaces import CbcOptions, PyomoCBCSolver, _default_cbc_options
+
+SUBPROBLEM_WORKERS = int(os.environ.get("DESDEO_SUBPROBLEM_WORKERS", "1"))
+"""The number of workers of the shared subproblem executor.
+
+Can be changed by setting the environment variable `DESDEO_SUBPROBLEM_WORKERS`."""
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_THREAD_ENVIRONMENT_VARIABLES = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+"""Environment variables limiting the threads of the linear algebra libraries used by, e.g., Ipopt and Bonmin."""
+
+
+def _init_worker(solver_threads: int) -> None:
+    """Limit the threads of the solvers started by a worker process of the pool."""
+    for variable in _THREAD_ENVIRONMENT_VARIABLES:
+        os.environ[variable] = str(solver_threads)
+
+
+def _init_solver(solver: type[BaseSolver], solver_options: SolverOptions | None, problem: Problem) -> BaseSolver:
+    """Initialize a solver for a problem, passing the options only if they are given."""
+    return solver(problem, solver_options) if solver_options is not None else solver(problem)
+
+
+def _solve_subproblem_task(task: tuple) -> SolverResults:
+    """Solve a subproblem in a worker process of the pool."""
+    solver, solver_options, problem, target = task
+    return _init_solver(solver, solver_options, problem).solve(target)
+
+
+class SubproblemExecutor:
+    """Solves independent single-objective subproblems, in parallel in a pool of processes if there are many workers.
+
+    The pool is created on first use and kept alive between calls, so that the workers only import DESDEO once. When
+    the subproblems are solved in parallel, the threads of each solver are limited so that the workers do not
+    oversubscribe the CPUs: Ipopt and Bonmin through the threads of their linear algebra libraries, and CBC and gurobi
+    through their thread options.
+    """
+
+    def __init__(self, n_workers: int | None = None, solver_threads: int | None = None):
+        """Initialize the executor.
+
+        Args:
+            n_workers (int | None, optional): the number of worker processes. If 1, the subproblems are solved
+                serially in the calling process. Defaults to None, in which case the number of CPUs is used.
+            solver_threads (int | None, optional): the maximum number of threads used by the solver of each
+                subproblem when solving in parallel. Defaults to None, in which case the CPUs are divided evenly
+                between the workers.
+
+        Raises:
+            ValueError: the number of workers or solver threads is not positive.
+        """
+        self.n_workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+        if self.n_workers < 1:
+            raise ValueError("The number of workers must be a positive integer.")
+        self.solver_threads = (
+            solver_threads if solver_threads is not None else max(1, (os.cpu_count() or 1) // self.n_workers)
+        )
+        if self.solver_threads < 1:
+            raise ValueError("The number of solver threads must be a positive integer.")
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the pool of workers, creating it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.solver_threads,),
+            )
+        return self._executor
+
+    def limit_threads(self, solver: type[BaseSolver], solver_options: SolverOptions | None) -> SolverOptions | None:
+        """Return the solver options with the threads of the solver limited to `solver_threads`."""
+        if not isinstance(solver, type):
+            return solver_options
+        if issubclass(solver, PyomoCBCSolver):
+            options: CbcOptions = solver_options if solver_options is not None else _default_cbc_options
+            return options.model_copy(update={"threads": min(options.threads, self.solver_threads)})
+        if issubclass(solver, GurobipySolver | PersistentGurobipySolver):
+            return {"Threads": self.solver_threads, **(solver_options or {})}
+        return solver_options
+
+    def solve(
+        self,
+        subproblems: Sequence[tuple[Problem, str]],
+        solver: type[BaseSolver],
+        solver_options: SolverOptions | None = None,
+    ) -> list[SolverResults]:
+        """Solve the subproblems.
+
+        When solving serially, consecutive subproblems with the same problem are solved with the same solver
+        instance, e.g., when optimizing each objective function of a problem in turn.
+
+        Args:
+            subproblems (Sequence[tuple[Problem, str]]): the subproblems as pairs of a problem and the symbol of the
+                function to be optimized in it.
+            solver (type[BaseSolver]): the solver used to solve each of the subproblems. Must be picklable, e.g., a
+                solver class, when solving in parallel.
+            solver_options (SolverOptions | None, optional): the options passed to the solver. Defaults to None.
+
+        Returns:
+            list[SolverResults]: the results of the subproblems, in the same order as the subproblems.
+        """
+        if self.n_workers == 1 or len(subproblems) <= 1:
+            results = []
+            solver_instance, solved_problem = None, None
+            for problem, target in subproblems:
+                if problem is not solved_problem:
+                    solver_instance, solved_problem = _init_solver(solver, solver_options, problem), problem
+                results.append(solver_instance.solve(target))
+            return results
+
+        solver_options = self.limit_threads(solver, solver_options)
+        tasks = [(solver, solver_options, problem, target) for problem, target in subproblems]
+        # map returns the results in the order of the subproblems
+        return list(self._get_executor().map(_solve_subproblem_task, tasks))
+
+    def map(self, function: Callable[[T], R], tasks: Sequence[T]) -> list[R]:
+        """Apply a function to each of the tasks, in parallel in the pool if there are many workers.
+
+        Can be used when the subproblems are not independent of each other, e.g., when a solver
+        is reused for several subproblems in each task.
+
+        Args:
+            function (Callable[[T], R]): the function applied to each task. Must be picklable, e.g., a
+                module level function, when applied in parallel.
+            tasks (Sequence[T]): the tasks. Must be picklable when applied in parallel.
+
+        Returns:
+            list[R]: the results of the function, in the same order as the tasks.
+        """
+        if self.n_workers == 1 or len(tasks) <= 1:
+            return [function(task) for task in tasks]
+
+        return list(self._get_executor().map(function, tasks))
+
+    def close(self) -> None:
+        """Shut down the pool of workers, if one has been created."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __del__(self):
+        """Shut down the pool of workers when the executor is garbage collected."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+_shared_executor: SubproblemExecutor | None = None
+"""The executor shared by the methods, created on first use."""
+
+
+def get_subproblem_executor() -> SubproblemExecutor:
+    """Return the subproblem executor shared by the methods.
+
+    The executor has `SUBPROBLEM_WORKERS` workers.
+
+    Returns:
+        SubproblemExecutor: the shared executor.
+    """
+    global _shared_executor  # noqa: PLW0603
+    if _shared_executor is None:
+        _shared_executor = SubproblemExecutor(n_workers=SUBPROBLEM_WORKERS)
+    return _shared_executor
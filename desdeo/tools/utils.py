@@ -34,6 +34,7 @@ from desdeo.tools.scipy_solver_interfaces import (
     ScipyMinimizeOptions,
     ScipyMinimizeSolver,
 )
+from desdeo.tools.subproblem_executor import get_subproblem_executor
 
 available_solvers = {
     "scipy_minimize": {
@@ -340,13 +341,14 @@ def payoff_table_method(problem: Problem, solver: BaseSolver = None) -> tuple[di
         tuple[dict[str, float], dict[str, float]]: The estimated ideal and nadir points.
     """
     solver = solver if solver is not None else guess_best_solver(problem)
-    solver = solver(problem)
 
     k = len(problem.objectives)
     po_table = np.zeros((k, k))
 
-    for i in range(k):
-        res = solver.solve(f"{problem.objectives[i].symbol}_min")
+    # the objectives are optimized independently, and can be solved in parallel
+    results = get_subproblem_executor().solve([(problem, f"{obj.symbol}_min") for obj in problem.objectives], solver)
+
+    for i, res in enumerate(results):
         for j in range(k):
             po_table[i][j] = res.optimal_objectives[problem.objectives[j].symbol]
 
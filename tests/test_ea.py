@@ -1,15 +1,26 @@
 """Tests for Evolutionary Algorithms."""
 
+import time
 from contextlib import suppress
+from pathlib import Path
 
 import numpy as np
 import numpy.testing as npt
 import polars as pl
 import pytest
 
-from desdeo.emo.hooks.archivers import Archive, FeasibleArchive, NonDominatedArchive
+from desdeo.emo.hooks.archivers import (
+    Archive,
+    ArchiveEvictionEnum,
+    ArchiveStore,
+    FeasibleArchive,
+    NonDominatedArchive,
+    StreamingArchive,
+    StreamingFormatEnum,
+    scan_archive,
+)
 from desdeo.emo.methods.EAs import ibea, nsga3, nsga3_mixed_integer, rvea, rvea_mixed_integer
-from desdeo.emo.methods.templates import template1, template2
+from desdeo.emo.methods.templates import template1, template2, template_steady_state
 from desdeo.emo.operators.crossover import (
     BlendAlphaCrossover,
     BoundedExponentialCrossover,
@@ -20,7 +31,7 @@ from desdeo.emo.operators.crossover import (
     UniformIntegerCrossover,
     UniformMixedIntegerCrossover,
 )
-from desdeo.emo.operators.evaluator import EMOEvaluator
+from desdeo.emo.operators.evaluator import EMOEvaluator, ParallelEvaluationEnum
 from desdeo.emo.operators.generator import (
     LHSGenerator,
     RandomBinaryGenerator,
@@ -38,16 +49,25 @@ from desdeo.emo.operators.mutation import (
     PowerMutation,
     SelfAdaptiveGaussianMutation,
 )
+from desdeo.emo.operators.population import Population
 from desdeo.emo.operators.scalar_selection import TournamentSelection
 from desdeo.emo.operators.selection import (
+    HypervolumeSelector,
     IBEA_Selector,
     NSGAIII_select,
     ParameterAdaptationStrategy,
+    ReferenceVectorGeometry,
     ReferenceVectorOptions,
     RVEASelector,
+    _apd_select,
+    _ibea_fitness,
+    _ibea_select_all,
+    _s_energy_cache,
+    riesz_s_energy_vectors,
+    s_energy_cache_dir,
 )
 from desdeo.emo.operators.termination import MaxEvaluationsTerminator, MaxGenerationsTerminator
-from desdeo.problem import VariableDomainTypeEnum
+from desdeo.problem import Evaluator, VariableDomainTypeEnum
 from desdeo.problem.testproblems import (
     dtlz2,
     momip_ti2,
@@ -57,7 +77,15 @@ from desdeo.problem.testproblems import (
     simple_knapsack_vectors,
     simple_test_problem,
 )
-from desdeo.tools.message import IntMessage, TerminatorMessageTopics
+from desdeo.tools.indicators_binary import self_epsilon
+from desdeo.tools.message import (
+    BoolMessage,
+    EvaluatorMessageTopics,
+    IntMessage,
+    PolarsDataFrameMessage,
+    TerminatorMessageTopics,
+)
+from desdeo.tools.non_dominated_sorting import non_dominated, non_dominated_merge, non_dominated_ranks
 from desdeo.tools.patterns import Publisher, Subscriber
 from desdeo.tools.utils import repair
 
@@ -1249,3 +1277,872 @@ def test_mutation_in_ea():
             print(results)
         except Exception as e:
             pytest.fail(f"Failed to run EA with mutation {mut}: {e}")
+
+
+@pytest.mark.ea
+def test_emo_evaluator_compiled_once():
+    """Test that EMOEvaluators of structurally identical problems share one compiled evaluator."""
+    publisher = Publisher()
+    problem = dtlz2(n_objectives=3, n_variables=6)
+
+    evaluator_1 = EMOEvaluator(problem=problem, publisher=publisher, verbosity=2)
+    evaluator_2 = EMOEvaluator(problem=dtlz2(n_objectives=3, n_variables=6), publisher=publisher, verbosity=2)
+    evaluator_3 = EMOEvaluator(problem=dtlz2(n_objectives=3, n_variables=7), publisher=publisher, verbosity=2)
+
+    assert evaluator_1.evaluator is evaluator_2.evaluator
+    assert evaluator_1.evaluator is not evaluator_3.evaluator
+
+    population = pl.DataFrame(
+        np.random.default_rng(0).random((20, 6)), schema=[var.symbol for var in problem.variables]
+    )
+
+    # evaluating the dataframe directly must match evaluating a dict of lists
+    out = evaluator_1.evaluate(population)
+    expected = Evaluator(problem).evaluate(population.to_dict(as_series=False), flat=True).drop(
+        [var.symbol for var in problem.variables]
+    )
+
+    assert out.columns == expected.columns
+    npt.assert_allclose(out.to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.ea
+@pytest.mark.parametrize("parallel", [ParallelEvaluationEnum.thread, ParallelEvaluationEnum.process])
+def test_emo_evaluator_parallel(parallel):
+    """Test that evaluating the population in parallel matches the serial evaluation, messages included."""
+    problem = dtlz2(n_objectives=3, n_variables=6)
+    population = pl.DataFrame(
+        np.random.default_rng(0).random((101, 6)), schema=[var.symbol for var in problem.variables]
+    )
+
+    serial_publisher = Publisher()
+    serial = EMOEvaluator(problem=problem, publisher=serial_publisher, verbosity=2)
+    parallel_publisher = Publisher()
+    evaluator = EMOEvaluator(
+        problem=problem, publisher=parallel_publisher, verbosity=2, parallel=parallel, n_workers=3
+    )
+
+    try:
+        for _ in range(2):
+            # the same pool is reused between generations
+            expected = serial.evaluate(population)
+            out = evaluator.evaluate(population)
+
+            assert out.columns == expected.columns
+            npt.assert_allclose(out.to_numpy(), expected.to_numpy())
+
+            serial_state = serial.state()
+            parallel_state = evaluator.state()
+            assert [(m.topic, m.source) for m in serial_state] == [(m.topic, m.source) for m in parallel_state]
+            assert serial_state[0].value == parallel_state[0].value == len(population)
+            assert serial_state[1].value.columns == parallel_state[1].value.columns
+    finally:
+        evaluator.close()
+
+    assert evaluator._executor is None
+
+
+@pytest.mark.ea
+@pytest.mark.parametrize("selector_type", ["rvea", "nsga3"])
+def test_template_steady_state(selector_type):
+    """Test that the asynchronous steady-state template runs with overlapping evaluations."""
+    problem = dtlz2(n_objectives=3, n_variables=12)
+    publisher = Publisher()
+
+    evaluator = EMOEvaluator(problem=problem, publisher=publisher, verbosity=2)
+    generator = LHSGenerator(
+        problem=problem, evaluator=evaluator, publisher=publisher, n_points=20, seed=0, verbosity=2
+    )
+    crossover = SimulatedBinaryCrossover(problem=problem, publisher=publisher, seed=0, verbosity=1)
+    mutation = BoundedPolynomialMutation(problem=problem, publisher=publisher, seed=0, verbosity=1)
+    if selector_type == "rvea":
+        selector = RVEASelector(
+            problem=problem,
+            publisher=publisher,
+            parameter_adaptation_strategy=ParameterAdaptationStrategy.FUNCTION_EVALUATION_BASED,
+            reference_vector_options=ReferenceVectorOptions(number_of_vectors=20),
+            verbosity=2,
+        )
+    else:
+        selector = NSGAIII_select(
+            problem=problem,
+            publisher=publisher,
+            reference_vector_options=ReferenceVectorOptions(number_of_vectors=20),
+            verbosity=2,
+        )
+    terminator = MaxEvaluationsTerminator(max_evaluations=2000, publisher=publisher)
+    archive = Archive(problem=problem, publisher=publisher)
+
+    components: list[Subscriber] = [evaluator, generator, crossover, mutation, selector, terminator, archive]
+    [publisher.auto_subscribe(component) for component in components]
+    [
+        publisher.register_topics(
+            topics=component.provided_topics[component.verbosity], source=component.__class__.__name__
+        )
+        for component in components
+    ]
+    assert publisher.check_consistency()[0], "Subscribers are subscribing to unregistered topics."
+
+    results = template_steady_state(
+        evaluator=evaluator,
+        generator=generator,
+        crossover=crossover,
+        mutation=mutation,
+        selection=selector,
+        terminator=terminator,
+        max_in_flight=4,
+        batch_size=5,
+    )
+
+    # Evaluations finishing together with the last inserted batch may be counted, but no more are started
+    assert 2000 <= terminator.current_evaluations <= 2000 + 4 * 5
+    # The archive also contains the initial population
+    assert len(archive.solutions) == terminator.current_evaluations + 20
+    assert results.solutions.columns == [var.symbol for var in problem.variables]
+    assert len(results.solutions) == len(results.outputs)
+
+    norm = results.outputs.with_columns(
+        (pl.col("f_1") ** 2 + pl.col("f_2") ** 2 + pl.col("f_3") ** 2).sqrt().alias("norm")
+    )["norm"]
+    assert norm.median() < 1.5
+
+
+@pytest.mark.ea
+def test_template_steady_state_latest_population():
+    """Test that the offspring of each batch are created from the population updated by the previous insertions."""
+    problem = dtlz2(n_objectives=3, n_variables=12)
+    publisher = Publisher()
+
+    evaluator = EMOEvaluator(problem=problem, publisher=publisher, verbosity=0)
+    generator = LHSGenerator(
+        problem=problem, evaluator=evaluator, publisher=publisher, n_points=20, seed=0, verbosity=0
+    )
+    mutation = BoundedPolynomialMutation(problem=problem, publisher=publisher, seed=0, verbosity=0)
+    # Each insertion counts as one generation
+    terminator = MaxGenerationsTerminator(max_generations=10, publisher=publisher)
+
+    mated, selected = [], []
+
+    class RecordingCrossover(SimulatedBinaryCrossover):
+        def do(self, *, population, to_mate=None):
+            mated.append((population, to_mate))
+            return super().do(population=population, to_mate=to_mate)
+
+    class RecordingSelector(NSGAIII_select):
+        def do(self, parents, offsprings):
+            result = super().do(parents=parents, offsprings=offsprings)
+            selected.append(result[0])
+            return result
+
+    crossover = RecordingCrossover(problem=problem, publisher=publisher, seed=0, verbosity=0)
+    selector = RecordingSelector(
+        problem=problem,
+        publisher=publisher,
+        reference_vector_options=ReferenceVectorOptions(number_of_vectors=20),
+        verbosity=0,
+    )
+
+    template_steady_state(
+        evaluator=evaluator,
+        generator=generator,
+        crossover=crossover,
+        mutation=mutation,
+        selection=selector,
+        terminator=terminator,
+        max_in_flight=1,
+        batch_size=3,
+    )
+
+    # Two pairs of parents are mated for each batch of three offspring
+    assert len(selected) == 9  # the terminator is checked once before the first insertion
+    assert all(len(to_mate) == 4 for _, to_mate in mated)
+    # With a single evaluation in flight, each batch is created from the population after the previous insertion
+    for (population, _), previous in zip(mated[1:], selected, strict=False):
+        assert population.equals(previous)
+
+
+def _send_batches_to_archive(archive: NonDominatedArchive, batches: list[pl.DataFrame]) -> None:
+    """Send evaluated batches to an archive the way the evaluator does."""
+    for generation, batch in enumerate(batches, start=1):
+        archive.update(IntMessage(topic=TerminatorMessageTopics.GENERATION, value=generation, source="test"))
+        archive.update(PolarsDataFrameMessage(topic=EvaluatorMessageTopics.VERBOSE_OUTPUTS, value=batch, source="test"))
+
+
+@pytest.mark.ea
+@pytest.mark.parametrize("n_objectives", [2, 3, 4])
+def test_non_dominated_archive_incremental(n_objectives):
+    """Test that the incremental non-dominated archive matches merging the batches pairwise."""
+    problem = dtlz2(n_objectives=n_objectives, n_variables=n_objectives + 2)
+    targets = [f"{obj.symbol}_min" for obj in problem.objectives]
+    rng = np.random.default_rng(n_objectives)
+    batches = []
+    for _ in range(20):
+        # Integer valued targets create ties and duplicates
+        values = rng.integers(0, 8, (50, n_objectives)).astype(float)
+        batches.append(pl.DataFrame(values, schema=targets).with_columns(x=pl.lit(rng.random(50))))
+
+    archive = NonDominatedArchive(problem=problem, publisher=Publisher())
+    assert archive.solutions is None
+    _send_batches_to_archive(archive, batches)
+
+    expected = None
+    for generation, batch in enumerate(batches, start=1):
+        front = batch.with_columns(generation=generation)
+        front = front.filter(non_dominated(front[targets].to_numpy()))
+        if expected is None:
+            expected = front
+            continue
+        mask1, mask2 = non_dominated_merge(expected[targets].to_numpy(), front[targets].to_numpy())
+        expected = pl.concat([expected.filter(mask1), front.filter(mask2)])
+
+    assert archive.solutions.equals(expected)
+    # reading the solutions again returns the same, materialized dataframe
+    assert archive.solutions is archive.solutions
+
+
+@pytest.mark.ea
+def test_non_dominated_archive_bounded():
+    """Test that the non-dominated archive drops the removed solutions without its solutions being read."""
+    problem = dtlz2(n_objectives=2, n_variables=4)
+    targets = [f"{obj.symbol}_min" for obj in problem.objectives]
+    rng = np.random.default_rng(0)
+    # Each batch dominates the previous ones, like a converging population
+    batches = [pl.DataFrame(rng.random((50, 2)) + 100 - i, schema=targets) for i in range(100)]
+
+    archive = NonDominatedArchive(problem=problem, publisher=Publisher())
+    _send_batches_to_archive(archive, batches)
+
+    front_size = len(archive._index)
+    assert archive._index.n_removed <= front_size
+    assert sum(len(frame) for frame in archive._frames) <= 2 * front_size
+    assert archive.solutions.equals(
+        batches[-1].with_columns(generation=100).filter(non_dominated(batches[-1].to_numpy()))
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("n_objectives", [2, 3])
+def test_non_dominated_archive_benchmark(n_objectives):
+    """Benchmark inserting many batches to the non-dominated archive."""
+    problem = dtlz2(n_objectives=n_objectives, n_variables=n_objectives + 2)
+    targets = [f"{obj.symbol}_min" for obj in problem.objectives]
+    rng = np.random.default_rng(0)
+    batches = []
+    for _ in range(500):
+        # Points near the unit sphere keep a large share of each batch non-dominated
+        values = rng.random((200, n_objectives))
+        values = values / np.linalg.norm(values, axis=1, keepdims=True) * rng.uniform(1, 1.01, (200, 1))
+        batches.append(pl.DataFrame(values, schema=targets))
+
+    archive = NonDominatedArchive(problem=problem, publisher=Publisher())
+    start = time.perf_counter()
+    _send_batches_to_archive(archive, batches)
+    solutions = archive.solutions
+    elapsed = time.perf_counter() - start
+
+    print(f"{n_objectives} objectives: {len(solutions)} archived solutions in {elapsed:.3f} s")
+
+
+@pytest.mark.ea
+def test_archive_store():
+    """Test that the archive store grows in doubling chunks and evicts rows when capped."""
+    rng = np.random.default_rng(0)
+    batches = [
+        pl.DataFrame(rng.random((10, 2)), schema=["f_1_min", "f_2_min"]).with_columns(generation=pl.lit(i))
+        for i in range(100)
+    ]
+    expected = pl.concat(batches)
+
+    store = ArchiveStore()
+    assert store.to_polars() is None
+    for batch in batches:
+        store.append(batch)
+    assert store.to_polars().equals(expected)
+    assert len(store) == 1000
+    # The chunk sizes double, so there are only logarithmically many of them
+    assert len(store._chunks) <= 10
+
+    fifo_store = ArchiveStore(max_size=95)
+    for batch in batches:
+        fifo_store.append(batch)
+    assert fifo_store.to_polars().equals(expected.tail(95))
+
+    nd_store = ArchiveStore(max_size=95, eviction=ArchiveEvictionEnum.non_dominated, targets=["f_1_min", "f_2_min"])
+    for batch in batches:
+        nd_store.append(batch)
+    kept = nd_store.to_polars()
+    # The rows are evicted down to the low-water mark, so the store is sorted only every few appends
+    assert int(95 * ArchiveStore.non_dominated_low_water) <= len(kept) <= 95
+    # The non-dominated solutions of all the rows are never evicted
+    ranks = non_dominated_ranks(expected[["f_1_min", "f_2_min"]].to_numpy())
+    assert kept.join(expected.filter(ranks == 0), on=expected.columns, how="inner").height == (ranks == 0).sum()
+
+    with pytest.raises(ValueError):
+        ArchiveStore(eviction=ArchiveEvictionEnum.non_dominated)
+
+
+@pytest.mark.ea
+def test_capped_archive():
+    """Test that an archive with a maximum size keeps the latest solutions."""
+    problem = dtlz2(n_objectives=3, n_variables=5)
+    targets = [f"{obj.symbol}_min" for obj in problem.objectives]
+    rng = np.random.default_rng(0)
+    batches = [pl.DataFrame(rng.random((30, 3)), schema=targets) for _ in range(10)]
+
+    archive = Archive(problem=problem, publisher=Publisher(), max_size=100)
+    _send_batches_to_archive(archive, batches)
+
+    expected = pl.concat([batch.with_columns(generation=i) for i, batch in enumerate(batches, start=1)]).tail(100)
+    assert archive.solutions.equals(expected)
+
+
+@pytest.mark.ea
+@pytest.mark.parametrize("file_format", [StreamingFormatEnum.parquet, StreamingFormatEnum.ipc])
+def test_streaming_archive(file_format, tmp_path):
+    """Test that the streaming archive writes the same rows as the in-memory archive."""
+    problem = dtlz2(n_objectives=3, n_variables=5)
+    targets = [f"{obj.symbol}_min" for obj in problem.objectives]
+    rng = np.random.default_rng(0)
+    batches = [pl.DataFrame(rng.random((30, 3)), schema=targets) for _ in range(10)]
+
+    archive = Archive(problem=problem, publisher=Publisher())
+    streaming = StreamingArchive(
+        problem=problem, publisher=Publisher(), path=tmp_path / "archive", file_format=file_format, buffer_size=50
+    )
+    assert streaming.solutions is None
+    _send_batches_to_archive(archive, batches)
+    _send_batches_to_archive(streaming, batches)
+
+    expected = archive.solutions.with_columns(pl.col("generation").cast(pl.Int64))
+    streamed = streaming.scan().collect().select(expected.columns).sort("generation", maintain_order=True)
+    assert streamed.equals(expected)
+    assert streaming.solutions.sort("generation", maintain_order=True).select(expected.columns).equals(expected)
+
+    # The partitions are queried lazily
+    lazy = scan_archive(tmp_path / "archive", file_format).filter(pl.col("generation") == 3).select(targets)
+    assert lazy.collect().equals(batches[2])
+
+    with pytest.raises(ValueError):
+        StreamingArchive(problem=problem, publisher=Publisher(), path=tmp_path / "archive")
+
+
+@pytest.mark.ea
+def test_streaming_archive_flushed_at_end(tmp_path):
+    """Test that the rows buffered by the streaming archive are written when the run ends."""
+    problem = dtlz2(n_objectives=3, n_variables=5)
+    solver, publisher = nsga3(problem=problem, n_generations=5)
+
+    archive = Archive(problem=problem, publisher=publisher)
+    streaming = StreamingArchive(problem=problem, publisher=publisher, path=tmp_path / "run")
+    publisher.auto_subscribe(archive)
+    publisher.auto_subscribe(streaming)
+
+    solver()
+
+    # read from disk only, like another process would
+    assert not streaming._buffered_rows
+    streamed = scan_archive(tmp_path / "run").collect()
+    assert len(streamed) == len(archive.solutions)
+    assert streamed["generation"].max() == archive.solutions["generation"].max()
+
+    # the rows of the last generation are written when the terminator reports the end of the run
+    targets = [f"{obj.symbol}_min" for obj in problem.objectives]
+    batches = [pl.DataFrame(np.random.default_rng(0).random((30, 3)), schema=targets)]
+    terminated = StreamingArchive(problem=problem, publisher=Publisher(), path=tmp_path / "terminated")
+    _send_batches_to_archive(terminated, batches)
+    assert not (tmp_path / "terminated").exists()
+    terminated.update(BoolMessage(topic=TerminatorMessageTopics.TERMINATION, value=True, source="test"))
+    assert scan_archive(tmp_path / "terminated").select(targets).collect().equals(batches[0])
+
+    # closing the archive writes the rows buffered outside of a run
+    with StreamingArchive(problem=problem, publisher=Publisher(), path=tmp_path / "closed") as closed:
+        _send_batches_to_archive(closed, batches)
+        assert not (tmp_path / "closed").exists()
+    assert scan_archive(tmp_path / "closed").select(targets).collect().equals(batches[0])
+
+
+@pytest.mark.ea
+def test_real_valued_operators_reproducible():
+    """Test that the vectorized real-valued operators give the same results for the same seed."""
+    problem = dtlz2(n_objectives=3, n_variables=12)
+    population = pl.DataFrame(
+        np.random.default_rng(0).random((21, 12)), schema=[var.symbol for var in problem.variables]
+    )
+
+    def run(seed: int) -> list[pl.DataFrame]:
+        publisher = Publisher()
+        results = [
+            SimulatedBinaryCrossover(problem=problem, publisher=publisher, seed=seed, verbosity=1).do(
+                population=population
+            ),
+            LocalCrossover(problem=problem, publisher=publisher, seed=seed, verbosity=1, xover_probability=0.5).do(
+                population=population
+            ),
+        ]
+        mutations = [
+            BoundedPolynomialMutation(problem=problem, publisher=publisher, seed=seed, verbosity=1),
+            MPTMutation(problem=problem, publisher=publisher, seed=seed, verbosity=1, mutation_probability=0.5),
+            NonUniformMutation(
+                problem=problem,
+                publisher=publisher,
+                seed=seed,
+                verbosity=1,
+                max_generations=100,
+                mutation_probability=0.5,
+            ),
+            PowerMutation(problem=problem, publisher=publisher, seed=seed, verbosity=1, mutation_probability=0.5),
+        ]
+        results.extend(mutation.do(population, population) for mutation in mutations)
+        results.append(
+            SelfAdaptiveGaussianMutation(
+                problem=problem, publisher=publisher, seed=seed, verbosity=1, mutation_probability=0.5
+            ).do(population, population)[0]
+        )
+        return results
+
+    for first, second, other in zip(run(1), run(1), run(2), strict=True):
+        assert first.equals(second)
+        assert not first.equals(other)
+        values = first.to_numpy()
+        assert np.isfinite(values).all()
+
+
+@pytest.mark.ea
+def test_real_valued_operators_bounds_and_rates():
+    """Test that the vectorized operators respect the bounds and mutate the expected share of the genes."""
+    problem = dtlz2(n_objectives=3, n_variables=20)
+    publisher = Publisher()
+    population = pl.DataFrame(
+        np.random.default_rng(0).random((2000, 20)), schema=[var.symbol for var in problem.variables]
+    )
+    values = population.to_numpy()
+    lower_bounds = np.array([var.lowerbound for var in problem.variables])
+    upper_bounds = np.array([var.upperbound for var in problem.variables])
+    common = {"problem": problem, "publisher": publisher, "seed": 0, "verbosity": 1}
+
+    # SBX and self-adaptive Gaussian mutation may step out of the bounds, the templates repair their offspring
+    offspring = LocalCrossover(**common, xover_probability=0.5).do(population=population).to_numpy()
+    assert offspring.shape == values.shape
+    assert np.all((offspring >= lower_bounds) & (offspring <= upper_bounds))
+
+    mutation_probability = 0.2
+    bounded_mutations = [
+        MPTMutation(**common, mutation_probability=mutation_probability),
+        NonUniformMutation(**common, max_generations=100, mutation_probability=mutation_probability),
+        PowerMutation(**common, mutation_probability=mutation_probability),
+    ]
+    for mutation in bounded_mutations:
+        mutated = mutation.do(population, population).to_numpy()
+        assert np.all((mutated >= lower_bounds) & (mutated <= upper_bounds))
+        # 40k genes, so the share of mutated genes is within a few standard deviations (0.002) of the probability
+        assert np.mean(mutated != values) == pytest.approx(mutation_probability, abs=0.01)
+
+    mutated = (
+        SelfAdaptiveGaussianMutation(**common, mutation_probability=mutation_probability)
+        .do(population, population)[0]
+        .to_numpy()
+    )
+    assert np.mean(mutated != values) == pytest.approx(mutation_probability, abs=0.01)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "operator",
+    ["sbx", "local", "blend", "bex", "polynomial", "mpt", "non_uniform", "power", "self_adaptive_gaussian"],
+)
+def test_real_valued_operator_benchmark(operator):
+    """Benchmark the per generation cost of the real-valued operators with 10k individuals and 1k variables."""
+    problem = dtlz2(n_objectives=3, n_variables=1000)
+    publisher = Publisher()
+    population = pl.DataFrame(
+        np.random.default_rng(0).random((10_000, 1000)), schema=[var.symbol for var in problem.variables]
+    )
+    common = {"problem": problem, "publisher": publisher, "seed": 0, "verbosity": 1}
+    crossovers = {
+        "sbx": SimulatedBinaryCrossover,
+        "local": LocalCrossover,
+        "blend": BlendAlphaCrossover,
+        "bex": BoundedExponentialCrossover,
+    }
+    mutations = {
+        "polynomial": lambda: BoundedPolynomialMutation(**common),
+        "mpt": lambda: MPTMutation(**common),
+        "non_uniform": lambda: NonUniformMutation(**common, max_generations=100),
+        "power": lambda: PowerMutation(**common),
+        "self_adaptive_gaussian": lambda: SelfAdaptiveGaussianMutation(**common),
+    }
+
+    start = time.perf_counter()
+    if operator in crossovers:
+        crossovers[operator](**common).do(population=population)
+    else:
+        mutations[operator]().do(population, population)
+    elapsed = time.perf_counter() - start
+
+    print(f"{operator}: {elapsed:.3f} s per generation")
+
+
+@pytest.mark.ea
+def test_population():
+    """Test that populations share memory with their polars views and are subset and combined correctly."""
+    rng = np.random.default_rng(0)
+    solutions = pl.from_numpy(np.asfortranarray(rng.random((10, 3))), schema=["x_1", "x_2", "x_3"])
+    outputs = pl.from_numpy(np.asfortranarray(rng.random((10, 2))), schema=["f_1", "f_2"])
+
+    population = Population.from_polars(solutions, outputs)
+    assert len(population) == 10
+    assert np.shares_memory(population.variables, solutions.to_numpy(order="fortran"))
+    assert np.shares_memory(population.variables, population.solutions_view().to_numpy(order="fortran"))
+    assert np.shares_memory(population.outputs, population.output_columns(["f_2"]))
+    assert population.solutions_view().equals(solutions)
+    assert population.outputs_view().equals(outputs)
+    npt.assert_array_equal(population.output_columns(["f_2", "f_1"]), outputs.select(["f_2", "f_1"]).to_numpy())
+
+    subset = population.take([7, 2])
+    assert subset.solutions_view().equals(solutions[[7, 2]])
+    assert subset.outputs_view().equals(outputs[[7, 2]])
+    npt.assert_array_equal(subset.index, [7, 2])
+
+    combined = subset.concat(population)
+    assert len(combined) == 12
+    assert combined.solutions_view().equals(pl.concat([solutions[[7, 2]], solutions]))
+    assert combined.variables.flags.f_contiguous
+
+    unevaluated = Population.from_polars(solutions)
+    assert unevaluated.outputs_view() is None
+    with pytest.raises(ValueError):
+        unevaluated.concat(population)
+
+
+@pytest.mark.ea
+@pytest.mark.parametrize("selector_type", ["rvea", "nsga3"])
+def test_selection_do_population(selector_type):
+    """Test that selecting on populations selects the same individuals as selecting on dataframes."""
+    problem = dtlz2(n_objectives=3, n_variables=12)
+    evaluator = EMOEvaluator(problem=problem, publisher=Publisher(), verbosity=0)
+    rng = np.random.default_rng(0)
+
+    def make_selector() -> RVEASelector | NSGAIII_select:
+        # NSGA-III breaks ties in niching with the global random state
+        np.random.seed(0)  # noqa: NPY002
+        if selector_type == "rvea":
+            selector = RVEASelector(
+                problem=problem,
+                publisher=Publisher(),
+                reference_vector_options=ReferenceVectorOptions(number_of_vectors=20),
+                verbosity=0,
+            )
+            selector.numerator, selector.denominator = 1, 2
+            return selector
+        return NSGAIII_select(
+            problem=problem,
+            publisher=Publisher(),
+            reference_vector_options=ReferenceVectorOptions(number_of_vectors=20),
+            verbosity=0,
+        )
+
+    symbols = [var.symbol for var in problem.variables]
+    parents = pl.from_numpy(rng.random((30, 12)), schema=symbols)
+    offspring = pl.from_numpy(rng.random((30, 12)), schema=symbols)
+    parent_outputs = evaluator.evaluate(parents)
+    offspring_outputs = evaluator.evaluate(offspring)
+
+    solutions, outputs = make_selector().do(
+        parents=(parents, parent_outputs), offsprings=(offspring, offspring_outputs)
+    )
+    selected = make_selector().do_population(
+        parents=Population.from_polars(parents, parent_outputs),
+        offsprings=Population.from_polars(offspring, offspring_outputs),
+    )
+
+    assert selected.solutions_view().equals(solutions)
+    assert selected.outputs_view().equals(outputs)
+
+
+def _apd_select_reference(translated_targets, angles, assigned_vectors, gamma, partial_penalty_factor, constraints):
+    """Select with the APD one reference vector at a time, the way RVEA used to."""
+    selection = []
+    for i in range(len(gamma)):
+        sub_population_index = np.flatnonzero(assigned_vectors == i)
+        if len(sub_population_index) > 1 and constraints is not None:
+            violation_values = np.maximum(0, constraints[sub_population_index])
+            feasible_bool = (violation_values == 0).all(axis=1)
+            if not feasible_bool.any():
+                violation_values = violation_values.sum(axis=1)
+                sub_population_index = sub_population_index[violation_values == violation_values.min()]
+            else:
+                sub_population_index = sub_population_index[feasible_bool]
+        if len(sub_population_index) == 1:
+            selection.append(sub_population_index[0])
+        elif len(sub_population_index) > 1:
+            magnitude = np.sqrt(np.sum(np.power(translated_targets[sub_population_index], 2), axis=1))
+            apd = magnitude * (1 + partial_penalty_factor * (angles[sub_population_index] / gamma[i]))
+            if np.isnan(apd).all():
+                continue
+            selection.append(sub_population_index[np.flatnonzero(apd == np.nanmin(apd))[0]])
+    return np.array(selection, dtype=int)
+
+
+@pytest.mark.ea
+@pytest.mark.parametrize("with_constraints", [False, True])
+def test_apd_select(with_constraints):
+    """Test that the grouped APD selection matches selecting one reference vector at a time."""
+    rng = np.random.default_rng(0)
+    for n_points, n_vectors in [(1, 1), (10, 30), (200, 50), (1000, 40)]:
+        translated_targets = rng.random((n_points, 3))
+        # Ties and NaNs in the APD
+        translated_targets[::7] = translated_targets[0]
+        translated_targets[3::11] = np.nan
+        angles = rng.random(n_points)
+        angles[::7] = angles[0]
+        assigned_vectors = rng.integers(0, n_vectors, size=n_points)
+        gamma = rng.random(n_vectors) + 0.1
+        constraints = None
+        if with_constraints:
+            constraints = rng.normal(size=(n_points, 2))
+            constraints[::5] = np.round(constraints[::5])
+
+        npt.assert_array_equal(
+            _apd_select(translated_targets, angles, assigned_vectors, gamma, 0.5, constraints),
+            _apd_select_reference(translated_targets, angles, assigned_vectors, gamma, 0.5, constraints),
+        )
+
+
+@pytest.mark.performance
+def test_apd_select_benchmark():
+    """Benchmark the grouped APD selection against selecting one reference vector at a time."""
+    rng = np.random.default_rng(0)
+    n_points, n_vectors = 10_000, 5_000
+    args = (
+        rng.random((n_points, 5)),
+        rng.random(n_points),
+        rng.integers(0, n_vectors, size=n_points),
+        rng.random(n_vectors) + 0.1,
+        0.5,
+        rng.normal(size=(n_points, 3)),
+    )
+
+    start = time.perf_counter()
+    selection = _apd_select(*args)
+    grouped_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = _apd_select_reference(*args)
+    reference_time = time.perf_counter() - start
+
+    npt.assert_array_equal(selection, reference)
+    print(f"Grouped APD selection: {grouped_time:.4f}s, per reference vector: {reference_time:.4f}s")
+    assert grouped_time < reference_time
+
+
+@pytest.mark.ea
+def test_reference_vector_geometry():
+    """Test that the cached geometry matches the pairwise angles and is only recomputed when the scaling changes."""
+    rng = np.random.default_rng(0)
+    vectors = rng.random((300, 4))
+    vectors[1] = vectors[0] * 2  # parallel vectors are not each other's neighbours
+
+    def brute_force_gamma(adapted):
+        angles = np.arccos(np.clip(adapted @ adapted.T, -1, 1))
+        np.fill_diagonal(angles, np.inf)
+        angles[np.isclose(angles, 0, atol=1e-7)] = np.inf
+        return angles.min(axis=1)
+
+    geometry = ReferenceVectorGeometry(vectors)
+    npt.assert_allclose(np.linalg.norm(geometry.adapted_vectors, axis=1), 1)
+    npt.assert_allclose(geometry.gamma, brute_force_gamma(geometry.adapted_vectors), atol=1e-7)
+    assert geometry.version == 0
+
+    scale = np.array([1.0, 2.0, 3.0, 4.0])
+    assert geometry.adapt(scale)
+    assert not geometry.adapt(scale.copy())
+    assert geometry.version == 1
+    npt.assert_allclose(geometry.adapted_vectors[2], vectors[2] * scale / np.linalg.norm(vectors[2] * scale))
+    npt.assert_allclose(geometry.gamma, brute_force_gamma(geometry.adapted_vectors), atol=1e-7)
+    with pytest.raises(ValueError):
+        geometry.gamma[0] = 0
+
+    assert geometry.adapt(None)
+    assert geometry.version == 2
+    assert np.isinf(ReferenceVectorGeometry(np.ones((3, 2))).gamma).all()
+
+
+@pytest.mark.ea
+def test_rvea_adapt_keeps_reference_vectors():
+    """Test that adapting the reference vectors in RVEA does not modify the reference vectors themselves."""
+    problem = dtlz2(n_objectives=3, n_variables=12)
+    selector = RVEASelector(
+        problem=problem,
+        publisher=Publisher(),
+        reference_vector_options=ReferenceVectorOptions(number_of_vectors=20),
+        verbosity=0,
+    )
+    original = selector.reference_vectors.copy()
+    selector.ideal = np.zeros(3)
+    selector.nadir = np.array([1.0, 2.0, 3.0])
+
+    selector._adapt()
+    selector._adapt()
+    npt.assert_array_equal(selector.reference_vectors, original)
+    assert selector.reference_vector_geometry.version == 1
+    adapted = original * selector.nadir
+    npt.assert_allclose(selector.adapted_reference_vectors, adapted / np.linalg.norm(adapted, axis=1)[:, None])
+
+    selector.reference_vectors = original[:10]
+    selector._adapt()
+    assert len(selector.reference_vectors_gamma) == 10
+
+
+@pytest.mark.ea
+def test_riesz_s_energy_vectors(tmp_path):
+    """Test that the s-energy vectors are well spread on the simplex and cached on disk."""
+    points = riesz_s_energy_vectors(num_dims=3, num_vectors=50, seed=1, cache_dir=tmp_path)
+
+    assert points.shape == (50, 3)
+    npt.assert_allclose(points.sum(axis=1), 1)
+    assert (points >= 0).all()
+    npt.assert_array_equal(points[:3], np.eye(3))
+
+    def min_spacing(x):
+        return np.min([np.linalg.norm(np.delete(x, i, axis=0) - x[i], axis=1).min() for i in range(len(x))])
+
+    random_points = np.random.default_rng(1).dirichlet(np.ones(3), size=50)
+    assert min_spacing(points) > 5 * min_spacing(random_points)
+
+    # The second call reads the points from the disk
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    _s_energy_cache.clear()
+    npt.assert_array_equal(riesz_s_energy_vectors(num_dims=3, num_vectors=50, seed=1, cache_dir=tmp_path), points)
+    assert not (riesz_s_energy_vectors(num_dims=3, num_vectors=50, seed=2, cache_dir=None) == points).all()
+
+
+@pytest.mark.ea
+def test_s_energy_cache_unavailable(tmp_path, monkeypatch):
+    """Test that the s-energy vectors are created when they cannot be cached on disk."""
+    _s_energy_cache.clear()
+    # The cache directory cannot be created, as its parent is a file
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    points = riesz_s_energy_vectors(num_dims=3, num_vectors=20, cache_dir=blocker / "cache")
+    assert points.shape == (20, 3)
+    assert blocker.is_file()
+
+    # No home directory to cache the vectors in
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("DESDEO_CACHE_DIR", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    assert s_energy_cache_dir() is None
+    _s_energy_cache.clear()
+    npt.assert_array_equal(riesz_s_energy_vectors(num_dims=3, num_vectors=20), points)
+
+
+@pytest.mark.ea
+def test_s_energy_reference_vectors(tmp_path, monkeypatch):
+    """Test that decomposition selectors can use an arbitrary number of s-energy reference vectors."""
+    monkeypatch.setenv("DESDEO_CACHE_DIR", str(tmp_path))
+    problem = dtlz2(n_objectives=3, n_variables=12)
+    selector = NSGAIII_select(
+        problem=problem,
+        publisher=Publisher(),
+        reference_vector_options=ReferenceVectorOptions(
+            creation_type="s_energy", vector_type="planar", number_of_vectors=37
+        ),
+        verbosity=0,
+    )
+    assert selector.reference_vectors.shape == (37, 3)
+    assert selector.n_survive == 37
+    npt.assert_allclose(selector.reference_vectors.sum(axis=1), 1)
+    assert len(list((tmp_path / "reference_vectors").glob("*.npy"))) == 1
+
+
+@pytest.mark.ea
+def test_ibea_select_all():
+    """Test that the incremental IBEA selection removes the same individuals as recomputing the fitness each time."""
+    rng = np.random.default_rng(0)
+    fitness_components = self_epsilon(rng.random((60, 3)))
+    kappa = 0.05 * np.abs(fitness_components).max()
+
+    def fitness_reference(components):
+        return np.array(
+            [
+                -sum(np.exp(-components[j, i] / kappa) for j in range(len(components)) if j != i)
+                for i in range(len(components))
+            ]
+        )
+
+    npt.assert_allclose(_ibea_fitness(fitness_components, kappa), fitness_reference(fitness_components))
+
+    remaining = list(range(60))
+    while len(remaining) > 25:
+        fitness = fitness_reference(fitness_components[np.ix_(remaining, remaining)])
+        remaining.pop(int(np.argmin(fitness)))
+
+    npt.assert_array_equal(np.flatnonzero(_ibea_select_all(fitness_components, 25, kappa)), remaining)
+    assert _ibea_select_all(self_epsilon(rng.random((100, 3)).astype(np.float32)), 50, kappa).sum() == 50
+
+
+@pytest.mark.performance
+def test_ibea_selection_benchmark():
+    """Benchmark the IBEA selection with a population of 5000 individuals."""
+    problem = dtlz2(n_objectives=3, n_variables=12)
+    evaluator = EMOEvaluator(problem=problem, publisher=Publisher(), verbosity=0)
+    selector = IBEA_Selector(
+        problem=problem, publisher=Publisher(), population_size=5000, verbosity=0, indicator_dtype=np.float32
+    )
+    rng = np.random.default_rng(0)
+    symbols = [var.symbol for var in problem.variables]
+    parents = pl.from_numpy(rng.random((5000, 12)), schema=symbols)
+    offspring = pl.from_numpy(rng.random((5000, 12)), schema=symbols)
+
+    start = time.perf_counter()
+    solutions, _ = selector.do(
+        parents=(parents, evaluator.evaluate(parents)), offsprings=(offspring, evaluator.evaluate(offspring))
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"IBEA selection of 5000 from 10000 individuals: {elapsed:.2f}s")
+    assert len(solutions) == 5000
+
+
+@pytest.mark.ea
+@pytest.mark.parametrize("n_objectives", [3, 4])
+def test_hypervolume_selector(n_objectives):
+    """Test that the hypervolume selector converges in an EA and keeps the best hypervolume contributors."""
+    problem = dtlz2(n_objectives=n_objectives, n_variables=12)
+    publisher = Publisher()
+
+    evaluator = EMOEvaluator(problem=problem, publisher=publisher, verbosity=0)
+    generator = LHSGenerator(
+        problem=problem, evaluator=evaluator, publisher=publisher, n_points=20, seed=0, verbosity=0
+    )
+    crossover = SimulatedBinaryCrossover(problem=problem, publisher=publisher, seed=0, verbosity=0)
+    mutation = BoundedPolynomialMutation(problem=problem, publisher=publisher, seed=0, verbosity=0)
+    selector = HypervolumeSelector(
+        problem=problem, publisher=publisher, population_size=20, n_samples=20_000, verbosity=1
+    )
+    terminator = MaxGenerationsTerminator(max_generations=100, publisher=publisher)
+
+    components: list[Subscriber] = [evaluator, generator, crossover, mutation, selector, terminator]
+    [publisher.auto_subscribe(component) for component in components]
+    [
+        publisher.register_topics(
+            topics=component.provided_topics[component.verbosity], source=component.__class__.__name__
+        )
+        for component in components
+    ]
+
+    results = template1(
+        evaluator=evaluator,
+        crossover=crossover,
+        mutation=mutation,
+        generator=generator,
+        selection=selector,
+        terminator=terminator,
+    )
+
+    assert len(results.solutions) == 20
+    objectives = results.outputs[[f"f_{i + 1}" for i in range(n_objectives)]].to_numpy()
+    assert np.median(np.linalg.norm(objectives, axis=1)) < 1.5
+    assert len(selector.selection) == 20
@@ -4,22 +4,29 @@ from itertools import product
 from math import factorial
 
 import numpy as np
+import numpy.testing as npt
+import polars as pl
 import pytest
 from pymoo.indicators.igd_plus import IGDPlus
 from pymoo.util.ref_dirs import get_reference_directions
 from scipy.special import gamma
 
 from desdeo.tools.indicators_unary import (
+    HypervolumeContributions,
     distance_indicators,
     hv,
     hv_batch,
     igd_plus_batch,
     igd_plus_indicator,
+    indicators_batch,
     r2_batch,
+    r2_indicator,
+    r_metric_indicator,
     r_metric_indicators_batch,
+    tchebycheff_utility,
 )
 
-from desdeo.tools.indicators_binary import epsilon_component, epsilon_indicator
+from desdeo.tools.indicators_binary import epsilon_component, epsilon_indicator, hv_component, self_epsilon, self_hv
 
 
 @pytest.mark.indicators
@@ -220,3 +227,143 @@ def test_epsilon_indicator():
     assert np.isclose(
         ei1, ei2
     ), f"Epsilon indicator results do not match: {ei1} vs {ei2} between our and moocore implementations"
+
+
+@pytest.mark.indicators
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_self_binary_indicators(dtype):
+    """Test that the pairwise indicator matrices match the pairwise components."""
+    rng = np.random.default_rng(0)
+    solution_set = rng.random((70, 3))
+    solution_set[5] = solution_set[6]
+    solution_set[7] = solution_set[8] / 2
+
+    eps_matrix = self_epsilon(solution_set.astype(dtype), block_size=16)
+    hv_matrix = self_hv(solution_set.astype(dtype), block_size=16)
+    assert eps_matrix.dtype == dtype
+    assert hv_matrix.dtype == dtype
+
+    tolerance = 1e-12 if dtype == np.float64 else 1e-5
+    npt.assert_allclose(
+        eps_matrix,
+        [[epsilon_component(s1, s2) for s2 in solution_set] for s1 in solution_set],
+        atol=tolerance,
+    )
+    npt.assert_allclose(
+        hv_matrix,
+        [[hv_component(s1, s2) for s2 in solution_set] for s1 in solution_set],
+        atol=tolerance,
+    )
+
+
+@pytest.mark.indicators
+def test_chunked_indicators():
+    """Test that the chunked distance based indicators and the vectorized R2 match the pairwise definitions."""
+    rng = np.random.default_rng(0)
+    solution_set = rng.random((120, 3))
+    reference_set = rng.random((90, 3))
+    lambda_set = rng.dirichlet(np.ones(3), size=40)
+    z_star = np.zeros(3)
+
+    # A budget of one kilobyte forces many chunks
+    chunked = distance_indicators(solution_set, reference_set, memory_budget=1024)
+    full = distance_indicators(solution_set, reference_set, memory_budget=2**30)
+    assert chunked == full
+
+    distances = np.array([[np.sum(np.maximum(0, y_n - y_p) ** 2) for y_n in solution_set] for y_p in reference_set])
+    assert np.isclose(
+        igd_plus_indicator(solution_set, reference_set, memory_budget=1024).igd_plus,
+        np.mean(np.sqrt(distances.min(axis=1))),
+    )
+
+    r2_reference = np.mean(
+        [max(tchebycheff_utility(fx, lambd, z_star) for fx in solution_set) for lambd in lambda_set]
+    )
+    assert np.isclose(r2_indicator(solution_set, lambda_set, z_star, memory_budget=1024).r2_value, r2_reference)
+
+
+@pytest.mark.indicators
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_indicators_batch(n_workers):
+    """Test that the batch engine gives the same values as the individual indicators."""
+    ref_set = get_reference_directions("energy", 3, n_points=100)
+    solution_sets = {"subset1": ref_set[0:30], "subset2": ref_set[30:80]}
+    lambda_set = get_reference_directions("energy", 3, n_points=20)
+    z_star = np.zeros(3)
+    r_metric_ref_points = np.array([[0.2, 0.3, 0.5]])
+
+    results = indicators_batch(
+        solution_sets,
+        reference_points_component=[1.5, 2.0],
+        reference_set=ref_set,
+        lambda_set=lambda_set,
+        z_star=z_star,
+        r_metric_ref_points=r_metric_ref_points,
+        n_workers=n_workers,
+    )
+
+    assert results.columns == ["set_name", "indicator", "reference_point_component", "value"]
+    # Two hypervolumes, five distance based indicators, IGD+, R2, and two R-metrics for each set
+    assert len(results) == 2 * 11
+
+    def value(set_name, indicator, rp=None):
+        rows = results.filter((pl.col("set_name") == set_name) & (pl.col("indicator") == indicator))
+        if rp is not None:
+            rows = rows.filter(pl.col("reference_point_component") == rp)
+        return rows["value"].item()
+
+    for set_name, solution_set in solution_sets.items():
+        assert value(set_name, "hv", 1.5) == hv(solution_set, 1.5)
+        assert value(set_name, "hv", 2.0) == hv(solution_set, 2.0)
+        assert value(set_name, "igd") == distance_indicators(solution_set, ref_set).igd
+        assert value(set_name, "igd_plus") == igd_plus_indicator(solution_set, ref_set).igd_plus
+        assert value(set_name, "r2") == r2_indicator(solution_set, lambda_set, z_star).r2_value
+        assert value(set_name, "r_hv") == r_metric_indicator(solution_set, r_metric_ref_points).r_hv
+
+
+def _brute_force_contributions(points: np.ndarray, ref: float) -> np.ndarray:
+    """The exclusive contribution of each point as the difference of two hypervolumes."""
+    total = hv(points, ref)
+    return np.array([total - hv(np.delete(points, i, axis=0), ref) for i in range(len(points))])
+
+
+@pytest.mark.indicators
+@pytest.mark.parametrize("n_objectives", [2, 3])
+def test_hypervolume_contributions_exact(n_objectives):
+    """Test that the exact contributions stay correct as points are added and removed."""
+    points = get_reference_directions("energy", n_objectives, n_points=30, seed=1)
+    contributions = HypervolumeContributions(points[:20], reference_point=1.1)
+    assert contributions.exact
+    npt.assert_allclose(contributions.contributions, _brute_force_contributions(points[:20], 1.1), atol=1e-12)
+
+    new_ids = contributions.add(points[20:])
+    npt.assert_array_equal(new_ids, np.arange(20, 30))
+    for _ in range(10):
+        least = contributions.least_contributor()
+        assert contributions.contributions.min() == contributions.contributions[contributions.ids == least][0]
+        contributions.remove(least)
+    npt.assert_allclose(
+        contributions.contributions, _brute_force_contributions(points[contributions.ids], 1.1), atol=1e-12
+    )
+    with pytest.raises(ValueError):
+        contributions.remove(least)
+
+
+@pytest.mark.indicators
+def test_hypervolume_contributions_monte_carlo():
+    """Test that the approximated contributions stay close to the exact ones as points are removed."""
+    points = get_reference_directions("energy", 4, n_points=12, seed=1)
+    contributions = HypervolumeContributions(points, reference_point=1.1, n_samples=400_000, seed=0)
+    assert not contributions.exact
+
+    def assert_close():
+        exact = _brute_force_contributions(points[contributions.ids], 1.1)
+        assert np.abs(contributions.contributions - exact).sum() < 0.05 * exact.sum()
+
+    assert_close()
+    contributions.remove([0, 5])
+    assert_close()
+    # A point below the sampled box makes the samples to be drawn again
+    points = np.vstack((points, [0.05, 0.05, 0.05, 0.8]))
+    contributions.add(points[-1])
+    assert_close()
@@ -6,13 +6,23 @@ import pytest
 from fixtures import dtlz2_5x_3f_data_based  # noqa: F401
 
 from desdeo.mcdm.nautilus_navigator import (
+    NavigatorSession,
     calculate_distance_to_front,
     calculate_navigation_point,
     solve_reachable_bounds,
     solve_reachable_solution,
 )
-from desdeo.problem import objective_dict_to_numpy_array
+from desdeo.problem import (
+    Constraint,
+    ConstraintTypeEnum,
+    Objective,
+    Problem,
+    Variable,
+    get_nadir_dict,
+    objective_dict_to_numpy_array,
+)
 from desdeo.problem.testproblems import binh_and_korn, river_pollution_problem
+from desdeo.tools import GurobipySolver, PyomoGurobiSolver
 
 
 @pytest.mark.nautilus_navigator
@@ -247,3 +257,62 @@ def test_solve_reachable_bounds_complicated():
     # check than bounds make sense
     for symbol in [objective.symbol for objective in problem.objectives]:
         assert upper_bounds[symbol] > lower_bounds[symbol]
+
+
+@pytest.mark.nautilus_navigator
+@pytest.mark.parametrize("solver", [GurobipySolver, PyomoGurobiSolver])
+def test_navigator_session(solver):
+    """Test that a navigation session computes the same reachable bounds as solving them from scratch."""
+    problem = Problem(
+        name="Linear test problem",
+        description="A linear problem with both min and max objectives.",
+        variables=[
+            Variable(name=f"x_{i}", symbol=f"x_{i}", variable_type="real", lowerbound=0, upperbound=1)
+            for i in range(1, 4)
+        ],
+        objectives=[
+            Objective(name="f_1", symbol="f_1", func="x_1 + 2*x_2", is_linear=True, ideal=0, nadir=2),
+            Objective(name="f_2", symbol="f_2", func="x_1 + x_3", maximize=True, is_linear=True, ideal=2, nadir=0),
+            Objective(name="f_3", symbol="f_3", func="3*x_3 - x_2", is_linear=True, ideal=-1, nadir=3),
+        ],
+        constraints=[
+            Constraint(
+                name="g_1", symbol="g_1", cons_type=ConstraintTypeEnum.LTE, func="x_1 + x_2 + x_3 - 1.5", is_linear=True
+            )
+        ],
+    )
+
+    session = NavigatorSession(problem, solver=solver)
+    assert session.is_persistent
+    model = session.solver.evaluator.model
+
+    nadir = get_nadir_dict(problem)
+    ideal = {objective.symbol: objective.ideal for objective in problem.objectives}
+    user_bounds = {symbol: nadir[symbol] + 0.1 * (ideal[symbol] - nadir[symbol]) for symbol in nadir}
+
+    for step in [0.0, 0.3, 0.6]:
+        nav_point = {symbol: nadir[symbol] + step * (ideal[symbol] - nadir[symbol]) for symbol in nadir}
+
+        for bounds in [None, user_bounds]:
+            expected_lower, expected_upper = solve_reachable_bounds(problem, nav_point, bounds=bounds, solver=solver)
+            lower_bounds, upper_bounds = session.solve_reachable_bounds(nav_point, bounds=bounds)
+
+            for symbol in nadir:
+                npt.assert_allclose(lower_bounds[symbol], expected_lower[symbol], atol=1e-6)
+                npt.assert_allclose(upper_bounds[symbol], expected_upper[symbol], atol=1e-6)
+
+    # the model is built once and updated in place
+    assert session.solver.evaluator.model is model
+
+
+@pytest.mark.nautilus_navigator
+def test_navigator_session_discrete(dtlz2_5x_3f_data_based):  # noqa: F811
+    """Test that a navigation session falls back to solve_reachable_bounds with solvers without a model."""
+    problem = dtlz2_5x_3f_data_based
+
+    session = NavigatorSession(problem)
+    assert not session.is_persistent
+
+    nav_point = {"f1": 0.65, "f2": 0.85, "f3": 0.75}
+
+    assert session.solve_reachable_bounds(nav_point) == solve_reachable_bounds(problem, nav_point)
@@ -42,3 +42,22 @@ def test_ngopt_solver():
         res = solver.solve(target)
 
         assert res.success
+
+
+@pytest.mark.nevergrad
+def test_ngopt_solver_failure():
+    """Tests that a failed optimization is reported as unsuccessful instead of raising an error."""
+    problem_w_sf, target = add_asf_nondiff(zdt1(5), "target", {"f_1": 0.8, "f_2": 0.8}, reference_in_aug=True)
+    solver = NevergradGenericSolver(problem_w_sf, options=NevergradGenericOptions(budget=10, num_workers=2))
+
+    def failing_evaluate_batch(*_, **__):
+        msg = "The evaluation failed."
+        raise RuntimeError(msg)
+
+    solver.evaluator.evaluate_batch = failing_evaluate_batch
+
+    res = solver.solve(target)
+
+    assert not res.success
+    assert "The evaluation failed." in res.message
+    assert set(res.optimal_variables) == {var.symbol for var in problem_w_sf.variables}
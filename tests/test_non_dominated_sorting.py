@@ -0,0 +1,102 @@
+"""Tests for the non-dominated sorting functions in desdeo.tools.non_dominated_sorting."""
+
+import time
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from desdeo.tools.non_dominated_sorting import (
+    NonDominatedIndex,
+    dominates,
+    fast_non_dominated_sort,
+    fast_non_dominated_sort_indices,
+    non_dominated_ranks,
+)
+
+
+def _reference_ranks(data: np.ndarray) -> np.ndarray:
+    """Rank the solutions by peeling off the non-dominated solutions one front at a time."""
+    ranks = np.full(len(data), -1)
+    rank = 0
+    while (ranks == -1).any():
+        remaining = np.flatnonzero(ranks == -1)
+        front = [i for i in remaining if not any(dominates(data[j], data[i]) for j in remaining)]
+        ranks[front] = rank
+        rank += 1
+    return ranks
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize("num_objectives", [1, 2, 3, 5])
+@pytest.mark.parametrize("integer", [False, True])
+def test_non_dominated_ranks(num_objectives, integer):
+    """Test that the ranks match a brute force sort, also with ties and duplicate solutions."""
+    rng = np.random.default_rng(num_objectives)
+    data = rng.integers(0, 5, (200, num_objectives)) if integer else rng.random((200, num_objectives))
+    data = data.astype(float)
+
+    ranks = non_dominated_ranks(data)
+
+    npt.assert_array_equal(ranks, _reference_ranks(data))
+
+    fronts = fast_non_dominated_sort(data)
+    assert fronts.shape == (ranks.max() + 1, len(data))
+    npt.assert_array_equal(fronts.argmax(axis=0), ranks)
+    assert fronts.sum() == len(data)
+
+    indices = fast_non_dominated_sort_indices(data)
+    assert len(indices) == len(fronts)
+    for front_id, front in enumerate(indices):
+        npt.assert_array_equal(front, np.flatnonzero(fronts[front_id]))
+
+
+@pytest.mark.utils
+def test_non_dominated_ranks_edge_cases():
+    """Test chains of dominated solutions and empty populations."""
+    chain = np.repeat(np.arange(10, dtype=float)[:, None], 3, axis=1)[::-1]
+    npt.assert_array_equal(non_dominated_ranks(chain), np.arange(10)[::-1])
+    assert len(fast_non_dominated_sort(chain)) == 10
+
+    assert len(non_dominated_ranks(np.zeros((0, 3)))) == 0
+    assert fast_non_dominated_sort_indices(np.zeros((0, 3))) == []
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize("num_objectives", [2, 3, 5])
+def test_non_dominated_index(num_objectives):
+    """Test that the index keeps exactly the non-dominated points of everything inserted to it."""
+    rng = np.random.default_rng(num_objectives)
+    # A small rebuild threshold exercises both the tree and the linear scan of the recent points
+    index = NonDominatedIndex(num_objectives, leaf_size=4, rebuild_threshold=32)
+    inserted = []
+    for _ in range(30):
+        batch = rng.integers(0, 10, (40, num_objectives)).astype(float)
+        slots = index.insert(batch)
+        inserted.append(batch[slots != -1])
+
+        all_points = np.vstack(inserted)
+        expected = all_points[non_dominated_ranks(all_points) == 0]
+        npt.assert_array_equal(index.points, expected)
+        assert len(index) == len(expected)
+
+    old_ids = index.ids
+    points = index.points
+    npt.assert_array_equal(index.compact(), old_ids)
+    npt.assert_array_equal(index.ids, np.arange(len(points)))
+    npt.assert_array_equal(index.points, points)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("num_objectives", [2, 3, 5])
+@pytest.mark.parametrize("num_solutions", [1_000, 10_000, 100_000, 200_000])
+def test_non_dominated_sorting_benchmark(num_objectives, num_solutions):
+    """Benchmark the non-dominated sorting on random populations."""
+    data = np.random.default_rng(0).random((num_solutions, num_objectives))
+    non_dominated_ranks(data[:10])  # compile
+
+    start = time.perf_counter()
+    ranks = non_dominated_ranks(data)
+    elapsed = time.perf_counter() - start
+
+    print(f"{num_objectives} objectives, {num_solutions} solutions: {ranks.max() + 1} fronts in {elapsed:.3f} s")
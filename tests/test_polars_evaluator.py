@@ -1,24 +1,60 @@
 """Tests for the Polars evaluator."""
 
+import time
+
+import numpy as np
 import numpy.testing as npt
 import polars as pl
 import pytest
 
 from desdeo.problem import (
+    CachedEvaluator,
+    MemoryCacheBackend,
     Objective,
     ObjectiveTypeEnum,
+    PolarsCompilationEnum,
     PolarsEvaluator,
     Problem,
+    SQLiteCacheBackend,
     TensorVariable,
     Variable,
     VariableTypeEnum,
 )
 from desdeo.problem.evaluator import find_closest_points
 from desdeo.problem.testproblems import (
+    dtlz2,
+    forest_problem,
+    mixed_variable_dimensions_problem,
+    re22,
     river_pollution_problem,
     simple_knapsack_vectors,
     simple_test_problem,
+    zdt1,
+    zdt2,
 )
+from desdeo.tools import add_asf_nondiff, scalarization_parameters
+
+
+def _random_population(problem: Problem, n_points: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Sample random decision variable values within the bounds of the variables of a problem."""
+    rng = np.random.default_rng(seed)
+    xs = {}
+
+    for var in problem.variables:
+        if isinstance(var, TensorVariable):
+            lower = np.broadcast_to(np.array(var.get_lowerbound_values(), dtype=float), var.shape)
+            upper = np.broadcast_to(np.array(var.get_upperbound_values(), dtype=float), var.shape)
+            size = (n_points, *var.shape)
+        else:
+            lower, upper = var.lowerbound, var.upperbound
+            size = n_points
+
+        if var.variable_type in [VariableTypeEnum.binary, VariableTypeEnum.integer]:
+            xs[var.symbol] = rng.integers(lower, upper, endpoint=True, size=size).astype(float)
+        else:
+            xs[var.symbol] = rng.uniform(lower, upper, size=size)
+
+    return xs
 
 
 def test_generic_with_river():
@@ -245,3 +281,143 @@ def test_evaluate_w_flattened():
     # check correct objective function values
     npt.assert_allclose(res_flat["f_1"].to_numpy(), [-1.6, -1.1])
     npt.assert_allclose(res_flat["f_2"].to_numpy(), [-16, -3.8])
+
+
+@pytest.mark.polars
+@pytest.mark.parametrize(
+    "problem",
+    [
+        zdt1(30),
+        zdt2(10),
+        dtlz2(10, 3),
+        re22(),
+        river_pollution_problem(),
+        simple_knapsack_vectors(),
+        mixed_variable_dimensions_problem(),
+    ],
+)
+def test_native_compilation_matches_reduce(problem):
+    """Test that natively compiled polars expressions evaluate to the same values as the reduce based ones."""
+    xs = _random_population(problem, 50)
+
+    native_res = PolarsEvaluator(problem, polars_compilation=PolarsCompilationEnum.native).evaluate(xs)
+    reduce_res = PolarsEvaluator(problem, polars_compilation=PolarsCompilationEnum.reduce).evaluate(xs)
+
+    assert native_res.columns == reduce_res.columns
+
+    for column in reduce_res.columns:
+        npt.assert_allclose(
+            np.array(native_res[column].to_list(), dtype=float),
+            np.array(reduce_res[column].to_list(), dtype=float),
+            err_msg=f"Failed for column {column}",
+        )
+
+
+@pytest.mark.polars
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cached_evaluator(tmp_path, backend):
+    """Test that only the decision variables whose results are not cached are evaluated."""
+    problem = river_pollution_problem()
+    evaluator = PolarsEvaluator(problem)
+
+    def make_backend():
+        return MemoryCacheBackend() if backend == "memory" else SQLiteCacheBackend(tmp_path / "cache.sqlite")
+
+    cache_backend = make_backend()
+    cached = CachedEvaluator(evaluator, cache_backend)
+
+    xs = _random_population(problem, 20)
+    assert cached.evaluate(xs).equals(evaluator.evaluate(xs))
+    assert (cached.hits, cached.misses) == (0, 20)
+
+    # reordered rows, rows differing below the rounding, new rows, and a repeated new row
+    new = _random_population(problem, 5, seed=1)
+    batch = {
+        key: np.concatenate([xs[key][::-1], xs[key][:3] + 1e-14, new[key], new[key][:1]]) for key in xs
+    }
+    res = cached.evaluate(batch)
+    expected = evaluator.evaluate(batch)
+    assert res.columns == expected.columns
+    npt.assert_allclose(res.to_numpy(), expected.to_numpy(), rtol=1e-12)
+    assert (cached.hits, cached.misses) == (23, 26)
+    assert len(cache_backend) == 25
+
+    # the attributes of the wrapped evaluator are accessible
+    assert cached.problem is problem
+
+    # the results are not shared between different problems
+    other = CachedEvaluator(PolarsEvaluator(problem.model_copy(update={"name": "other"})), cache_backend)
+    other.evaluate(xs)
+    assert (other.hits, other.misses) == (0, 20)
+
+    if backend == "sqlite":
+        # the results are persisted on disk
+        cache_backend.close()
+        cached = CachedEvaluator(evaluator, make_backend())
+        assert cached.evaluate(xs).equals(evaluator.evaluate(xs))
+        assert (cached.hits, cached.misses) == (20, 0)
+
+
+@pytest.mark.polars
+def test_cached_evaluator_update_constants():
+    """Test that the cached results are not reused after the constants of the problem are updated."""
+    problem, target = add_asf_nondiff(zdt1(5), "target", {"f_1": 0.5, "f_2": 0.5}, parametric=True)
+    evaluator = PolarsEvaluator(problem)
+    cached = CachedEvaluator(evaluator)
+
+    xs = _random_population(problem, 10)
+    before = cached.evaluate(xs)[target]
+
+    cached.update_constants(scalarization_parameters(target, "rp", {"f_1": 0.0, "f_2": 0.0}))
+    after = cached.evaluate(xs)[target]
+
+    npt.assert_allclose(after.to_numpy(), evaluator.evaluate(xs)[target].to_numpy())
+    assert not np.allclose(after.to_numpy(), before.to_numpy())
+    assert (cached.hits, cached.misses) == (0, 20)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("n_points", [100, 10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize(
+    "problem_fn",
+    [
+        lambda: zdt1(30),
+        lambda: dtlz2(10, 3),
+        lambda: river_pollution_problem(),
+        lambda: forest_problem(
+            simulation_results="./tests/data/alternatives_290124.csv",
+            treatment_key="./tests/data/alternatives_key_290124.csv",
+            holding=1,
+        ),
+    ],
+    ids=["zdt1", "dtlz2", "river_pollution", "forest"],
+)
+def test_polars_compilation_benchmark(problem_fn, n_points):
+    """Benchmark the native and reduce compilation modes of the polars evaluator."""
+    problem = problem_fn()
+    if problem.constants is not None and n_points > 100_000:
+        # the reduce mode copies each TensorConstant on every row, which does not fit in memory
+        pytest.skip("Too many points for the reduce mode with TensorConstants.")
+
+    xs = _random_population(problem, n_points)
+
+    times = {}
+    results = {}
+    for mode in PolarsCompilationEnum:
+        evaluator = PolarsEvaluator(problem, polars_compilation=mode)
+
+        start = time.perf_counter()
+        results[mode] = evaluator.evaluate(xs)
+        times[mode] = time.perf_counter() - start
+
+    print(
+        f"\n{problem.name} with {n_points} points: "
+        + ", ".join(f"{mode.value} {elapsed:.4f} s" for mode, elapsed in times.items())
+        + f" (speedup x{times[PolarsCompilationEnum.reduce] / times[PolarsCompilationEnum.native]:.1f})"
+    )
+
+    for obj in problem.objectives:
+        npt.assert_allclose(
+            results[PolarsCompilationEnum.native][obj.symbol].to_numpy(),
+            results[PolarsCompilationEnum.reduce][obj.symbol].to_numpy(),
+        )
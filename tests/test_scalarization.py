@@ -2,9 +2,18 @@
 
 import numpy as np
 import numpy.testing as npt
+import polars as pl
 import pytest
 
-from desdeo.problem import ConstraintTypeEnum, Evaluator
+from desdeo.problem import (
+    Constraint,
+    ConstraintTypeEnum,
+    Evaluator,
+    Objective,
+    PolarsEvaluator,
+    Problem,
+    Variable,
+)
 from desdeo.problem.testproblems import (
     dtlz2,
     momip_ti7,
@@ -13,9 +22,11 @@ from desdeo.problem.testproblems import (
 )
 from desdeo.tools import (
     BonminOptions,
+    GurobipySolver,
     NevergradGenericOptions,
     NevergradGenericSolver,
     PyomoBonminSolver,
+    PyomoGurobiSolver,
     ScipyMinimizeSolver,
 )
 from desdeo.tools.scalarization import (
@@ -43,6 +54,7 @@ from desdeo.tools.scalarization import (
     add_stom_sf_nondiff,
     add_weighted_sums,
     add_desirability_funcs,
+    scalarization_parameters,
 )
 
 
@@ -1293,3 +1305,99 @@ def test_add_desirability_funcs() -> None:
     assert np.all(outs <= 0) and np.all(outs >= -1), "Desirability values should be in [-1, 0]"
 
 
+def _linear_test_problem() -> Problem:
+    """A small linear problem with one maximized objective for testing the parametric scalarizations."""
+    variables = [
+        Variable(name=f"x_{i}", symbol=f"x_{i}", variable_type="real", lowerbound=0, upperbound=1, initial_value=0.5)
+        for i in range(1, 4)
+    ]
+    properties = {"is_linear": True, "is_convex": True, "is_twice_differentiable": True}
+    objectives = [
+        Objective(name="f_1", symbol="f_1", func="x_1 + 2", ideal=2, nadir=3, **properties),
+        Objective(name="f_2", symbol="f_2", func="x_1 + x_2", maximize=True, ideal=2, nadir=0, **properties),
+        Objective(name="f_3", symbol="f_3", func="x_3 + 2 * x_2", ideal=0, nadir=3, **properties),
+    ]
+    constraints = [
+        Constraint(
+            name="g_1", symbol="g_1", func="1.5 - x_1 - x_2 - x_3", cons_type=ConstraintTypeEnum.LTE, **properties
+        )
+    ]
+
+    return Problem(
+        name="Linear test problem",
+        description="A linear test problem.",
+        variables=variables,
+        objectives=objectives,
+        constraints=constraints,
+    )
+
+
+@pytest.mark.scalarization
+@pytest.mark.parametrize("solver", [GurobipySolver, PyomoGurobiSolver])
+@pytest.mark.parametrize("add_sf", [add_asf_diff, add_stom_sf_diff])
+def test_parametric_scalarization_update(solver, add_sf):
+    """Test that updating the reference point of a parametric scalarization matches adding it again."""
+    problem = _linear_test_problem()
+    reference_points = [
+        {"f_1": 2.2, "f_2": 1.5, "f_3": 1.0},
+        {"f_1": 2.8, "f_2": 1.9, "f_3": 0.2},
+        {"f_1": 2.0, "f_2": 0.5, "f_3": 2.5},
+    ]
+
+    problem_w_sf, target = add_sf(problem, "target", reference_points[0], parametric=True)
+    assert len(problem_w_sf.constants) == len(problem.objectives)
+
+    parametric_solver = solver(problem_w_sf)
+
+    for reference_point in reference_points:
+        parametric_solver.update_constants(scalarization_parameters(target, "rp", reference_point))
+        result = parametric_solver.solve(target)
+
+        expected = solver(add_sf(problem, "target", reference_point)[0]).solve(target)
+
+        assert result.success
+        for obj in problem.objectives:
+            npt.assert_allclose(result.optimal_objectives[obj.symbol], expected.optimal_objectives[obj.symbol])
+
+    # the weights and epsilons can be parametric as well
+    problem_w_sf, target = add_weighted_sums(problem, "ws", {"f_1": 0.2, "f_2": 0.3, "f_3": 0.5}, parametric=True)
+    parametric_solver = solver(problem_w_sf)
+    weights = {"f_1": 0.5, "f_2": 0.5, "f_3": 0.0}
+    parametric_solver.update_constants(scalarization_parameters(target, "w", weights))
+
+    result = parametric_solver.solve(target)
+    expected = solver(add_weighted_sums(problem, "ws", weights)[0]).solve(target)
+    npt.assert_allclose(list(result.optimal_objectives.values()), list(expected.optimal_objectives.values()))
+
+    constraint_symbols = {"f_2": "f_2_eps", "f_3": "f_3_eps"}
+    problem_w_sf, target, _ = add_epsilon_constraints(
+        problem, "eps", constraint_symbols, "f_1", {"f_2": -1.0, "f_3": 2.0}, parametric=True
+    )
+    parametric_solver = solver(problem_w_sf)
+    epsilons = {"f_2": -1.5, "f_3": 1.0}
+    parametric_solver.update_constants(scalarization_parameters(target, "eps", epsilons))
+
+    result = parametric_solver.solve(target)
+    expected = solver(add_epsilon_constraints(problem, "eps", constraint_symbols, "f_1", epsilons)[0]).solve(target)
+    npt.assert_allclose(list(result.optimal_objectives.values()), list(expected.optimal_objectives.values()))
+
+
+@pytest.mark.scalarization
+def test_parametric_scalarization_evaluate():
+    """Test that a parametric non-differentiable scalarization evaluates like the non-parametric one."""
+    problem = _linear_test_problem()
+    xs = pl.DataFrame({"x_1": [0.1, 0.5], "x_2": [0.3, 0.9], "x_3": [0.7, 0.2]})
+
+    for add_sf in [add_asf_nondiff, add_stom_sf_nondiff]:
+        problem_w_sf, target = add_sf(problem, "target", {"f_1": 2.2, "f_2": 1.5, "f_3": 1.0}, parametric=True)
+        evaluator = PolarsEvaluator(problem_w_sf)
+
+        reference_point = {"f_1": 2.8, "f_2": 1.9, "f_3": 0.2}
+        evaluator.update_constants(scalarization_parameters(target, "rp", reference_point))
+
+        expected = PolarsEvaluator(add_sf(problem, "target", reference_point)[0]).evaluate(xs)[target]
+        npt.assert_allclose(evaluator.evaluate(xs)[target].to_numpy(), expected.to_numpy())
+
+    # only existing constants can be updated
+    with pytest.raises(ValueError):
+        problem_w_sf.update_constants({"not_a_constant": 1.0})
@@ -1,19 +1,33 @@
 """Tests for simulator and surrogate evaluator."""
 
+import socket
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as npt
+
+import polars as pl
 import pytest
 from fixtures import surrogate_file, surrogate_file2  # noqa: F401
 
 from desdeo.problem import (
+    CachedEvaluator,
     Constraint,
     ConstraintTypeEnum,
     Evaluator,
     ExtraFunction,
+    HttpSimulatorOptions,
     Objective,
     ObjectiveTypeEnum,
     Problem,
+    Simulator,
     Variable,
     VariableTypeEnum,
 )
+from desdeo.problem.simulator_evaluator import EvaluatorError
+from desdeo.problem.simulator_worker import SimulatorWorker, SimulatorWorkerError, SimulatorWorkerPool
 from desdeo.problem.testproblems import simulator_problem
 
 
@@ -103,3 +117,250 @@ def test_w_o_given_surrogate_paths(surrogate_file, surrogate_file2):  # noqa: F8
     res = evaluator.evaluate(
         {"x_1": [0, 1, 2, 3, 4], "x_2": [4, 3, 2, 1, 0], "x_3": [0, 4, 1, 3, 2], "x_4": [3, 1, 3, 2, 3]}
     )
+
+
+def _simulator_only_problem(files: list[Path]) -> Problem:
+    """A problem whose objectives and constraints are given by the simulator files `files`."""
+    variables = [Variable(name=f"x_{i}", symbol=f"x_{i}", variable_type=VariableTypeEnum.real) for i in (1, 2)]
+    return Problem(
+        name="Simulator only problem",
+        description="",
+        variables=variables,
+        objectives=[
+            Objective(name="f_1", symbol="f_1", simulator_path=files[0], objective_type=ObjectiveTypeEnum.simulator),
+            Objective(
+                name="f_3",
+                symbol="f_3",
+                simulator_path=files[-1],
+                objective_type=ObjectiveTypeEnum.simulator,
+                maximize=True,
+            ),
+        ],
+        constraints=[
+            Constraint(name="g_1", symbol="g_1", cons_type=ConstraintTypeEnum.LTE, simulator_path=files[-1]),
+        ],
+        simulators=[
+            Simulator(name=f"s_{i}", symbol=f"s_{i}", file=file, parameter_options={"delta": 0.5})
+            for i, file in enumerate(files, start=1)
+        ],
+    )
+
+
+@pytest.mark.simulator_support
+def test_surrogate_chunks(surrogate_file, surrogate_file2):  # noqa: F811
+    """Test that predicting the surrogates in chunks gives the same results as predicting them at once."""
+    variables = [Variable(name=f"x_{i}", symbol=f"x_{i}", variable_type=VariableTypeEnum.real) for i in range(1, 5)]
+    problem = Problem(
+        name="Surrogate problem",
+        description="",
+        variables=variables,
+        objectives=[
+            Objective(
+                name="f_1", symbol="f_1", surrogates=[surrogate_file], objective_type=ObjectiveTypeEnum.surrogate
+            ),
+            Objective(
+                name="f_2",
+                symbol="f_2",
+                surrogates=[surrogate_file2],
+                objective_type=ObjectiveTypeEnum.surrogate,
+                maximize=True,
+            ),
+        ],
+    )
+    rng = np.random.default_rng(0)
+    xs = pl.DataFrame({var.symbol: rng.random(1001) for var in variables})
+
+    res = Evaluator(problem, surrogate_memory_budget=None).evaluate(xs)
+    # about 20 rows per chunk for the Gaussian process trained with 500 samples
+    res_chunked = Evaluator(problem, surrogate_memory_budget=80_000).evaluate(xs)
+
+    assert res.columns == ["f_1", "f_1_uncert", "f_2", "f_2_uncert", "f_1_min", "f_2_min"]
+    assert res.height == xs.height
+    assert res["f_2_uncert"].is_nan().all()
+    npt.assert_allclose(res_chunked.to_numpy(), res.to_numpy())
+
+
+@pytest.mark.simulator_support
+def test_simulator_workers(tmp_path):
+    """Test that the simulator files are evaluated in persistent workers, which are restarted if they crash."""
+    problem = _simulator_only_problem([Path("tests/data/simulator_file.py"), Path("tests/data/simulator_file2.py")])
+    evaluator = Evaluator(problem=problem, params={"s_1": {"alpha": 0.1}, "s_2": {"epsilon": 10, "gamma": 20}})
+    xs = {"x_1": [0.0, 1.0, 2.0, 3.0, 4.0], "x_2": [4.0, 3.0, 2.0, 1.0, 0.0]}
+
+    res = evaluator.evaluate(xs)
+    assert res["f_1"].to_list() == pytest.approx([0.4, 2.3, 4.2, 6.1, 8.0])
+    assert res["e_1"].to_list() == pytest.approx([2.0, 1.5, 1.0, 0.5, 0.0])
+    assert res["f_3"].to_list() == pytest.approx([-4.5, -1.5, 1.5, 4.5, 7.5])
+    assert res["f_3_min"].to_list() == pytest.approx([4.5, 1.5, -1.5, -4.5, -7.5])
+    assert res["g_1"].to_list() == pytest.approx([8.2, 5.2, 2.2, -0.8, -3.8])
+
+    # the workers are reused between evaluations
+    pids = {name: workers._workers[0]._process.pid for name, workers in evaluator._simulator_workers.items()}
+    assert evaluator.evaluate(pl.DataFrame(xs)).equals(res)
+    assert {name: workers._workers[0]._process.pid for name, workers in evaluator._simulator_workers.items()} == pids
+    assert all(len(workers._workers) == 1 for workers in evaluator._simulator_workers.values())
+
+    # a crashed worker is restarted
+    evaluator._simulator_workers["s_1"]._workers[0]._process.kill()
+    assert evaluator.evaluate(xs).equals(res)
+    assert evaluator._simulator_workers["s_1"]._workers[0]._process.pid != pids["s_1"]
+
+    # the errors of the simulators are raised
+    with pytest.raises(EvaluatorError, match="KeyError"):
+        evaluator.evaluate({"x_3": [0.0]})
+
+    evaluator.close()
+    assert all(
+        worker._process is None for workers in evaluator._simulator_workers.values() for worker in workers._workers
+    )
+
+    # simulator files without a simulator function are run in a new process for each call
+    script = tmp_path / "simulator_script.py"
+    runs = tmp_path / "runs.txt"
+    script.write_text(
+        "import ast, json, sys\n"
+        f"open({str(runs)!r}, 'a').write('run\\n')\n"
+        "xs = ast.literal_eval(sys.argv[2])\n"
+        "sys.stdout.write(json.dumps({'f_1': xs['x_1'], 'f_3': xs['x_2'], 'g_1': xs['x_1']}))\n"
+    )
+    evaluator = Evaluator(problem=_simulator_only_problem([script]))
+    res = evaluator.evaluate(xs)
+    assert res["f_3_min"].to_list() == pytest.approx([-4.0, -3.0, -2.0, -1.0, 0.0])
+    assert evaluator._simulator_workers["s_1"].supported is False
+    # the script is not run by the worker before it is run in its own process
+    assert runs.read_text().splitlines() == ["run"]
+
+    # a simulator file exiting when it is imported is reported as not supported
+    exiting = tmp_path / "simulator_exiting.py"
+    exiting.write_text("import sys\n\ndef simulator(xs, params):\n    return xs\n\nsys.exit(2)\n")
+    worker = SimulatorWorker(exiting)
+    with pytest.raises(SimulatorWorkerError, match="SystemExit"):
+        worker.evaluate(pl.DataFrame(xs), {})
+    assert worker.supported is False
+
+
+@pytest.mark.simulator_support
+def test_simulator_worker_pool(tmp_path):
+    """Test that overlapping evaluations of a simulator file are run at the same time in different workers."""
+    # each evaluation checks in and waits until two worker processes have checked in, which they can only do at once
+    waiting = tmp_path / "simulator_waiting.py"
+    waiting.write_text(
+        "import os, time\n"
+        "from pathlib import Path\n\n"
+        "def simulator(xs, params):\n"
+        "    checked_in = Path(params['dir'])\n"
+        "    (checked_in / str(os.getpid())).touch()\n"
+        "    deadline = time.time() + 60\n"
+        "    while len(list(checked_in.iterdir())) < 2 and time.time() < deadline:\n"
+        "        time.sleep(0.01)\n"
+        "    n = [float(len(list(checked_in.iterdir())))] * len(xs['x_1'])\n"
+        "    return {'f_1': n, 'f_3': n, 'g_1': xs['x_1']}\n"
+    )
+    checked_in = tmp_path / "checked_in"
+    checked_in.mkdir()
+    evaluator = Evaluator(
+        problem=_simulator_only_problem([waiting]), params={"s_1": {"dir": str(checked_in)}}, simulator_workers=2
+    )
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(evaluator.evaluate({"x_1": [1.0], "x_2": [1.0]})))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [res["f_1"][0] for res in results] == [2.0, 2.0]
+    assert len(evaluator._simulator_workers["s_1"]._workers) == 2
+    evaluator.close()
+
+    with pytest.raises(ValueError):
+        SimulatorWorkerPool(waiting, max_workers=0)
+
+
+@pytest.mark.simulator_support
+def test_cached_simulator_evaluator():
+    """Test that only the decision variables whose results are not cached are sent to the simulators."""
+    problem = _simulator_only_problem([Path("tests/data/simulator_file.py"), Path("tests/data/simulator_file2.py")])
+    evaluator = Evaluator(problem)
+    cached = CachedEvaluator(evaluator)
+
+    res = cached.evaluate({"x_1": [0.0, 1.0, 2.0], "x_2": [4.0, 3.0, 2.0]})
+    assert (cached.hits, cached.misses) == (0, 3)
+
+    res_2 = cached.evaluate({"x_1": [2.0, 5.0, 0.0], "x_2": [2.0, 5.0, 4.0]})
+    assert (cached.hits, cached.misses) == (2, 4)
+    assert res_2[[0, 2]].equals(res[[2, 0]])
+    assert res_2[1].equals(evaluator.evaluate({"x_1": [5.0], "x_2": [5.0]}))
+    evaluator.close()
+
+
+@pytest.fixture
+def benchmarks_server():
+    """Serve the pymoo benchmark problems at a free local port for the duration of a test."""
+    uvicorn = pytest.importorskip("uvicorn")
+    benchmarks_server = pytest.importorskip("desdeo.problem.testproblems.benchmarks_server")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(benchmarks_server.app, host="127.0.0.1", port=port, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    yield benchmarks_server, f"http://127.0.0.1:{port}"
+
+    server.should_exit = True
+    thread.join()
+
+
+@pytest.mark.simulator_support
+@pytest.mark.parametrize(
+    "http_options",
+    [
+        None,
+        HttpSimulatorOptions(chunk_size=7, max_connections=3),
+        HttpSimulatorOptions(arrow=True),
+        HttpSimulatorOptions(chunk_size=7, arrow=True),
+    ],
+)
+def test_http_simulator(benchmarks_server, http_options):
+    """Test evaluating a simulator served over HTTP with the different options of the client."""
+    server, server_url = benchmarks_server
+    parameters = server.PymooParameters(name="dtlz2", n_var=5, n_obj=3)
+    problem = server.server_problem(parameters, server_url=server_url)
+
+    rng = np.random.default_rng(0)
+    xs = {var.symbol: rng.random(30).tolist() for var in problem.variables}
+    expected = server.get_pymoo_problem(parameters).evaluate(np.array(list(xs.values())).T)
+
+    evaluator = Evaluator(problem, http_options=http_options)
+    for _ in range(2):
+        # the connections are reused on the second evaluation
+        res = evaluator.evaluate(xs)
+        assert res.select("f_1", "f_2", "f_3").to_numpy() == pytest.approx(expected)
+        assert res["f_1_min"].to_list() == res["f_1"].to_list()
+    evaluator.close()
+
+
+@pytest.mark.simulator_support
+def test_http_simulator_unreachable():
+    """Test that a simulator that cannot be reached raises an error after the retries."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    problem = Problem(
+        name="Unreachable simulator",
+        description="",
+        variables=[Variable(name="x_1", symbol="x_1", variable_type=VariableTypeEnum.real)],
+        objectives=[Objective(name="f_1", symbol="f_1", objective_type=ObjectiveTypeEnum.simulator)],
+        simulators=[Simulator(name="s_1", symbol="s_1", url={"url": f"http://127.0.0.1:{port}/evaluate"})],
+    )
+
+    evaluator = Evaluator(problem, http_options=HttpSimulatorOptions(retries=2, backoff_factor=0.0, timeout=1.0))
+    with pytest.raises(EvaluatorError, match="Failed to call the simulator"):
+        evaluator.evaluate({"x_1": [0.0, 1.0]})
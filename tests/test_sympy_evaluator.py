@@ -1,11 +1,13 @@
 """Tests related to the sympy evaluator."""
 
+import numpy as np
 import numpy.testing as npt
 import pytest
 
 from desdeo.problem import (
     FormatEnum,
     MathParser,
+    SympyCompilationEnum,
     SympyEvaluator,
 )
 from desdeo.problem.testproblems import binh_and_korn, river_pollution_problem, zdt1
@@ -143,3 +145,34 @@ def test_evaluate():
 
     npt.assert_almost_equal(res["g_1"], -8.51)
     npt.assert_almost_equal(res["g_2"], -60.99)
+
+
+@pytest.mark.sympy
+@pytest.mark.parametrize("compilation", list(SympyCompilationEnum))
+def test_evaluate_batch(compilation):
+    """Tests that evaluating a batch of solutions gives the same results as evaluating them one at a time."""
+    if compilation == SympyCompilationEnum.numba:
+        pytest.importorskip("numba")
+
+    problem = binh_and_korn(maximize=(True, False))
+    evaluator = SympyEvaluator(problem, compilation=compilation)
+
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(
+        [var.lowerbound for var in problem.variables], [var.upperbound for var in problem.variables], size=(20, 2)
+    )
+
+    res = evaluator.evaluate_batch(xs)
+    res_dict = evaluator.evaluate_batch({"x_1": xs[:, 0].tolist(), "x_2": xs[:, 1].tolist()})
+
+    for i, row in enumerate(xs):
+        single = evaluator.evaluate({"x_1": row[0], "x_2": row[1]})
+        for symbol, values in res.items():
+            assert values.shape == (len(xs),)
+            npt.assert_almost_equal(values[i], single[symbol])
+            npt.assert_almost_equal(res_dict[symbol][i], single[symbol])
+
+    # only some of the functions
+    res_targets = evaluator.evaluate_batch(xs, targets=["f_1_min", "g_2"])
+    assert set(res_targets) == {"f_1_min", "g_2"}
+    npt.assert_almost_equal(res_targets["g_2"], res["g_2"])
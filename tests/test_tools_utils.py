@@ -2,10 +2,22 @@
 
 import shutil
 
+import polars as pl
 import pytest
 from fixtures import dtlz2_5x_3f_data_based  # noqa: F401
 
-from desdeo.problem.testproblems import re21, river_pollution_problem
+from desdeo.problem import ScalarizationFunction
+from desdeo.problem.testproblems import re21, river_pollution_problem, simple_knapsack
+from desdeo.tools import (
+    GurobipySolver,
+    PyomoCBCSolver,
+    SubproblemExecutor,
+    add_asf_diff,
+    add_asf_nondiff,
+    asf_batch,
+    solve_asf_batch,
+)
+from desdeo.tools.pyomo_solver_interfaces import CbcOptions
 from desdeo.tools.utils import (
     available_solvers,
     find_compatible_solvers,
@@ -50,3 +62,108 @@ def test_find_compatible_solvers():
         )
     else:
         assert len(solvers) == 3
+
+
+@pytest.mark.utils
+def test_subproblem_executor():
+    """Test that the subproblems are solved in the same order in parallel as serially."""
+    problem = simple_knapsack()
+    subproblems = [(problem, f"{objective.symbol}_min") for objective in problem.objectives]
+    max_sum = ScalarizationFunction(
+        name="Max sum",
+        symbol="max_sum",
+        func=" + ".join(f"{objective.symbol}_min" for objective in problem.objectives),
+        is_linear=True,
+    )
+    subproblems.append((problem.add_scalarization(max_sum), "max_sum"))
+
+    serial_results = SubproblemExecutor(n_workers=1).solve(subproblems, GurobipySolver)
+
+    executor = SubproblemExecutor(n_workers=2, solver_threads=1)
+    try:
+        parallel_results = executor.solve(subproblems, GurobipySolver)
+    finally:
+        executor.close()
+
+    assert len(parallel_results) == len(subproblems)
+    for serial, parallel in zip(serial_results, parallel_results, strict=True):
+        assert parallel.success
+        assert parallel.optimal_objectives == serial.optimal_objectives
+
+    # the thread limits of the solvers are respected
+    assert executor.limit_threads(GurobipySolver, None) == {"Threads": 1}
+    assert executor.limit_threads(PyomoCBCSolver, CbcOptions(threads=4)).threads == 1
+
+
+@pytest.mark.utils
+def test_solve_asf_batch():
+    """Test that projecting a batch of reference points matches projecting them one by one."""
+    problem = simple_knapsack()
+    reference_points = [
+        {"f_1": 5.0, "f_2": 8.0, "f_3": 3.0},
+        {"f_1": 8.0, "f_2": 3.0, "f_3": 5.0},
+        {"f_1": 3.0, "f_2": 5.0, "f_3": 8.0},
+        {"f_1": 6.0, "f_2": 6.0, "f_3": 6.0},
+    ]
+
+    add_asf = add_asf_diff if problem.is_twice_differentiable else add_asf_nondiff
+    expected = [
+        GurobipySolver(add_asf(problem, "target", rp)[0]).solve("target").optimal_objectives for rp in reference_points
+    ]
+
+    results = solve_asf_batch(problem, reference_points, GurobipySolver, executor=SubproblemExecutor(n_workers=1))
+
+    assert results.columns == [
+        *(var.symbol for var in problem.variables),
+        *(obj.symbol for obj in problem.objectives),
+        *(con.symbol for con in problem.constraints),
+        "success",
+    ]
+    assert results["success"].all()
+    for row, objectives in zip(results.iter_rows(named=True), expected, strict=True):
+        for symbol, value in objectives.items():
+            assert row[symbol] == pytest.approx(value)
+
+    # the reference points can be given as a dataframe and projected in parallel
+    executor = SubproblemExecutor(n_workers=2, solver_threads=1)
+    try:
+        parallel_results = solve_asf_batch(problem, pl.DataFrame(reference_points), GurobipySolver, executor=executor)
+    finally:
+        executor.close()
+
+    assert parallel_results.equals(results)
+
+
+@pytest.mark.utils
+def test_solve_asf_batch_failed_warm_start(monkeypatch):
+    """Test that the solves are not warm-started from the solution of a failed solve."""
+
+    class FailingFirstSolver(GurobipySolver):
+        """Reports the first solve as failed, with the variables of the solve marked as invalid."""
+
+        n_solves = 0
+
+        def solve(self, target: str):
+            result = super().solve(target)
+            FailingFirstSolver.n_solves += 1
+            if FailingFirstSolver.n_solves == 1:
+                return result.model_copy(
+                    update={"success": False, "optimal_variables": dict.fromkeys(result.optimal_variables, -1)}
+                )
+            return result
+
+    warm_starts = []
+    monkeypatch.setattr(asf_batch, "_warm_start", lambda _, variables: warm_starts.append(variables))
+
+    problem = simple_knapsack()
+    reference_points = [
+        {"f_1": 5.0, "f_2": 8.0, "f_3": 3.0},
+        {"f_1": 5.0, "f_2": 8.0, "f_3": 3.5},
+        {"f_1": 6.0, "f_2": 6.0, "f_3": 6.0},
+    ]
+    results = solve_asf_batch(problem, reference_points, FailingFirstSolver, executor=SubproblemExecutor(n_workers=1))
+
+    assert results["success"].to_list() == [False, True, True]
+    # the second solve is not warm-started, and the third is warm-started from the second
+    assert len(warm_starts) == 1
+    assert all(value != -1 for value in warm_starts[0].values())